@@ -0,0 +1,101 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Measures time to import package in each docstrings mode.
+
+    Each trial imports the package in a fresh interpreter, after its
+    dependencies have been imported, so that only the package itself is
+    measured. A preliminary import caches bytecode, as for installed
+    packages. Reports the best time from several trials for each mode.
+
+    With a baseline revision, the sources of that revision are extracted
+    from Git and measured alongside the working tree. Revisions which
+    predate the docstrings modes are measured in their only mode.
+'''
+
+# mypy: ignore-errors
+
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+from pathlib import Path
+
+
+_SOURCES = Path( __file__ ).parents[ 2 ] / 'sources'
+_TRIAL = '''
+import time
+import absence, classcore, dynadoc
+start = time.perf_counter( )
+import frigid
+print( time.perf_counter( ) - start )
+'''
+
+
+def extract_sources( revision, location ):
+    ''' Extracts sources of Git revision and returns their location. '''
+    command = (
+        'git', '-C', str( _SOURCES.parent ), f"--work-tree={location}",
+        'restore', f"--source={revision}", '--worktree', '--', 'sources' )
+    subprocess.run( command, check = True ) # noqa: S603
+    return location / 'sources'
+
+
+def measure( sources, mode ):
+    ''' Returns seconds to import package in one trial. '''
+    environment = dict(
+        os.environ, FRIGID_DOCSTRINGS = mode, PYTHONPATH = str( sources ) )
+    environment.pop( 'PYTHONDONTWRITEBYTECODE', None )
+    result = subprocess.run( # noqa: S603
+        ( sys.executable, '-c', _TRIAL ),
+        capture_output = True, check = True, env = environment, text = True )
+    return float( result.stdout )
+
+
+def main( ):
+    parser = argparse.ArgumentParser(
+        description = __doc__.split( '\n' )[ 0 ] )
+    parser.add_argument( '--trials', type = int, default = 9 )
+    parser.add_argument(
+        '--baseline', metavar = 'REVISION',
+        help = 'Git revision to measure for comparison.' )
+    arguments = parser.parse_args( )
+    with tempfile.TemporaryDirectory( ) as location:
+        trees = { 'current': _SOURCES }
+        if arguments.baseline:
+            trees[ arguments.baseline ] = extract_sources(
+                arguments.baseline, Path( location ) )
+        for sources in trees.values( ):
+            measure( sources, 'skip' ) # Caches bytecode.
+        print( f"{'':8}" + ''.join( f"{name:>14}" for name in trees ) )
+        for mode in ( 'eager', 'lazy', 'skip' ):
+            durations = (
+                min( measure( sources, mode )
+                     for _ in range( arguments.trials ) )
+                for sources in trees.values( ) )
+            print( f"{mode:8}" + ''.join(
+                f"{duration * 1000:11.1f} ms" for duration in durations ) )
+
+
+if __name__ == '__main__': main( )
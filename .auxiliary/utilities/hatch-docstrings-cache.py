@@ -0,0 +1,70 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Hatch build hook which precomputes docstrings into wheels.
+
+    Imports the package from sources in a subprocess, with eager docstrings,
+    and generates a module of the resulting docstrings. The package uses the
+    module, when it is current, instead of Dynadoc introspection at import.
+'''
+
+# mypy: ignore-errors
+
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+_PACKAGE_NAME = 'frigid'
+_SCRIPT = f'''
+import {_PACKAGE_NAME}.__ as base
+print( base.produce_docstrings_cache_source( {_PACKAGE_NAME!r} ), end = '' )
+'''
+
+
+class DocstringsCacheBuildHook( BuildHookInterface ):
+    ''' Generates module of precomputed docstrings into wheel. '''
+
+    PLUGIN_NAME = 'custom'
+
+    def initialize( self, version, build_data ):
+        if 'editable' == version: return
+        environment = dict( os.environ )
+        environment[ 'PYTHONPATH' ] = str( Path( self.root ) / 'sources' )
+        environment[ 'FRIGID_DOCSTRINGS' ] = 'eager'
+        source = subprocess.run( # noqa: S603
+            ( sys.executable, '-c', _SCRIPT ),
+            capture_output = True, check = True,
+            env = environment, text = True ).stdout
+        self._directory = tempfile.TemporaryDirectory( )
+        location = Path( self._directory.name ) / 'docstrings_cache.py'
+        location.write_text( source, encoding = 'utf-8' )
+        build_data[ 'force_include' ][ str( location ) ] = (
+            f"{_PACKAGE_NAME}/__/docstrings_cache.py" )
+
+    def finalize( self, version, build_data, artifact_path ):
+        directory = getattr( self, '_directory', None )
+        if directory is not None: directory.cleanup( )
@@ -21,7 +21,18 @@
 ''' Common constants, imports, and utilities. '''
 
 
+from .behaviors import *
+from .checks import *
 from .dictionaries import *
+from .docstrings import *
 from .doctab import *
+from .evolutions import *
+from .exports import *
+from .fields import *
+from .hashes import *
 from .imports import *
+from .interns import *
 from .nomina import *
+from .properties import *
+from .slots import *
+from .visibilities import *
@@ -0,0 +1,664 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Instance behaviors: activation and specialized enforcement. '''
+
+
+from . import fields as _fields
+from . import imports as __
+from . import nomina as _nomina
+from . import slots as _slots
+from . import visibilities as _visibilities
+
+
+class_behaviors_name = _nomina.calculate_attrname( 'class', 'behaviors' )
+impersonation_name = _nomina.calculate_attrname( 'class', 'impersonated' )
+instance_behaviors_name = _nomina.calculate_attrname( 'instance', 'behaviors' )
+
+
+def activate_instance_behaviors(
+    instance: object, behaviors: __.cabc.Set[ str ]
+) -> None:
+    ''' Activates behaviors on instance, completing its construction. '''
+    __.ccutils.setattr0( instance, instance_behaviors_name, behaviors )
+
+
+def describe_instance( instance: object ) -> str:
+    ''' Describes instance for errors.
+
+        Generated classes may impersonate the classes from which they are
+        derived, so that their names do not appear in errors.
+    '''
+    cls = type( instance )
+    cls = getattr( cls, impersonation_name, None ) or cls
+    return f"instance of {__.ccutils.describe_object( cls )}"
+
+
+def calculate_instance_behaviors( cls: type ) -> frozenset[ str ]:
+    ''' Calculates behaviors which initialization activates on instances.
+
+        Standard behaviors are recorded on classes as exclusions. A behavior
+        is active on instances unless everything is excluded from it.
+    '''
+    behaviors: set[ str ] = set( )
+    mutables_name = _nomina.calculate_attrname( 'instances', 'mutables_names' )
+    if getattr( cls, mutables_name, frozenset( ) ) != '*':
+        behaviors.add( _nomina.immutability_label )
+    visibles_name = _nomina.calculate_attrname( 'instances', 'visibles_names' )
+    if getattr( cls, visibles_name, frozenset( ) ) != '*':
+        behaviors.add( _nomina.concealment_label )
+    return frozenset( behaviors )
+
+
+def accelerate_classes_behaviors(
+    clscls: type[ _nomina.T ]
+) -> type[ _nomina.T ]:
+    ''' Replaces standard attribute hooks of metaclass with specialized ones.
+
+        Classes receive many attributes during their construction, before
+        their behaviors are activated. The standard hooks locate behaviors of
+        a class via a freshly mangled name upon every call. The specialized
+        hooks use memoized names and pass assignments and deletions on
+        classes without active immutability directly to their successors.
+        All others are still judged by the standard hooks. Surveys of
+        attributes on classes with visibility caches are memoized.
+    '''
+    for hook_name, producer in (
+        ( '__setattr__', _produce_class_assigner ),
+        ( '__delattr__', _produce_class_deleter ),
+        ( '__dir__', _visibilities.produce_class_surveyor ),
+    ):
+        hook = clscls.__dict__.get( hook_name )
+        if not _is_standard_class_hook( hook_name, hook ): continue
+        setattr( clscls, hook_name, producer( clscls, hook ) )
+    return clscls
+
+
+def accelerate_instances_behaviors(
+    clscls: type[ _nomina.T ], /,
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> type[ _nomina.T ]:
+    ''' Wraps metaclass initializer to specialize attribute hooks.
+
+        Standard behaviors inject generic ``__setattr__``, ``__delattr__``,
+        and ``__dir__`` methods, which consult the behaviors configuration of
+        a class upon every call. After each class is initialized, these are
+        replaced with methods specialized to the configuration, which is
+        final by then, and a cache of visible attribute names is allocated.
+
+        For metaclasses which produce dataclasses, generated initializers,
+        which do not originate from class bodies, are also specialized.
+        Other standard initializer wrappers are replaced with ones which
+        activate behaviors from a set shared by all instances of the class.
+    '''
+    initializer = clscls.__init__
+    progress_name = _nomina.calculate_attrname( 'class', 'in_progress' )
+    dcls_spec = getattr( clscls, '__dataclass_transform__', None ) or { }
+    dataclass = dcls_spec.get( 'kw_only_default', False )
+
+    @__.funct.wraps( initializer )
+    def initialize(
+        cls: type, *posargs: __.typx.Any, **nomargs: __.typx.Any
+    ) -> None:
+        initializer( cls, *posargs, **nomargs )
+        # Nested initializations occur during class replacement.
+        if hasattr( cls, _nomina.mangle_attrname( cls, progress_name ) ):
+            return
+        specialize_instances_behaviors( cls, error_class_provider )
+        _visibilities.allocate_class_visibles_cache( cls )
+        if dataclass:
+            namespace = (
+                posargs[ 2 ] if len( posargs ) > 2 else { } ) # noqa: PLR2004
+            if '__init__' not in namespace:
+                specialize_dataclass_initializer(
+                    cls, error_class_provider )
+        specialize_instances_initializer( cls )
+
+    clscls.__init__ = initialize
+    return clscls
+
+
+def specialize_instances_behaviors(
+    cls: type,
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> None:
+    ''' Replaces standard attribute hooks with specialized ones.
+
+        Only hooks which were injected with standard cores, rather than
+        custom cores or around methods defined on the class, are replaced.
+    '''
+    verifier = _produce_mutability_verifier( cls )
+    behaviors_name = _calculate_behaviors_attribute_name( cls )
+    # Class is immutable after initialization; bypass enforcement.
+    if _is_standard_hook( cls, '__setattr__' ):
+        type.__setattr__(
+            cls, '__setattr__',
+            _produce_assigner(
+                cls, behaviors_name, verifier, error_class_provider ) )
+    if _is_standard_hook( cls, '__delattr__' ):
+        type.__setattr__(
+            cls, '__delattr__',
+            _produce_deleter(
+                cls, behaviors_name, verifier, error_class_provider ) )
+    if _is_standard_hook( cls, '__dir__' ):
+        type.__setattr__(
+            cls, '__dir__',
+            _visibilities.produce_instances_surveyor( cls, behaviors_name ) )
+
+
+def is_dataclass_initializer_specialized( cls: type ) -> bool:
+    ''' Was generated dataclass initializer of class specialized to it? '''
+    hook = cls.__dict__.get( '__init__' )
+    namespace = getattr( hook, '__globals__', None ) or { }
+    return namespace.get( '__frigid_class__' ) is cls
+
+
+def produce_dataclass_initialization(
+    cls: type,
+    original: __.cabc.Callable[ ..., None ],
+    self_name: str,
+    namespace: dict[ str, __.typx.Any ],
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> __.typx.Optional[ tuple[
+    tuple[ __.inspect.Parameter, ... ], list[ str ], list[ str ]
+] ]:
+    ''' Produces parameters, arguments, and body of dataclass initialization.
+
+        Mirrors the parameters, defaults, default factories, initialization
+        pseudo-fields, and post-initialization hook of the generated
+        dataclass initializer. The body converts and validates arguments per
+        field processors, assigns fields via slot descriptors, and runs the
+        post-initialization hook; it does not activate behaviors. Records
+        defaults, default factories, processors, and assigners into
+        namespace. Returns nothing if any field is not slotted or if any
+        parameter is variadic.
+    '''
+    namespace[ '__frigid_provide_error__' ] = error_class_provider
+    parameters = _survey_initializer_parameters( original )
+    if parameters is None: return None
+    arguments = _produce_initializer_arguments( parameters, namespace )
+    lines = _produce_initializer_assignments( cls, self_name, namespace )
+    if arguments is None or lines is None: return None
+    if hasattr( cls, '__post_init__' ):
+        # Initialization pseudo-fields are parameters but not fields.
+        names = frozenset( parameter.name for parameter in parameters ) - {
+            field.name for field in __.dcls.fields( cls ) }
+        initvars = ', '.join(
+            name for name in cls.__dataclass_fields__ if name in names )
+        lines.append( f"{self_name}.__post_init__( {initvars} )" )
+    return parameters, arguments, lines
+
+
+def specialize_dataclass_initializer(
+    cls: type,
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> None:
+    ''' Replaces generated dataclass initializer with specialized one.
+
+        The specialized initializer has the same signature. It assigns fields
+        directly via their slot descriptors, since instance behaviors are not
+        active until initialization completes, and then activates behaviors.
+        Has no effect if the class is not a slotted dataclass or if its
+        initializer was not wrapped by the standard behaviors.
+    '''
+    hook = cls.__dict__.get( '__init__' )
+    closure = _recognize_initializer_hook(
+        hook, ( 'initialize_with_original', ) )
+    if closure is None or closure[ 'ignore_init_arguments' ]: return
+    original = hook.__wrapped__ # pyright: ignore
+    behaviors = frozenset( closure[ 'behaviors' ] )
+    initializer = _produce_dataclass_initializer(
+        cls, original, behaviors, error_class_provider )
+    if initializer is None: return
+    # Class is immutable after initialization; bypass enforcement.
+    type.__setattr__( cls, '__init__', initializer )
+
+
+def specialize_instances_initializer( cls: type ) -> None:
+    ''' Replaces standard initializer wrapper with specialized one.
+
+        The standard wrapper assembles a fresh set of behaviors for each
+        instance and locates the attribute which stores it upon every call.
+        The specialized wrapper activates a frozen set of behaviors, shared
+        by all instances of the class, under a name resolved in advance.
+        Has no effect if the initializer was not wrapped by the standard
+        behaviors or if the wrapper is not recognized.
+    '''
+    hook = cls.__dict__.get( '__init__' )
+    closure = _recognize_initializer_hook( hook, _initializers_standard )
+    if closure is None: return
+    initializer = _produce_instances_initializer(
+        cls, getattr( hook, '__wrapped__', None ),
+        frozenset( closure[ 'behaviors' ] ),
+        _calculate_behaviors_attribute_name( cls ),
+        closure[ 'ignore_init_arguments' ] )
+    # Class is immutable after initialization; bypass enforcement.
+    type.__setattr__( cls, '__init__', initializer )
+
+
+_MutabilityVerifier: __.typx.TypeAlias = (
+    __.typx.Optional[ __.cabc.Callable[ [ str ], bool ] ] )
+
+_behaviors_empty: frozenset[ str ] = frozenset( )
+# Recognition of standard hooks relies upon internals of Classcore, such as
+# names of injected functions and variables captured by them. These have
+# been verified against the following releases only; hooks from other
+# releases are left in place, unspecialized.
+_classcore_releases_verified = frozenset( ( '1.12', ) )
+_classcore_verified = '.'.join(
+    __.classcore.__version__.split( '.' )[ : 2 ]
+) in _classcore_releases_verified
+_initializers_standard = frozenset( (
+    'initialize_with_original', 'initialize_with_super' ) )
+_variadic_flags = __.inspect.CO_VARARGS | __.inspect.CO_VARKEYWORDS
+_parameters_kinds = frozenset( (
+    __.inspect.Parameter.KEYWORD_ONLY,
+    __.inspect.Parameter.POSITIONAL_OR_KEYWORD,
+) )
+# Hook name -> injected function name, core name, standard core name.
+_hooks_standard = __.types.MappingProxyType( {
+    '__delattr__': (
+        'delete_with_super', 'deleter_core', 'delete_attribute_if_mutable' ),
+    '__dir__': (
+        'survey_with_super', 'surveyor_core', 'survey_visible_attributes' ),
+    '__setattr__': (
+        'assign_with_super', 'assigner_core', 'assign_attribute_if_mutable' ),
+} )
+
+
+def _calculate_behaviors_attribute_name( cls: type ) -> str:
+    ''' Calculates name under which instances of class store behaviors.
+
+        Equivalent to lookup by 'getattr0', but without per-call cost.
+    '''
+    for base in cls.__mro__:
+        if instance_behaviors_name in getattr( base, '__slots__', ( ) ):
+            return instance_behaviors_name
+    return _nomina.mangle_attrname( cls, instance_behaviors_name )
+
+
+def _discover_hook_successor(
+    cls: type, hook_name: str
+) -> __.cabc.Callable[ ..., None ]:
+    ''' Discovers next hook in MRO of class. '''
+    for base in cls.__mro__[ 1: ]: # pragma: no branch
+        if hook_name in base.__dict__: return base.__dict__[ hook_name ]
+    return getattr( object, hook_name ) # pragma: no cover
+
+
+def _is_standard_hook( cls: type, hook_name: str ) -> bool:
+    ''' Is hook injected by standard behaviors with standard core? '''
+    if not _classcore_verified: return False
+    function_name, core_name, core_default_name = _hooks_standard[ hook_name ]
+    hook = cls.__dict__.get( hook_name )
+    code = getattr( hook, '__code__', None )
+    if code is None or code.co_name != function_name: return False
+    if getattr( hook, '__module__', None ) != __.ccstd.decorators.__name__:
+        return False # pragma: no cover
+    core = getattr(
+        cls, _nomina.calculate_attrname( 'instances', core_name ), None )
+    return core is getattr( __.ccstd.behaviors, core_default_name )
+
+
+def _is_standard_class_hook(
+    hook_name: str, hook: __.typx.Any
+) -> bool:
+    ''' Is metaclass hook injected by standard behaviors with standard core?
+    '''
+    if not _classcore_verified: return False
+    function_name, _, core_default_name = _hooks_standard[ hook_name ]
+    code = getattr( hook, '__code__', None )
+    if code is None or code.co_name != function_name: return False
+    if code.co_filename != __.ccstd.decorators.__file__:
+        return False # pragma: no cover
+    core = __.inspect.getclosurevars( hook ).nonlocals.get( 'core' )
+    return core is getattr( __.ccstd.behaviors, core_default_name )
+
+
+def _produce_assigner(
+    cls: type,
+    behaviors_name: str,
+    verifier: _MutabilityVerifier,
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> __.cabc.Callable[ [ object, str, __.typx.Any ], None ]:
+    ''' Produces attribute assigner specialized to class. '''
+    successor = _discover_hook_successor( cls, '__setattr__' )
+    immutability_label = _nomina.immutability_label
+
+    def assign( self: object, name: str, value: __.typx.Any ) -> None:
+        # Only enforce behaviors at start of MRO.
+        if cls is not type( self ):
+            super( cls, self ).__setattr__( name, value )
+            return
+        if (    verifier is None
+            or immutability_label not in getattr(
+                self, behaviors_name, _behaviors_empty )
+            or verifier( name )
+        ):
+            successor( self, name, value )
+            return
+        target = describe_instance( self )
+        raise error_class_provider( 'AttributeImmutability' )( name, target )
+
+    return assign
+
+
+def _produce_class_assigner(
+    clscls: type, hook: __.cabc.Callable[ [ type, str, __.typx.Any ], None ]
+) -> __.cabc.Callable[ [ type, str, __.typx.Any ], None ]:
+    ''' Produces class attribute assigner specialized to metaclass. '''
+    successor = _discover_hook_successor( clscls, '__setattr__' )
+    immutability_label = _nomina.immutability_label
+
+    def assign( cls: type, name: str, value: __.typx.Any ) -> None:
+        if (    clscls is type( cls )
+            and immutability_label not in getattr(
+                cls, _nomina.mangle_attrname( cls, class_behaviors_name ),
+                _behaviors_empty )
+        ):
+            successor( cls, name, value )
+            return
+        hook( cls, name, value )
+
+    return assign
+
+
+def _produce_class_deleter(
+    clscls: type, hook: __.cabc.Callable[ [ type, str ], None ]
+) -> __.cabc.Callable[ [ type, str ], None ]:
+    ''' Produces class attribute deleter specialized to metaclass. '''
+    successor = _discover_hook_successor( clscls, '__delattr__' )
+    immutability_label = _nomina.immutability_label
+
+    def delete( cls: type, name: str ) -> None:
+        if (    clscls is type( cls )
+            and immutability_label not in getattr(
+                cls, _nomina.mangle_attrname( cls, class_behaviors_name ),
+                _behaviors_empty )
+        ):
+            successor( cls, name )
+            return
+        hook( cls, name )
+
+    return delete
+
+
+def _produce_dataclass_initializer(
+    cls: type,
+    original: __.cabc.Callable[ ..., None ],
+    behaviors: frozenset[ str ],
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> __.typx.Optional[ __.cabc.Callable[ ..., None ] ]:
+    ''' Generates initializer which assigns fields via slot descriptors.
+
+        Returns nothing if any field or the behaviors attribute is not
+        slotted.
+    '''
+    activator = _slots.discover_slot( cls, instance_behaviors_name )
+    if activator is None: return None
+    self_name = (
+        '__frigid_self__' if 'self' in cls.__dataclass_fields__ else 'self' )
+    namespace: dict[ str, __.typx.Any ] = {
+        '__frigid_activate__': activator.__set__,
+        '__frigid_behaviors__': behaviors,
+        '__frigid_class__': cls,
+        '__frigid_getattr__': getattr,
+        '__frigid_type__': type,
+    }
+    initialization = produce_dataclass_initialization(
+        cls, original, self_name, namespace, error_class_provider )
+    if initialization is None: return None
+    _, arguments, lines = initialization
+    lines.append(
+        f"if __frigid_type__( {self_name} ) is __frigid_class__:" )
+    # Only post-initialization hook can activate behaviors beforehand.
+    if hasattr( cls, '__post_init__' ):
+        lines.extend( (
+            "    __frigid_extant__ = __frigid_getattr__(",
+            f"        {self_name}, {instance_behaviors_name!r}, None )",
+            "    __frigid_activate__(",
+            f"        {self_name},",
+            "        __frigid_behaviors__ if __frigid_extant__ is None",
+            "        else __frigid_behaviors__ | __frigid_extant__ )",
+        ) )
+    else:
+        lines.append(
+            f"    __frigid_activate__( {self_name}, __frigid_behaviors__ )" )
+    body = '\n'.join( f"    {line}" for line in lines )
+    source = (
+        f"def __init__( {', '.join( ( self_name, *arguments ) )} ):\n"
+        f"{body}\n" )
+    exec( source, namespace ) # noqa: S102
+    return __.funct.update_wrapper( namespace[ '__init__' ], original )
+
+
+def _produce_instances_initializer(
+    cls: type,
+    original: __.typx.Optional[ __.cabc.Callable[ ..., None ] ],
+    behaviors: frozenset[ str ],
+    behaviors_name: str,
+    ignore_arguments: bool,
+) -> __.cabc.Callable[ ..., None ]:
+    ''' Produces initializer which activates shared behaviors.
+
+        Delegates to original initializer, if one is supplied, else to the
+        next initializer in the MRO. Behaviors are merged with any which
+        are already active and are assigned without enforcement.
+    '''
+    if original is None:
+
+        def initialize(
+            self: object, *posargs: __.typx.Any, **nomargs: __.typx.Any
+        ) -> None:
+            if ignore_arguments: super( cls, self ).__init__( )
+            else: super( cls, self ).__init__( *posargs, **nomargs )
+            # Only activate behaviors at start of MRO.
+            if type( self ) is not cls: return
+            extant = getattr( self, behaviors_name, None )
+            object.__setattr__(
+                self, behaviors_name,
+                behaviors if extant is None else behaviors | extant )
+
+        return initialize
+
+    @__.funct.wraps( original )
+    def initialize_( # pyright: ignore
+        self: object, *posargs: __.typx.Any, **nomargs: __.typx.Any
+    ) -> None:
+        if ignore_arguments: original( self )
+        else: original( self, *posargs, **nomargs )
+        # Only activate behaviors at start of MRO.
+        if type( self ) is not cls: return
+        extant = getattr( self, behaviors_name, None )
+        object.__setattr__(
+            self, behaviors_name,
+            behaviors if extant is None else behaviors | extant )
+
+    return initialize_
+
+
+def _produce_initializer_arguments(
+    parameters: __.cabc.Sequence[ __.inspect.Parameter ],
+    namespace: dict[ str, __.typx.Any ],
+) -> __.typx.Optional[ list[ str ] ]:
+    ''' Produces arguments list for generated initializer.
+
+        Records parameter defaults into namespace of initializer. Returns
+        nothing if any parameter is not positional-or-keyword or keyword-only.
+    '''
+    arguments: list[ str ] = [ ]
+    for parameter in parameters:
+        if parameter.kind not in _parameters_kinds: return None
+        if parameter.kind is parameter.KEYWORD_ONLY and '*' not in arguments:
+            arguments.append( '*' )
+        name = parameter.name
+        if parameter.default is parameter.empty:
+            arguments.append( name )
+            continue
+        namespace[ f"__frigid_default_{name}__" ] = parameter.default
+        arguments.append( f"{name} = __frigid_default_{name}__" )
+    return arguments
+
+
+def _survey_initializer_parameters(
+    initializer: __.cabc.Callable[ ..., None ]
+) -> __.typx.Optional[ tuple[ __.inspect.Parameter, ... ] ]:
+    ''' Surveys parameters of generated initializer, other than first one.
+
+        Reads code object and defaults directly, which is much cheaper than
+        computing a signature. Returns nothing for variadic parameters.
+    '''
+    code = getattr( initializer, '__code__', None )
+    if code is None or code.co_flags & _variadic_flags: return None
+    count = code.co_argcount
+    names = code.co_varnames[ : count + code.co_kwonlyargcount ]
+    defaults = getattr( initializer, '__defaults__', None ) or ( )
+    kwdefaults = getattr( initializer, '__kwdefaults__', None ) or { }
+    empty = __.inspect.Parameter.empty
+    parameters: list[ __.inspect.Parameter ] = [ ]
+    for index, name in enumerate( names[ 1: ], start = 1 ):
+        if index < count:
+            kind = __.inspect.Parameter.POSITIONAL_OR_KEYWORD
+            dindex = index - ( count - len( defaults ) )
+            default = defaults[ dindex ] if dindex >= 0 else empty
+        else:
+            kind = __.inspect.Parameter.KEYWORD_ONLY
+            default = kwdefaults.get( name, empty )
+        parameters.append(
+            __.inspect.Parameter( name, kind, default = default ) )
+    return tuple( parameters )
+
+
+def _produce_initializer_assignments(
+    cls: type, self_name: str, namespace: dict[ str, __.typx.Any ]
+) -> __.typx.Optional[ list[ str ] ]:
+    ''' Produces field assignments for generated initializer.
+
+        Records slot descriptors, defaults, default factories, and field
+        processors into namespace of initializer. Arguments are converted and
+        validated before assignment. Returns nothing if any field is not
+        slotted.
+    '''
+    processors = _fields.survey_fields_processors( cls )
+    lines: list[ str ] = [ ]
+    for field in __.dcls.fields( cls ):
+        name = field.name
+        descriptor = _slots.discover_slot( cls, name )
+        if descriptor is None: return None
+        factory = field.default_factory
+        if factory is not __.dcls.MISSING:
+            namespace[ f"__frigid_factory_{name}__" ] = factory
+            value = f"__frigid_factory_{name}__( )"
+            if field.init:
+                value = (
+                    f"{value} if {name} is __frigid_default_{name}__ "
+                    f"else {name}" )
+        elif field.init: value = name
+        elif field.default is not __.dcls.MISSING:
+            value = f"__frigid_default_{name}__"
+            namespace[ value ] = field.default
+        else: continue
+        if name in processors:
+            if value != name: lines.append( f"{name} = {value}" )
+            lines.extend( _fields.produce_field_processing(
+                cls, name, name, processors[ name ], namespace ) )
+            value = name
+        namespace[ f"__frigid_assign_{name}__" ] = descriptor.__set__
+        lines.append( f"__frigid_assign_{name}__( {self_name}, {value} )" )
+    return lines
+
+
+def _produce_deleter(
+    cls: type,
+    behaviors_name: str,
+    verifier: _MutabilityVerifier,
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> __.cabc.Callable[ [ object, str ], None ]:
+    ''' Produces attribute deleter specialized to class. '''
+    successor = _discover_hook_successor( cls, '__delattr__' )
+    immutability_label = _nomina.immutability_label
+
+    def delete( self: object, name: str ) -> None:
+        # Only enforce behaviors at start of MRO.
+        if cls is not type( self ):
+            super( cls, self ).__delattr__( name )
+            return
+        if (    verifier is None
+            or immutability_label not in getattr(
+                self, behaviors_name, _behaviors_empty )
+            or verifier( name )
+        ):
+            successor( self, name )
+            return
+        target = describe_instance( self )
+        raise error_class_provider( 'AttributeImmutability' )( name, target )
+
+    return delete
+
+
+def _produce_mutability_verifier( cls: type ) -> _MutabilityVerifier:
+    ''' Produces verifier of attribute mutability from class configuration.
+
+        Returns nothing if all attributes are mutable.
+    '''
+    names = getattr(
+        cls, _nomina.calculate_attrname( 'instances', 'mutables_names' ),
+        frozenset( ) )
+    if names == '*': return None
+    predicates: tuple[ __.cabc.Callable[ [ str ], bool ], ... ] = getattr(
+        cls, _nomina.calculate_attrname( 'instances', 'mutables_predicates' ),
+        ( ) )
+    regexes: tuple[ __.typx.Any, ... ] = getattr(
+        cls, _nomina.calculate_attrname( 'instances', 'mutables_regexes' ),
+        ( ) )
+    if not predicates and not regexes: return names.__contains__
+
+    def verify( name: str ) -> bool:
+        if name in names: return True
+        for predicate in predicates:
+            if predicate( name ): return True
+        return any( regex.fullmatch( name ) for regex in regexes )
+
+    return verify
+
+
+def _recognize_initializer_hook(
+    hook: __.typx.Any, names: __.cabc.Collection[ str ]
+) -> __.typx.Optional[ __.cabc.Mapping[ str, __.typx.Any ] ]:
+    ''' Recognizes initializer wrapper injected by standard behaviors.
+
+        Returns variables captured by wrapper, if it is recognized. Returns
+        nothing if Classcore release is not verified or if wrapper does not
+        have expected name, origin, captured variables, or wrapped function.
+    '''
+    if not _classcore_verified: return None
+    code = getattr( hook, '__code__', None )
+    if code is None or code.co_name not in names: return None
+    # Wrapper assumes module of wrapped initializer; inspect code instead.
+    if code.co_filename != __.ccstd.decorators.__file__:
+        return None # pragma: no cover
+    closure = __.inspect.getclosurevars( hook ).nonlocals
+    if (    isinstance( closure.get( 'behaviors' ), __.cabc.Set )
+        and isinstance( closure.get( 'ignore_init_arguments' ), bool )
+        and (   code.co_name != 'initialize_with_original'
+            or  hasattr( hook, '__wrapped__' ) )
+    ): return closure
+    return None # pragma: no cover
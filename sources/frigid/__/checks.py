@@ -0,0 +1,186 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Instance checks: protocol members and cached verdicts. '''
+
+
+from . import imports as __
+from . import nomina as _nomina
+
+
+def accelerate_instances_checks(
+    clscls: type[ _nomina.T ]
+) -> type[ _nomina.T ]:
+    ''' Wraps protocol metaclass to cache verdicts of instance checks.
+
+        Verdicts are cached per protocol and per type of checked object.
+        Tables of verdicts hold types weakly and are cleared after any
+        abstract base class registers a virtual subclass. Only runtime
+        protocols without non-method members have verdicts cached, since only
+        these can be decided by type rather than by instance. Even then,
+        verdicts are only cached for types whose instances cannot supply or
+        shadow members.
+
+        Also repairs members of protocols, which would otherwise include
+        attributes injected by the standard behaviors.
+    '''
+    initializer = clscls.__init__
+    checker = clscls.__instancecheck__
+    progress_name = _nomina.calculate_attrname( 'class', 'in_progress' )
+
+    @__.funct.wraps( initializer )
+    def initialize(
+        cls: type, *posargs: __.typx.Any, **nomargs: __.typx.Any
+    ) -> None:
+        # Class is immutable after initialization; bypass enforcement.
+        # Also shadows any verdicts which would be inherited.
+        type.__setattr__( cls, _verdicts_name, None )
+        initializer( cls, *posargs, **nomargs )
+        # Nested initializations occur during class replacement.
+        if hasattr( cls, _nomina.mangle_attrname( cls, progress_name ) ):
+            return
+        namespace = posargs[ 2 ] if len( posargs ) > 2 else { } # noqa: PLR2004
+        repair_protocol_members( cls, namespace )
+        if _is_decidable_by_type( cls ):
+            type.__setattr__( cls, _verdicts_name, _Verdicts( ) )
+
+    @__.funct.wraps( checker )
+    def check( cls: type, instance: __.typx.Any ) -> bool:
+        subtype = type( instance )
+        verdicts = getattr( cls, _verdicts_name, None )
+        if verdicts is None: return checker( cls, instance )
+        if verdicts.token != __.abc.get_cache_token( ): verdicts.clear( )
+        verdict = verdicts.table.get( __.weakref.ref( subtype ), __.absent )
+        # Types which cannot decide verdicts are recorded as such.
+        if verdict is None: return checker( cls, instance )
+        if not __.is_absent( verdict ): return verdict
+        verdict = checker( cls, instance )
+        # Proxies may claim other classes.
+        if instance.__class__ is subtype:
+            verdicts.record(
+                subtype,
+                verdict if _is_decided_by_type( cls, subtype ) else None )
+        return verdict
+
+    clscls.__init__ = initialize
+    clscls.__instancecheck__ = check
+    return clscls
+
+
+def repair_protocol_members(
+    cls: type, namespace: __.cabc.Mapping[ str, __.typx.Any ]
+) -> None:
+    ''' Removes attributes of standard behaviors from protocol members.
+
+        Record-keeping attributes and attribute hooks, which the standard
+        behaviors inject into each class, are not members of protocols,
+        unless a protocol declares the hooks itself.
+    '''
+    if not cls.__dict__.get( '_is_protocol', False ): return
+    members = cls.__dict__.get( '__protocol_attrs__' )
+    if members is None: return
+    declared: set[ str ] = set( )
+    for base in cls.__mro__[ 1: ]:
+        declared.update( base.__dict__.get( '__protocol_attrs__', ( ) ) )
+    members_ = {
+        name for name in members
+        if not name.startswith( _attributes_prefix )
+        and (   name not in _hooks_injected
+             or name in namespace or name in declared ) }
+    # Class is immutable after initialization; bypass enforcement.
+    type.__setattr__( cls, '__protocol_attrs__', members_ )
+    if not cls.__dict__.get( '_is_runtime_protocol', False ): return
+    type.__setattr__(
+        cls, '__non_callable_proto_members__', {
+            name for name in members_
+            if not callable( getattr( cls, name, None ) ) } )
+
+
+class _Verdicts:
+    ''' Verdicts of instance checks, keyed weakly by checked type. '''
+
+    __slots__ = ( 'table', 'token' )
+
+    def __init__( self ) -> None:
+        self.table: dict[
+            __.weakref.ref[ type ], __.typx.Optional[ bool ] ] = { }
+        self.token = __.abc.get_cache_token( )
+
+    def clear( self ) -> None:
+        ''' Forgets verdicts, which registrations may have invalidated. '''
+        self.table.clear( )
+        self.token = __.abc.get_cache_token( )
+
+    def record(
+        self, subtype: type, verdict: __.typx.Optional[ bool ]
+    ) -> None:
+        ''' Records verdict, which is forgotten when type is collected.
+
+            Nothing is recorded as verdict for types which cannot decide.
+        '''
+        table = self.table
+        table[ __.weakref.ref(
+            subtype, lambda reference: table.pop( reference, None ) )
+        ] = verdict
+
+
+_attributes_prefix = f"_{_nomina.package_name}_"
+_hooks_injected = frozenset( ( '__delattr__', '__dir__', '__setattr__' ) )
+_verdicts_name = _nomina.calculate_attrname( 'class', 'verdicts' )
+
+
+def _is_decided_by_type( cls: type, subtype: type ) -> bool:
+    ''' Is verdict of instance check against protocol decided by type?
+
+        Instances must not have dictionaries and their type must not compute
+        attributes dynamically, so that instances cannot supply members which
+        the type lacks. Members which resolve on the type must not resolve
+        to data descriptors, such as slots, which may vary by instance.
+    '''
+    if subtype.__dictoffset__: return False
+    if not __.is_absent( _lookup_static( subtype, '__getattr__' ) ):
+        return False
+    # Builtin types inherit generic lookup through their own slot wrappers.
+    if not isinstance(
+        _lookup_static( subtype, '__getattribute__' ),
+        __.types.WrapperDescriptorType
+    ): return False
+    for name in getattr( cls, '__protocol_attrs__', ( ) ):
+        member = _lookup_static( subtype, name )
+        if __.is_absent( member ): continue
+        species = type( member )
+        if hasattr( species, '__set__' ) or hasattr( species, '__delete__' ):
+            return False
+    return True
+
+
+def _is_decidable_by_type( cls: type ) -> bool:
+    ''' Can instance checks against protocol be decided by type? '''
+    if not cls.__dict__.get( '_is_protocol', False ): return False
+    if not cls.__dict__.get( '_is_runtime_protocol', False ): return False
+    return not getattr( cls, '__non_callable_proto_members__', True )
+
+
+def _lookup_static( subtype: type, name: str ) -> __.typx.Any:
+    ''' Looks up attribute in MRO of type without invoking descriptors. '''
+    for base in subtype.__mro__:
+        if name in base.__dict__: return base.__dict__[ name ]
+    return __.absent
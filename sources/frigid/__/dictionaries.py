@@ -55,18 +55,39 @@ class ImmutableDictionary(
     ):
         self._behaviors_: set[ str ] = set( )
         super( ).__init__( )
-        from itertools import chain
         # Add values in order received, enforcing no alteration.
-        for indicator, value in chain.from_iterable( map( # pyright: ignore
-            lambda element: ( # pyright: ignore
-                element.items( )
-                if isinstance( element, __.cabc.Mapping )
-                else element
-            ),
-            ( *iterables, entries )
-        ) ): self[ indicator ] = value # pyright: ignore
+        # Entries are staged in bulk; duplicate keys, within or across
+        # iterables, are then reported by insertion of each entry in order.
+        for element in ( *iterables, entries ):
+            pairs = (
+                element.items( ) if isinstance( element, __.cabc.Mapping )
+                else tuple( element ) ) # pyright: ignore
+            staging = dict( pairs ) # pyright: ignore
+            if (    len( staging ) == len( pairs )
+                and self.keys( ).isdisjoint( staging )
+            ):
+                dict.update( self, staging )
+                continue
+            for indicator, value in pairs: self[ indicator ] = value
         self._behaviors_.add( _immutability_label )
 
+    @classmethod
+    def _from_trusted_(
+        cls,
+        *iterables: _nomina.DictionaryPositionalArgument[ _H, _V ],
+        **entries: _nomina.DictionaryNominativeArgument[ _V ],
+    ) -> __.typx.Self:
+        ''' Produces dictionary from trusted entries, without verification.
+
+            Duplicate keys are not detected; later entries prevail.
+        '''
+        self = cls.__new__( cls )
+        self._behaviors_ = set( )
+        for element in iterables: dict.update( self, element )
+        dict.update( self, entries )
+        self._behaviors_.add( _immutability_label )
+        return self
+
     def __delitem__( self, key: _H ) -> None:
         from .exceptions import EntryImmutability
         raise EntryImmutability( key )
@@ -0,0 +1,411 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+
+
+''' Timing of Dynadoc docstring generation. '''
+
+
+from . import imports as __
+from . import nomina as _nomina
+from .doctab import fragments as _fragments
+
+
+class DocstringsModes( __.enum.Enum ):
+    ''' When Dynadoc introspection is rendered into docstrings.
+
+        Eager renders at class creation and module finalization. Lazy renders
+        upon first access of ``__doc__``. Skip never renders introspection;
+        authored docstrings and documentation fragments are still assembled.
+    '''
+
+    Eager = 'eager'
+    Lazy = 'lazy'
+    Skip = 'skip'
+
+
+docstrings_mode_variable = f"{_nomina.package_name.upper( )}_DOCSTRINGS"
+
+
+def discover_docstrings_mode( ) -> DocstringsModes:
+    ''' Discovers docstrings mode from interpreter and environment.
+
+        Running with docstrings stripped (``python -OO``) implies skipping.
+        Unrecognized values of the environment variable imply eager mode.
+    '''
+    if __.sys.flags.optimize > 1: return DocstringsModes.Skip
+    value = __.os.environ.get( docstrings_mode_variable, '' ).strip( )
+    try: return DocstringsModes( value.lower( ) or 'eager' )
+    except ValueError: return DocstringsModes.Eager
+
+
+docstrings_mode = discover_docstrings_mode( )
+docstrings_cache_name = 'docstrings_cache'
+dynadoc_introspection_disabled = (
+    __.ccstd.dynadoc.produce_dynadoc_introspection_control(
+        enable = False, targets = __.ddoc.IntrospectionTargets.Null ) )
+
+
+class DocstringDeferral:
+    ''' Docstring with Dynadoc introspection rendered upon first access.
+
+        Stored as ``__doc__`` on classes, where it acts as descriptor, and
+        within module namespaces, where module descriptor resolves it.
+    '''
+
+    __slots__ = ( 'configuration', 'docstring', 'rendition' )
+
+    configuration: _nomina.DynadocConfiguration
+    docstring: __.typx.Optional[ str ]
+    rendition: __.Absential[ __.typx.Optional[ str ] ]
+
+    def __init__(
+        self,
+        docstring: __.typx.Optional[ str ],
+        configuration: _nomina.DynadocConfiguration,
+    ) -> None:
+        self.configuration = configuration
+        self.docstring = docstring
+        self.rendition = __.absent
+
+    def __get__(
+        self, instance: object, owner: __.typx.Optional[ type ] = None
+    ) -> __.typx.Optional[ str ]:
+        return self.render( owner or type( instance ) )
+
+    def render( self, possessor: object ) -> __.typx.Optional[ str ]:
+        ''' Renders docstring for possessor, if not already rendered. '''
+        if not __.is_absent( self.rendition ): return self.rendition
+        context = self.configuration[ 'context' ]
+        informations = __.ddoc.xtnsapi.introspect(
+            possessor,
+            context = context,
+            introspection = self.configuration[ 'introspection' ],
+            cache = __.ddoc.xtnsapi.AnnotationsCache( ),
+            table = self.configuration[ 'table' ] )
+        fragment = context.fragment_rectifier(
+            __.ddoc.assembly.renderer_default(
+                possessor, informations, context = context ),
+            source = __.ddoc.xtnsapi.FragmentSources.Renderer )
+        docstring = '\n\n'.join(
+            filter( None, ( self.docstring, fragment ) ) ).rstrip( )
+        self.rendition = docstring or None
+        return self.rendition
+
+
+def defer_class_docstrings(
+    clscls: type[ _nomina.T ], /, mode: DocstringsModes = docstrings_mode
+) -> type[ _nomina.T ]:
+    ''' Wraps metaclass initializer to defer class docstring rendering.
+
+        Has no effect unless docstrings mode is lazy.
+    '''
+    if mode is not DocstringsModes.Lazy: return clscls
+    configuration = __.ccstd.dynadoc.produce_dynadoc_configuration(
+        table = _fragments )
+    initializer = clscls.__init__
+    progress_name = _nomina.calculate_attrname( 'class', 'in_progress' )
+
+    @__.funct.wraps( initializer )
+    def initialize(
+        cls: type, *posargs: __.typx.Any, **nomargs: __.typx.Any
+    ) -> None:
+        initializer( cls, *posargs, **nomargs )
+        # Nested initializations occur during class replacement.
+        if hasattr( cls, _nomina.mangle_attrname( cls, progress_name ) ):
+            return
+        docstring = cls.__dict__.get( '__doc__' )
+        if isinstance( docstring, DocstringDeferral ): return
+        # Class is immutable after initialization; bypass enforcement.
+        type.__setattr__(
+            cls, '__doc__', DocstringDeferral( docstring, configuration ) )
+
+    clscls.__init__ = initialize
+    return clscls
+
+
+def produce_class_dynadoc_configuration(
+    mode: DocstringsModes = docstrings_mode
+) -> _nomina.DynadocConfiguration:
+    ''' Produces Dynadoc configuration for metaclasses per docstrings mode.
+
+        Only eager mode introspects classes during their creation. Lazy mode
+        introspects their members then.
+    '''
+    if mode is DocstringsModes.Eager:
+        return __.ccstd.dynadoc.produce_dynadoc_configuration(
+            table = _fragments )
+    if mode is DocstringsModes.Lazy:
+        introspection = produce_members_introspection(
+            __.ccstd.dynadoc.dynadoc_introspection_on_class )
+        return __.ccstd.dynadoc.produce_dynadoc_configuration(
+            introspection = introspection, table = _fragments )
+    return __.ccstd.dynadoc.produce_dynadoc_configuration(
+        introspection = dynadoc_introspection_disabled, table = _fragments )
+
+
+def produce_members_introspection(
+    introspection: __.ddoc.IntrospectionControl
+) -> __.ddoc.IntrospectionControl:
+    ''' Produces introspection control which only renders into members.
+
+        Object itself is not introspected, so that its docstring can be
+        rendered upon first access. Its members, such as functions, are
+        introspected as before, since functions do not resolve docstrings
+        upon access and so cannot defer their rendering.
+    '''
+    enable = introspection.enable
+    limit_name = __.ccstd.dynadoc.dynadoc_context.introspection_limit_name
+
+    def enable_member(
+        objct: object, introspection_: __.ddoc.IntrospectionControl
+    ) -> __.ddoc.IntrospectionControl:
+        limit = getattr( objct, limit_name, None )
+        if isinstance( limit, __.ddoc.IntrospectionLimit ) and limit.disable:
+            return introspection_
+        return __.dcls.replace( introspection_, enable = enable )
+
+    return __.dcls.replace(
+        introspection,
+        enable = False,
+        limiters = ( enable_member, *introspection.limiters ) )
+
+
+def calculate_docstrings_fingerprint( ) -> str:
+    ''' Calculates fingerprint of environment which shapes docstrings.
+
+        Rendered annotations vary with Python version and with versions of
+        Classcore and Dynadoc. Docstrings vary with package sources, which
+        may change without change of package version.
+
+        Since the fingerprint includes the minor version of Python, a wheel
+        has precomputed docstrings only for the Python version which built
+        it. Other versions introspect at import, as without the cache.
+    '''
+    python_version = '.'.join( map( str, __.sys.version_info[ : 2 ] ) )
+    classcore_version = __.sys.modules[ 'classcore' ].__version__
+    return ' '.join( (
+        f"{__.sys.implementation.name}-{python_version}",
+        f"classcore-{classcore_version}",
+        f"dynadoc-{__.ddoc.__version__}",
+        f"sources-{calculate_sources_digest( )}" ) )
+
+
+def calculate_sources_digest(
+    location: str = __.os.path.dirname( __.os.path.dirname( __file__ ) )
+) -> str:
+    ''' Calculates digest of package sources, except precomputed docstrings.
+    '''
+    import hashlib # Already imported by dependencies; no extra cost.
+    exclusion = f"{docstrings_cache_name}.py"
+    paths: list[ str ] = [ ]
+    for directory, directories, files in __.os.walk( location ):
+        directories[ : ] = sorted(
+            name for name in directories if name != '__pycache__' )
+        paths.extend(
+            __.os.path.join( directory, name ) for name in sorted( files )
+            if name.endswith( '.py' ) and name != exclusion )
+    hasher = hashlib.sha256( )
+    for path in paths:
+        name = __.os.path.relpath( path, location ).replace( __.os.sep, '/' )
+        hasher.update( name.encode( ) + b'\0' )
+        with open( path, 'rb' ) as stream: hasher.update( stream.read( ) )
+    return hasher.hexdigest( )[ : 16 ]
+
+
+def load_docstrings_cache( ) -> __.cabc.Mapping[ str, str ]:
+    ''' Loads precomputed docstrings, if present and current.
+
+        Precomputed docstrings are generated into wheels at build time.
+        Empty, if absent or generated for different environment.
+    '''
+    try:
+        cache = __.importlib.import_module(
+            f"{__package__}.{docstrings_cache_name}" )
+    except ImportError: return __.types.MappingProxyType( { } )
+    fingerprint = getattr( cache, 'fingerprint', None )
+    if fingerprint != calculate_docstrings_fingerprint( ):
+        return __.types.MappingProxyType( { } )
+    return __.types.MappingProxyType( cache.docstrings )
+
+
+docstrings_cache = (
+    load_docstrings_cache( ) if docstrings_mode is DocstringsModes.Eager
+    else __.types.MappingProxyType( { } ) )
+
+
+def produce_docstrings_cache_source( package_name: str ) -> str:
+    ''' Produces source of module with precomputed package docstrings. '''
+    docstrings = survey_docstrings( package_name )
+    fingerprint = calculate_docstrings_fingerprint( )
+    return '\n'.join( (
+        "''' Precomputed docstrings. (Generated at build time.) '''",
+        '', '',
+        f"fingerprint = {fingerprint!r}",
+        'docstrings = {',
+        *(  f"    {qname!r}: {docstring!r},"
+            for qname, docstring in docstrings.items( ) ),
+        '}',
+        '' ) )
+
+
+def restore_class_docstrings(
+    clscls: type[ _nomina.T ], /,
+    docstrings: __.cabc.Mapping[ str, str ] = docstrings_cache,
+) -> type[ _nomina.T ]:
+    ''' Wraps metaclass construction to restore precomputed docstrings.
+
+        Classes with precomputed docstrings are not introspected during
+        their creation. Has no effect without precomputed docstrings.
+    '''
+    if not docstrings: return clscls
+    configuration = (
+        produce_class_dynadoc_configuration( DocstringsModes.Skip ) )
+    constructor = clscls.__dict__[ '__new__' ]
+    initializer = clscls.__init__
+    progress_name = _nomina.calculate_attrname( 'class', 'in_progress' )
+
+    @__.funct.wraps( constructor )
+    def construct(
+        clscls_: type,
+        name: str,
+        bases: tuple[ type, ... ],
+        namespace: dict[ str, __.typx.Any ],
+        **arguments: __.typx.Any,
+    ) -> type:
+        qname = '.'.join( (
+            namespace.get( '__module__', '' ),
+            namespace.get( '__qualname__', name ) ) )
+        if qname in docstrings:
+            arguments.setdefault( 'dynadoc_configuration', configuration )
+        return constructor( clscls_, name, bases, namespace, **arguments )
+
+    @__.funct.wraps( initializer )
+    def initialize(
+        cls: type, *posargs: __.typx.Any, **nomargs: __.typx.Any
+    ) -> None:
+        initializer( cls, *posargs, **nomargs )
+        # Nested initializations occur during class replacement.
+        if hasattr( cls, _nomina.mangle_attrname( cls, progress_name ) ):
+            return
+        qname = f"{cls.__module__}.{cls.__qualname__}"
+        if qname not in docstrings: return
+        # Class is immutable after initialization; bypass enforcement.
+        type.__setattr__( cls, '__doc__', docstrings[ qname ] )
+        _restore_members_docstrings( qname, vars( cls ), docstrings )
+
+    setattr( clscls, '__new__', construct )
+    clscls.__init__ = initialize
+    return clscls
+
+
+def restore_module_docstrings(
+    module: __.types.ModuleType, /,
+    docstrings: __.cabc.Mapping[ str, str ] = docstrings_cache,
+) -> bool:
+    ''' Restores precomputed docstrings of module and its members.
+
+        Returns whether module has precomputed docstring.
+    '''
+    mname = module.__name__
+    if mname not in docstrings: return False
+    namespace = vars( module )
+    namespace[ '__doc__' ] = docstrings[ mname ]
+    _restore_members_docstrings( mname, namespace, docstrings )
+    for aname, attribute in namespace.items( ):
+        if not __.inspect.isclass( attribute ): continue
+        if attribute.__module__ != mname: continue
+        if attribute.__qualname__ != aname: continue
+        qname = f"{mname}.{aname}"
+        if qname not in docstrings: continue
+        docstring = docstrings[ qname ]
+        # Immutable classes of this package restore their own docstrings.
+        if attribute.__doc__ != docstring:
+            type.__setattr__( attribute, '__doc__', docstring )
+        _restore_members_docstrings( qname, vars( attribute ), docstrings )
+    return True
+
+
+def survey_docstrings( package_name: str ) -> dict[ str, str ]:
+    ''' Surveys docstrings of package modules, classes, and functions.
+
+        Imports all modules of package first. Includes methods and
+        properties of classes. Excludes objects imported from elsewhere.
+    '''
+    import pkgutil
+    package = __.importlib.import_module( package_name )
+    prefix = f"{package_name}."
+    for information in pkgutil.walk_packages( package.__path__, prefix ):
+        __.importlib.import_module( information.name )
+    docstrings: dict[ str, str ] = { }
+    for mname, module in tuple( __.sys.modules.items( ) ):
+        if mname != package_name and not mname.startswith( prefix ): continue
+        if isinstance( module.__doc__, str ):
+            docstrings[ mname ] = module.__doc__
+        for aname, attribute in vars( module ).items( ):
+            if getattr( attribute, '__module__', None ) != mname: continue
+            if getattr( attribute, '__qualname__', None ) != aname: continue
+            qname = f"{mname}.{aname}"
+            if __.inspect.isclass( attribute ):
+                if isinstance( attribute.__doc__, str ):
+                    docstrings[ qname ] = attribute.__doc__
+                _survey_members_docstrings(
+                    qname, vars( attribute ), docstrings )
+            elif __.inspect.isfunction( attribute ):
+                if isinstance( attribute.__doc__, str ):
+                    docstrings[ qname ] = attribute.__doc__
+    return dict( sorted( docstrings.items( ) ) )
+
+
+def _access_documentables(
+    attribute: __.typx.Any
+) -> tuple[ __.typx.Any, ... ]:
+    ''' Accesses objects which carry docstring of attribute. '''
+    if __.inspect.isfunction( attribute ): return ( attribute, )
+    if isinstance( attribute, ( classmethod, staticmethod ) ):
+        return ( attribute.__func__, )
+    if isinstance( attribute, property ):
+        if attribute.fget is None: return ( attribute, )
+        return ( attribute, attribute.fget )
+    return ( )
+
+
+def _restore_members_docstrings(
+    qname: str,
+    namespace: __.cabc.Mapping[ str, __.typx.Any ],
+    docstrings: __.cabc.Mapping[ str, str ],
+) -> None:
+    ''' Restores precomputed docstrings of functions in namespace. '''
+    for name, attribute in namespace.items( ):
+        docstring = docstrings.get( f"{qname}.{name}" )
+        if docstring is None: continue
+        for documentable in _access_documentables( attribute ):
+            documentable.__doc__ = docstring
+
+
+def _survey_members_docstrings(
+    qname: str,
+    namespace: __.cabc.Mapping[ str, __.typx.Any ],
+    docstrings: dict[ str, str ],
+) -> None:
+    ''' Surveys docstrings of functions in namespace. '''
+    for name, attribute in namespace.items( ):
+        documentables = _access_documentables( attribute )
+        if not documentables: continue
+        docstring = documentables[ 0 ].__doc__
+        if isinstance( docstring, str ):
+            docstrings[ f"{qname}.{name}" ] = docstring
@@ -0,0 +1,212 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Instance evolutions: copies of dataclass instances with changes. '''
+
+
+from . import behaviors as _behaviors
+from . import fields as _fields
+from . import imports as __
+from . import interns as _interns
+from . import nomina as _nomina
+from . import slots as _slots
+
+
+def evolve( instance: _nomina.U, /, **changes: __.typx.Any ) -> _nomina.U:
+    ''' Produces copy of dataclass instance with changed field values.
+
+        Equivalent to ``dataclasses.replace``. For dataclasses produced by
+        the metaclasses of this package, unchanged field values are copied
+        directly into the copy, rather than passed through the initializer.
+        Post-initialization hooks are still run. Copies of interned
+        instances are canonical instances.
+    '''
+    evolver = getattr( type( instance ), evolver_name, None )
+    if evolver is None: return _evolve_initially( instance, changes )
+    return evolver( instance, changes )
+
+
+evolver_name = _nomina.calculate_attrname( 'class', 'evolver' )
+
+
+def _evolve_initially(
+    instance: _nomina.U, changes: __.cabc.Mapping[ str, __.typx.Any ]
+) -> _nomina.U:
+    ''' Evolves instance of class without evolver of its own.
+
+        For classes with specialized initializers, an evolver specialized to
+        the class is produced and retained. Evolvers are inherited, so each
+        verifies that it belongs to the class of the evolved instance and
+        defers to this function otherwise.
+    '''
+    cls = type( instance )
+    if not _behaviors.is_dataclass_initializer_specialized( cls ):
+        return __.dcls.replace( instance, **changes )
+    evolver = _produce_evolver( cls ) or _produce_replacer( cls )
+    # Class is immutable after construction; bypass enforcement.
+    type.__setattr__( cls, evolver_name, evolver )
+    return evolver( instance, changes )
+
+
+def _produce_evolver(
+    cls: type
+) -> __.typx.Optional[ __.cabc.Callable[ ..., __.typx.Any ] ]:
+    ''' Generates evolver which copies fields via slot descriptors.
+
+        Mirrors the semantics of 'dataclasses.replace': changes may name
+        initialized fields and initialization pseudo-fields; other fields
+        are reset from their defaults or by the post-initialization hook.
+        Invalid changes are delegated to 'dataclasses.replace', which raises
+        the customary errors. Returns nothing if any field or the behaviors
+        attribute is not slotted or if instances are interned, since the
+        constructor must then be consulted.
+    '''
+    if _interns.access_instances_interns( cls ) is not None: return None
+    activator = _slots.discover_slot( cls, _behaviors.instance_behaviors_name )
+    if activator is None: return None
+    namespace: dict[ str, __.typx.Any ] = {
+        '__frigid_activate__': activator.__set__,
+        '__frigid_class__': cls,
+        '__frigid_new__': object.__new__,
+        '__frigid_initiate__': _evolve_initially,
+        # Evolvers are only produced for specialized initializers.
+        '__frigid_provide_error__': cls.__dict__[ '__init__' ].__globals__[
+            '__frigid_provide_error__' ],
+        '__frigid_replace__': __.dcls.replace,
+    }
+    names: list[ str ] = [ ]
+    lines = _produce_fields_assignments( cls, names, namespace )
+    if lines is None: return None
+    if hasattr( cls, '__post_init__' ):
+        arguments, required = _produce_initvars_arguments(
+            cls, names, namespace )
+        lines.append( f"instance.__post_init__( {', '.join( arguments )} )" )
+        if required:
+            namespace[ '__frigid_required__' ] = frozenset( required )
+    lines.append( "__frigid_activate__( instance, source.{} )".format(
+        _behaviors.instance_behaviors_name ) )
+    lines.append( "return instance" )
+    namespace[ '__frigid_names__' ] = frozenset( names )
+    verification = (
+        "not __frigid_required__ <= changes.keys( ) <= __frigid_names__"
+        if '__frigid_required__' in namespace
+        else "not __frigid_names__.issuperset( changes )" )
+    lines[ 0:0 ] = [
+        "if type( source ) is not __frigid_class__:",
+        "    return __frigid_initiate__( source, changes )",
+        f"if {verification}: return __frigid_replace__( source, **changes )",
+        "instance = __frigid_new__( __frigid_class__ )",
+    ]
+    body = '\n'.join( f"    {line}" for line in lines )
+    exec( f"def evolve( source, changes ):\n{body}\n", namespace ) # noqa: S102
+    function = namespace[ 'evolve' ]
+    function.__qualname__ = f"{cls.__qualname__}.__evolve__"
+    return function
+
+
+def _produce_fields_assignments(
+    cls: type, names: list[ str ], namespace: dict[ str, __.typx.Any ]
+) -> __.typx.Optional[ list[ str ] ]:
+    ''' Produces field assignments for generated evolver.
+
+        Initialized fields are assigned from changes or else from source.
+        Changes are converted and validated per field processors. Names of
+        initialized fields are appended to the acceptable changes. Other
+        fields are assigned from their defaults or default factories, which
+        are recorded into namespace of evolver. Returns nothing if any field
+        is not slotted.
+    '''
+    processors = _fields.survey_fields_processors( cls )
+    lines: list[ str ] = [ ]
+    for field in __.dcls.fields( cls ):
+        name = field.name
+        descriptor = _slots.discover_slot( cls, name )
+        if descriptor is None: return None
+        if name in processors:
+            names.append( name )
+            value = f"__frigid_value_{name}__"
+            lines.append( f"if {name!r} in changes:" )
+            lines.append( f"    {value} = changes[ {name!r} ]" )
+            lines.extend(
+                f"    {line}" for line in _fields.produce_field_processing(
+                    cls, name, value, processors[ name ], namespace ) )
+            lines.append( f"else: {value} = source.{name}" )
+        elif field.init:
+            names.append( name )
+            value = (
+                f"changes[ {name!r} ] if {name!r} in changes "
+                f"else source.{name}" )
+        elif field.default_factory is not __.dcls.MISSING:
+            namespace[ f"__frigid_factory_{name}__" ] = field.default_factory
+            value = f"__frigid_factory_{name}__( )"
+        elif field.default is not __.dcls.MISSING:
+            value = f"__frigid_default_{name}__"
+            namespace[ value ] = field.default
+        else: continue
+        namespace[ f"__frigid_assign_{name}__" ] = descriptor.__set__
+        lines.append( f"__frigid_assign_{name}__( instance, {value} )" )
+    return lines
+
+
+def _produce_initvars_arguments(
+    cls: type, names: list[ str ], namespace: dict[ str, __.typx.Any ]
+) -> tuple[ list[ str ], list[ str ] ]:
+    ''' Produces arguments for post-initialization hook of evolver.
+
+        Initialization pseudo-fields are parameters of the initializer which
+        are not fields. Their names are appended to the acceptable changes
+        and their defaults are recorded into namespace of evolver. Returns
+        arguments and names of pseudo-fields without defaults.
+    '''
+    fields_names = frozenset(
+        field.name for field in __.dcls.fields( cls ) )
+    arguments: list[ str ] = [ ]
+    required: list[ str ] = [ ]
+    signature = __.inspect.signature( cls.__init__ )
+    for parameter in tuple( signature.parameters.values( ) )[ 1: ]:
+        name = parameter.name
+        if name in fields_names: continue
+        names.append( name )
+        if parameter.default is parameter.empty:
+            required.append( name )
+            arguments.append( f"changes[ {name!r} ]" )
+            continue
+        namespace[ f"__frigid_default_{name}__" ] = parameter.default
+        arguments.append(
+            f"changes[ {name!r} ] if {name!r} in changes "
+            f"else __frigid_default_{name}__" )
+    return arguments, required
+
+
+def _produce_replacer(
+    cls: type
+) -> __.cabc.Callable[ ..., __.typx.Any ]:
+    ''' Produces evolver which replaces via dataclass initializer. '''
+
+    def evolve(
+        source: __.typx.Any, changes: __.cabc.Mapping[ str, __.typx.Any ]
+    ) -> __.typx.Any:
+        if type( source ) is not cls:
+            return _evolve_initially( source, changes )
+        return __.dcls.replace( source, **changes )
+
+    evolve.__qualname__ = f"{cls.__qualname__}.__evolve__"
+    return evolve
@@ -50,3 +50,11 @@ class OperationInvalidity( Omnierror, RuntimeError, TypeError ):
 
     def __init__( self, name: str ) -> None:
         super( ).__init__( f"Operation {name!r} is not valid on this object." )
+
+
+class PropertyCacheInvalidity( Omnierror, TypeError ):
+    ''' Attempt to cache property value where it cannot be cached. '''
+
+    def __init__( self, name: str, reason: str ) -> None:
+        super( ).__init__(
+            f"Cannot cache value of property {name!r}. Reason: {reason}" )
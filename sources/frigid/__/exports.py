@@ -0,0 +1,69 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+
+
+''' Loading of package exports upon first access. '''
+
+
+from . import imports as __
+
+
+def produce_exports_accessor(
+    package_name: str, exports: __.cabc.Mapping[ str, str ]
+) -> __.cabc.Callable[ [ str ], __.typx.Any ]:
+    ''' Produces module '__getattr__' which imports submodules on demand.
+
+        Exports map attribute names to names of submodules which provide
+        them. Submodules map to themselves. Upon import of a submodule, all
+        of its exports are recorded in the package namespace directly, since
+        the package may already be immutable.
+    '''
+    def access( name: str ) -> __.typx.Any:
+        mname = exports.get( name )
+        if mname is None:
+            # Absence is probed routinely, as by introspection during
+            # finalization, and must not load any exceptions module.
+            raise AttributeError( # noqa: TRY003
+                f"module {package_name!r} has no attribute {name!r}",
+                name = name, obj = __.sys.modules[ package_name ] )
+        module = __.importlib.import_module( f"{package_name}.{mname}" )
+        namespace = vars( __.sys.modules[ package_name ] )
+        for ename, mname_ in exports.items( ):
+            if mname_ != mname: continue
+            namespace[ ename ] = (
+                module if ename == mname else getattr( module, ename ) )
+        return namespace[ name ]
+
+    return access
+
+
+def produce_exports_surveyor(
+    package_name: str, exports: __.cabc.Mapping[ str, str ]
+) -> __.cabc.Callable[ [ ], list[ str ] ]:
+    ''' Produces module '__dir__' which includes exports not yet loaded.
+
+        Only public names are surveyed.
+    '''
+    def survey( ) -> list[ str ]:
+        namespace = vars( __.sys.modules[ package_name ] )
+        return sorted(
+            name for name in { *namespace, *exports }
+            if not name.startswith( '_' ) )
+
+    return survey
+
@@ -0,0 +1,137 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Field processors: declarative conversions and validations of fields. '''
+
+
+from . import imports as __
+
+
+class FieldConverter( __.ccstd.Object ):
+    ''' Converts argument for dataclass field, before its assignment.
+
+        Supplied as metadata of ``Annotated`` field type. Type and value
+        errors from the converter are reported as invalid values.
+    '''
+
+    __slots__ = ( 'converter', )
+
+    converter: __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ]
+
+    def __init__(
+        self, converter: __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ]
+    ) -> None:
+        self.converter = converter
+
+    def __repr__( self ) -> str:
+        return f"{type( self ).__qualname__}( {self.converter!r} )"
+
+
+class FieldValidator( __.ccstd.Object ):
+    ''' Validates argument for dataclass field, before its assignment.
+
+        Supplied as metadata of ``Annotated`` field type. Values, which the
+        validator rejects, and type and value errors from the validator are
+        reported as invalid values.
+    '''
+
+    __slots__ = ( 'validator', )
+
+    validator: __.cabc.Callable[ [ __.typx.Any ], bool ]
+
+    def __init__(
+        self, validator: __.cabc.Callable[ [ __.typx.Any ], bool ]
+    ) -> None:
+        self.validator = validator
+
+    def __repr__( self ) -> str:
+        return f"{type( self ).__qualname__}( {self.validator!r} )"
+
+
+FieldProcessor: __.typx.TypeAlias = FieldConverter | FieldValidator
+
+
+def produce_field_processing(
+    cls: type,
+    name: str,
+    variable: str,
+    processors: __.cabc.Sequence[ FieldProcessor ],
+    namespace: dict[ str, __.typx.Any ],
+) -> list[ str ]:
+    ''' Produces conversions and validations of argument for field.
+
+        Lines rebind the local variable, which holds the argument, in order
+        of the processors. Records processors into namespace of generated
+        function, which must provide an error class provider under
+        '__frigid_provide_error__'.
+    '''
+    target = "instance of class {!r}".format(
+        __.ccutils.qualify_class_name( cls ) )
+    failure = (
+        f"__frigid_provide_error__( 'FieldInvalidity' )"
+        f"( {name!r}, {variable}, {target!r} )" )
+    lines: list[ str ] = [ ]
+    for index, processor in enumerate( processors ):
+        routine = f"__frigid_process_{name}_{index}__"
+        if isinstance( processor, FieldConverter ):
+            namespace[ routine ] = processor.converter
+            lines.extend( (
+                f"try: {variable} = {routine}( {variable} )",
+                "except ( TypeError, ValueError ) as __frigid_exception__:",
+                f"    raise {failure} from __frigid_exception__" ) )
+            continue
+        namespace[ routine ] = processor.validator
+        lines.extend( (
+            f"try: __frigid_valid__ = {routine}( {variable} )",
+            "except ( TypeError, ValueError ) as __frigid_exception__:",
+            f"    raise {failure} from __frigid_exception__",
+            f"if not __frigid_valid__: raise {failure}" ) )
+    return lines
+
+
+def survey_fields_processors(
+    cls: type
+) -> dict[ str, tuple[ FieldProcessor, ... ] ]:
+    ''' Surveys processors of initialized fields of dataclass.
+
+        Processors are found in metadata of ``Annotated`` field types, in
+        order. Annotations, which are strings, are resolved, if possible.
+    '''
+    hints: __.typx.Optional[ dict[ str, __.typx.Any ] ] = None
+    processors: dict[ str, tuple[ FieldProcessor, ... ] ] = { }
+    for field in __.dcls.fields( cls ): # pyright: ignore
+        if not field.init: continue
+        annotation = field.type
+        if isinstance( annotation, str ):
+            if hints is None: hints = _resolve_annotations( cls )
+            annotation = hints.get( field.name )
+        if __.typx.get_origin( annotation ) is not __.typx.Annotated:
+            continue
+        processors_ = tuple(
+            datum for datum in annotation.__metadata__
+            if isinstance( datum, ( FieldConverter, FieldValidator ) ) )
+        if processors_: processors[ field.name ] = processors_
+    return processors
+
+
+def _resolve_annotations( cls: type ) -> dict[ str, __.typx.Any ]:
+    ''' Resolves annotations of class, including metadata, if possible. '''
+    try: return __.typx.get_type_hints( cls, include_extras = True )
+    except ( AttributeError, NameError, TypeError ): return { }
@@ -0,0 +1,211 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Instance hashes and digests: memoization for immutable dataclasses. '''
+
+
+from . import behaviors as _behaviors
+from . import imports as __
+from . import nomina as _nomina
+from . import slots as _slots
+
+
+def accept_instances_hash_caching(
+    clscls: type[ _nomina.T ]
+) -> type[ _nomina.T ]:
+    ''' Wraps dataclass metaclass to accept 'instances_hash_cached' argument.
+
+        If the argument is true, then instances are hashable by the values of
+        their hashed fields and each hash is memoized in a concealed slot upon
+        its first computation. Memoization is sound, since instances are
+        immutable after initialization. Subclasses inherit memoization.
+        Classes which define their own ``__hash__`` retain it.
+
+        Memoized hashes are omitted from pickled state, since hashes of
+        strings and other objects vary across processes.
+    '''
+    constructor = clscls.__new__
+
+    def construct(
+        clscls_: type[ _nomina.T ],
+        name: str,
+        bases: tuple[ type, ... ],
+        namespace: dict[ str, __.typx.Any ], *,
+        instances_hash_cached: bool = False,
+        **arguments: __.typx.Any,
+    ) -> type:
+        if clscls_ is not clscls or not (
+            instances_hash_cached
+            or namespace.get( enablement_name, False )
+            or any( getattr( base, enablement_name, False ) for base in bases )
+        ): return constructor( clscls_, name, bases, namespace, **arguments )
+        namespace[ enablement_name ] = True
+        slots = namespace.get( '__slots__' )
+        if slots is not None:
+            # Slotted replacement by dataclass decorator. Allocate hash slot,
+            # unless inherited.
+            if not any(
+                _slots.discover_slot( base, hash_name ) for base in bases
+            ): namespace[ '__slots__' ] = ( *slots, hash_name )
+            return constructor( clscls_, name, bases, namespace, **arguments )
+        cls = constructor( clscls_, name, bases, namespace, **arguments )
+        descriptor = _slots.discover_slot( cls, hash_name )
+        if descriptor is None: return cls # Not slotted; nothing to memoize.
+        # Class is immutable after construction; bypass enforcement.
+        if '__hash__' not in namespace:
+            type.__setattr__(
+                cls, '__hash__', _produce_hasher( cls, descriptor ) )
+        if '__getstate__' not in namespace:
+            type.__setattr__(
+                cls, '__getstate__', _produce_state_getter( cls ) )
+        return cls
+
+    setattr( clscls, '__new__', construct )
+    return clscls
+
+
+def allocate_instances_digests(
+    clscls: type[ _nomina.T ]
+) -> type[ _nomina.T ]:
+    ''' Wraps metaclass constructor to allocate slots for content digests.
+
+        Slots are allocated in namespaces which declare slots, including
+        slotted reproductions by the dataclass decorator, unless bases
+        already allocate them. Digests are memoized in these slots upon
+        their first computation. Memoized digests are omitted from pickled
+        state, as they cannot be restored onto immutable instances.
+    '''
+    constructor = clscls.__new__
+
+    def construct(
+        clscls_: type[ _nomina.T ],
+        name: str,
+        bases: tuple[ type, ... ],
+        namespace: dict[ str, __.typx.Any ],
+        **arguments: __.typx.Any,
+    ) -> type:
+        slots = namespace.get( '__slots__' )
+        if (    isinstance( slots, tuple )
+            and digest_name not in slots
+            and not any( discover_digest_slot( base ) for base in bases )
+        ): namespace[ '__slots__' ] = ( *slots, digest_name )
+        cls = constructor( clscls_, name, bases, namespace, **arguments )
+        if discover_digest_slot( cls ) is None: return cls
+        # Inherited state getters are recalculated for slots of subclasses.
+        getstate = getattr( cls, '__getstate__', None )
+        if getstate is object.__getstate__ or (
+            getattr( getstate, '__module__', None ) == __name__
+        ):
+            # Class is immutable after construction; bypass enforcement.
+            type.__setattr__(
+                cls, '__getstate__', _produce_state_getter( cls ) )
+        return cls
+
+    setattr( clscls, '__new__', construct )
+    return clscls
+
+
+def discover_digest_slot(
+    cls: type
+) -> __.typx.Optional[ __.types.MemberDescriptorType ]:
+    ''' Discovers slot descriptor for memoized digest in MRO of class. '''
+    for class_ in cls.__mro__:
+        descriptor = class_.__dict__.get( digest_name )
+        if isinstance( descriptor, __.types.MemberDescriptorType ):
+            return descriptor
+    return None
+
+
+digest_name = _nomina.calculate_attrname( 'instance', 'digest' )
+enablement_name = _nomina.calculate_attrname( 'class', 'hashes_memoized' )
+hash_name = _nomina.calculate_attrname( 'instance', 'hash' )
+
+
+def _calculate_slotnames( cls: type ) -> tuple[ str, ... ]:
+    ''' Calculates names of slots to pickle, other than memoized values.
+
+        Mirrors calculation by :py:func:`copyreg._slotnames`, except that
+        instance behaviors come last, so that immutability is restored only
+        after all other slots, including those of subclasses.
+    '''
+    names: list[ str ] = [ ]
+    for class_ in cls.__mro__:
+        slots = class_.__dict__.get( '__slots__', ( ) )
+        if isinstance( slots, str ): slots = ( slots, )
+        for name in slots:
+            if name in (
+                '__dict__', '__weakref__', hash_name, digest_name
+            ): continue
+            if name.startswith( '__' ) and not name.endswith( '__' ):
+                name_ = f"_{class_.__name__.lstrip( '_' )}{name}"
+                names.append( name_ )
+            else: names.append( name )
+    names_ = tuple( dict.fromkeys( names ) )
+    behaviors_name = _behaviors.instance_behaviors_name
+    if behaviors_name not in names_: return names_
+    return (
+        *( name for name in names_ if name != behaviors_name ),
+        behaviors_name )
+
+
+def _produce_hasher(
+    cls: type, descriptor: __.types.MemberDescriptorType
+) -> __.cabc.Callable[ [ __.typx.Any ], int ]:
+    ''' Generates hash function which memoizes hash in slot.
+
+        Hashed fields are those which dataclasses would hash: fields with
+        'hash' set to true or, if unset, with 'compare' set to true.
+    '''
+    values = ''.join(
+        f"self.{field.name}, " for field in __.dcls.fields( cls )
+        if ( field.compare if field.hash is None else field.hash ) )
+    source = (
+        "def __hash__( self ):\n"
+        f"    try: return self.{hash_name}\n"
+        "    except AttributeError: pass\n"
+        f"    value = hash( ( {values}) )\n"
+        "    __frigid_memoize__( self, value )\n"
+        "    return value\n" )
+    namespace: dict[ str, __.typx.Any ] = {
+        '__frigid_memoize__': descriptor.__set__ }
+    exec( source, namespace ) # noqa: S102
+    function = namespace[ '__hash__' ]
+    function.__qualname__ = f"{cls.__qualname__}.__hash__"
+    return function
+
+
+def _produce_state_getter(
+    cls: type
+) -> __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ]:
+    ''' Produces state getter which omits memoized values from state. '''
+    names = _calculate_slotnames( cls )
+
+    def __getstate__(
+        self: __.typx.Any
+    ) -> tuple[ None, dict[ str, __.typx.Any ] ]:
+        state: dict[ str, __.typx.Any ] = { }
+        for name in names:
+            try: state[ name ] = getattr( self, name )
+            except AttributeError: continue # noqa: PERF203
+        return None, state
+
+    __getstate__.__qualname__ = f"{cls.__qualname__}.__getstate__"
+    return __getstate__
@@ -25,12 +25,21 @@
 
 import                          abc
 import collections.abc as       cabc
+import                          copy
 import dataclasses as           dcls
+import                          enum
 import functools as             funct
+import                          importlib
 import                          inspect
+import                          itertools
+import                          os
+import                          re
 import                          sys
+import                          time
 import                          types
+import                          weakref
 
+import                          classcore
 import classcore.exceptions as  ccexc
 import classcore.standard as    ccstd
 import classcore.utilities as   ccutils
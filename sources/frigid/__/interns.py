@@ -0,0 +1,342 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Instance interning: canonical instances of frozen dataclasses. '''
+
+
+from . import behaviors as _behaviors
+from . import fields as _fields
+from . import imports as __
+from . import nomina as _nomina
+
+
+class InstancesInterns:
+    ''' Canonical instances of class, keyed by compared field values.
+
+        Instances are held weakly; an entry vanishes once its instance is
+        collected. Instances with unhashable field values are not interned.
+
+        If the generated initializer stores its arguments unaltered, then
+        canonical instances are found from nominative arguments alone, without
+        constructing instances which would only be discarded.
+    '''
+
+    __slots__ = (
+        'arguments_keyer', 'attributes_keyer', 'count', 'expeditable',
+        'forget', 'hits', 'misses', 'table' )
+
+    def __init__(
+        self, names: __.cabc.Sequence[ str ], expeditable: bool
+    ) -> None:
+        self.arguments_keyer = _produce_keyer( names, 'source[ {name!r} ]' )
+        self.attributes_keyer = _produce_keyer( names, 'source.{name}' )
+        self.count = len( names )
+        self.expeditable = expeditable
+        self.hits = 0
+        self.misses = 0
+        # Faster than weak-value dictionary, which looks up in Python.
+        table: dict[ __.typx.Any, __.weakref.KeyedRef ] = { }
+
+        def forget( reference: __.weakref.KeyedRef ) -> None:
+            if table.get( reference.key ) is reference:
+                del table[ reference.key ]
+
+        self.forget = forget
+        self.table = table
+
+    def produce(
+        self,
+        cls: type,
+        constructor: __.cabc.Callable[ ..., __.typx.Any ],
+        posargs: _nomina.PositionalArguments,
+        nomargs: _nomina.NominativeArguments,
+    ) -> __.typx.Any:
+        ''' Returns canonical instance for arguments, constructing if new. '''
+        if (    self.expeditable and not posargs
+            and len( nomargs ) == self.count
+        ):
+            try: reference = self.table.get( self.arguments_keyer( nomargs ) )
+            except ( KeyError, TypeError ): reference = None
+            canonical = None if reference is None else reference( )
+            if canonical is not None:
+                self.hits += 1
+                return canonical
+        return self.intern( constructor( cls, *posargs, **nomargs ) )
+
+    def is_canonical( self, instance: __.typx.Any ) -> bool:
+        ''' Is instance the canonical instance for its values? '''
+        try: reference = self.table.get( self.attributes_keyer( instance ) )
+        except TypeError: return False
+        return reference is not None and reference( ) is instance
+
+    def intern( self, instance: _nomina.U ) -> _nomina.U:
+        ''' Returns canonical instance equal to instance. '''
+        key = self.attributes_keyer( instance )
+        try: reference = self.table.get( key )
+        except TypeError: # Unhashable values. Count as new.
+            self.misses += 1
+            return instance
+        canonical = None if reference is None else reference( )
+        if canonical is not None:
+            self.hits += 1
+            return canonical
+        self.misses += 1
+        self.table[ key ] = __.weakref.KeyedRef( instance, self.forget, key )
+        return instance
+
+
+def accept_instances_interning(
+    clscls: type[ _nomina.T ]
+) -> type[ _nomina.T ]:
+    ''' Wraps dataclass metaclass to accept 'instances_interned' argument.
+
+        If the argument is true, then the class is produced by the interning
+        variant of the metaclass instead. Instantiation of other classes of
+        the metaclass is not intercepted and incurs no overhead.
+    '''
+    constructor = clscls.__new__
+
+    def construct(
+        clscls_: type[ _nomina.T ],
+        name: str,
+        bases: tuple[ type, ... ],
+        namespace: dict[ str, __.typx.Any ], *,
+        instances_interned: bool = False,
+        **arguments: __.typx.Any,
+    ) -> type:
+        if instances_interned and clscls_ is clscls:
+            variant = _variants[ clscls ]
+            # Initialization is by the variant, as it is a subclass.
+            return variant.__new__(
+                variant, name, bases, namespace,
+                instances_interned = True, **arguments )
+        return constructor( clscls_, name, bases, namespace, **arguments )
+
+    setattr( clscls, '__new__', construct )
+    return clscls
+
+
+def access_instances_interns(
+    cls: type
+) -> __.typx.Optional[ InstancesInterns ]:
+    ''' Returns canonical instances of class, if it interns them. '''
+    return cls.__dict__.get( interns_name )
+
+
+def intern_instances(
+    counterpart: type
+) -> __.cabc.Callable[ [ type[ _nomina.T ] ], type[ _nomina.T ] ]:
+    ''' Produces decorator for interning variant of dataclass metaclass.
+
+        Instantiation of classes of the variant returns the canonical
+        instance for the values of compared fields, if one is alive.
+        Subclasses inherit interning, with tables of their own, unless they
+        disable it. Classes which cannot otherwise be weakly referenced gain
+        a base which allows it.
+    '''
+    def decorate( clscls: type[ _nomina.T ] ) -> type[ _nomina.T ]:
+        constructor = clscls.__new__
+        caller = clscls.__call__
+
+        def construct(
+            clscls_: type[ _nomina.T ],
+            name: str,
+            bases: tuple[ type, ... ],
+            namespace: dict[ str, __.typx.Any ], *,
+            instances_interned: __.typx.Optional[ bool ] = None,
+            **arguments: __.typx.Any,
+        ) -> type:
+            if instances_interned is None:
+                instances_interned = any(
+                    getattr( base, interns_name, None ) is not None
+                    for base in bases )
+            if instances_interned and not _is_protocol( bases ):
+                bases = _ensure_weak_referability( bases )
+            cls = constructor( clscls_, name, bases, namespace, **arguments )
+            interns = None
+            if instances_interned:
+                interns = InstancesInterns(
+                    _survey_compared_fields( cls ),
+                    expeditable = _is_expeditable( cls, namespace ) )
+                _install_reproducers( cls, namespace )
+            # Class is immutable after construction; bypass enforcement.
+            type.__setattr__( cls, interns_name, interns )
+            return cls
+
+        def call(
+            cls: type, *posargs: __.typx.Any, **nomargs: __.typx.Any
+        ) -> __.typx.Any:
+            interns = getattr( cls, interns_name, None )
+            if interns is None: return caller( cls, *posargs, **nomargs )
+            return interns.produce( cls, caller, posargs, nomargs )
+
+        setattr( clscls, '__new__', construct )
+        setattr( clscls, '__call__', call )
+        # Else, signature of interception would mask that of initializer.
+        setattr( clscls, '__signature__', property( _calculate_signature ) )
+        _variants[ counterpart ] = clscls
+        return clscls
+
+    return decorate
+
+
+def restore_instance(
+    cls: type[ _nomina.U ], values: __.cabc.Mapping[ str, __.typx.Any ]
+) -> _nomina.U:
+    ''' Restores instance of dataclass from values of its fields.
+
+        Instances of classes, which intern them, are canonical instances.
+        Unpickling and deep copying of interned instances pass through here.
+    '''
+    from .trusts import produce_trusted_constructor
+    return produce_trusted_constructor( cls )( **values )
+
+
+interns_name = _nomina.calculate_attrname( 'class', 'instances_interns' )
+
+
+_variants: dict[ type, type ] = { }
+
+
+class _WeaklyReferable:
+    ''' Allows weak references to instances of slotted dataclasses. '''
+
+    __slots__ = ( '__weakref__', )
+
+
+def _calculate_signature( cls: type ) -> __.inspect.Signature:
+    ''' Calculates signature of class from its initializer. '''
+    signature = __.inspect.signature( cls.__init__ )
+    return signature.replace(
+        parameters = tuple( signature.parameters.values( ) )[ 1: ] )
+
+
+def _ensure_weak_referability(
+    bases: tuple[ type, ... ]
+) -> tuple[ type, ... ]:
+    ''' Adds base which allows weak references, if none does. '''
+    if any( base.__weakrefoffset__ for base in bases ): return bases
+    return ( *bases, _WeaklyReferable )
+
+
+def _capture_values( instance: __.typx.Any ) -> dict[ str, __.typx.Any ]:
+    ''' Captures values of fields of dataclass instance. '''
+    values: dict[ str, __.typx.Any ] = { }
+    for field in __.dcls.fields( instance ):
+        name = field.name
+        if name == _behaviors.instance_behaviors_name: continue
+        try: values[ name ] = getattr( instance, name )
+        except AttributeError: continue
+    return values
+
+
+def _copy( self: _nomina.U ) -> _nomina.U:
+    ''' Returns instance itself, as it is immutable. '''
+    return self
+
+
+def _deepcopy(
+    self: _nomina.U, memo: dict[ int, __.typx.Any ]
+) -> _nomina.U:
+    ''' Returns instance itself, if canonical; else, restores deep copy.
+
+        Instances with unhashable values are not canonical and their values
+        are copied.
+    '''
+    interns = access_instances_interns( type( self ) )
+    if interns is not None and interns.is_canonical( self ): return self
+    return restore_instance(
+        type( self ), __.copy.deepcopy( _capture_values( self ), memo ) )
+
+
+def _install_reproducers(
+    cls: type, namespace: __.cabc.Mapping[ str, __.typx.Any ]
+) -> None:
+    ''' Installs copiers and reducer which preserve canonical instances.
+
+        Hooks, which are defined by the class body, are retained.
+    '''
+    for name, hook in (
+        ( '__copy__', _copy ),
+        ( '__deepcopy__', _deepcopy ),
+        ( '__reduce__', _reduce ),
+    ):
+        if name in namespace: continue
+        # Class is immutable after construction; bypass enforcement.
+        type.__setattr__( cls, name, hook )
+
+
+def _is_expeditable(
+    cls: type, namespace: __.cabc.Mapping[ str, __.typx.Any ]
+) -> bool:
+    ''' Can canonical instances be found from arguments alone?
+
+        Only if the generated initializer stores every compared field from
+        its argument of the same name, without further processing, such as
+        conversion or validation.
+    '''
+    if '__init__' in namespace or hasattr( cls, '__post_init__' ):
+        return False
+    if _fields.survey_fields_processors( cls ): return False
+    return all(
+        field.init and field.kw_only # pyright: ignore
+        for field in __.dcls.fields( cls ) # pyright: ignore
+        if field.compare )
+
+
+def _is_protocol( bases: tuple[ type, ... ] ) -> bool:
+    ''' Is class with bases a protocol class? '''
+    return __.typx.Protocol in bases
+
+
+def _produce_keyer(
+    names: __.cabc.Sequence[ str ], access_template: str
+) -> __.cabc.Callable[ [ __.typx.Any ], tuple[ __.typx.Any, ... ] ]:
+    ''' Generates function which calculates keys of canonical instances.
+
+        Keys hold the compared field values followed by their types, so that,
+        e.g., 1 and True are not conflated. Accesses are unrolled, as
+        iteration over names measured about twice as slow.
+    '''
+    values = [ f"v{i}" for i in range( len( names ) ) ]
+    lines = [
+        f"{value} = {access_template.format( name = name )}"
+        for value, name in zip( values, names ) ]
+    entries = ( *values, *( f"type( {value} )" for value in values ) )
+    lines.append( f"return ( {', '.join( entries )} )" )
+    body = '\n'.join( f"    {line}" for line in lines )
+    namespace: dict[ str, __.typx.Any ] = { }
+    exec( f"def calculate( source ):\n{body}\n", namespace ) # noqa: S102
+    return namespace[ 'calculate' ]
+
+
+def _reduce( self: __.typx.Any ) -> tuple[ __.typx.Any, ... ]:
+    ''' Reduces instance to values of its fields, for pickling.
+
+        Unpickling restores the canonical instance for the values.
+    '''
+    return ( restore_instance, ( type( self ), _capture_values( self ) ) )
+
+
+def _survey_compared_fields( cls: type ) -> tuple[ str, ... ]:
+    ''' Returns names of fields which participate in comparisons. '''
+    return tuple(
+        field.name for field in __.dcls.fields( cls ) # pyright: ignore
+        if field.compare )
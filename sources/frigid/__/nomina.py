@@ -76,3 +76,23 @@ package_name = __name__.split( '.', maxsplit = 1 )[ 0 ]
 
 def calculate_attrname( level: str, core: str ) -> str:
     return f"_{package_name}_{level}_{core}_"
+
+
+def mangle_attrname( cls: type, name: str ) -> str:
+    ''' Mangles attribute name so that it is unique to class.
+
+        Memoizes results of Classcore name mangling, which hashes the
+        qualified name of the class upon every call.
+    '''
+    key = ( id( cls ), cls.__module__, cls.__qualname__, name )
+    name_m = _mangled_names.get( key )
+    if name_m is None:
+        # Entries of discarded classes are flushed with all others.
+        if len( _mangled_names ) >= _mangled_names_limit:
+            _mangled_names.clear( )
+        name_m = _mangled_names[ key ] = __.ccutils.mangle_name( cls, name )
+    return name_m
+
+
+_mangled_names: dict[ tuple[ int, str, str, str ], str ] = { }
+_mangled_names_limit = 4096
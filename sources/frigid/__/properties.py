@@ -0,0 +1,150 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Cached properties: values computed once per immutable instance. '''
+
+# ruff: noqa: F811
+
+
+from . import imports as __
+from . import nomina as _nomina
+from . import slots as _slots
+
+
+class CachedProperty( __.typx.Generic[ _nomina.V ] ):
+    ''' Property which computes its value once per instance.
+
+        Unlike :py:class:`functools.cached_property`, stores values without
+        assigning attributes, which would violate instance immutability.
+        Values are stored in concealed slots, which the metaclasses allocate
+        for slotted classes, or else in the instance dictionaries, under the
+        names of the properties, so that later accesses bypass the property.
+        Either way, the values cannot be reassigned or deleted afterwards on
+        immutable instances.
+    '''
+
+    def __init__(
+        self, function: __.cabc.Callable[ [ __.typx.Any ], _nomina.V ]
+    ) -> None:
+        self.function = function
+        self.name: __.typx.Optional[ str ] = None
+        self.storage_name: __.typx.Optional[ str ] = None
+        self.__doc__ = function.__doc__
+        self.__module__ = function.__module__
+
+    def __set_name__( self, owner: type, name: str ) -> None:
+        # Reproductions of classes, such as for slots, set names again.
+        if self.name is None:
+            self.name = name
+            self.storage_name = calculate_cache_attrname( name )
+        elif name != self.name:
+            from .exceptions import PropertyCacheInvalidity
+            raise PropertyCacheInvalidity(
+                name, f"Already assigned to {self.name!r}." )
+
+    @__.typx.overload
+    def __get__(
+        self, instance: None, owner: __.typx.Optional[ type ] = None
+    ) -> __.typx.Self: ...
+
+    @__.typx.overload
+    def __get__(
+        self, instance: object, owner: __.typx.Optional[ type ] = None
+    ) -> _nomina.V: ...
+
+    def __get__(
+        self,
+        instance: __.typx.Optional[ object ],
+        owner: __.typx.Optional[ type ] = None,
+    ) -> __.typx.Any:
+        if instance is None: return self
+        storage_name = self.storage_name
+        if storage_name is None:
+            from .exceptions import PropertyCacheInvalidity
+            raise PropertyCacheInvalidity(
+                self.function.__name__, "Not assigned to class attribute." )
+        try: return getattr( instance, storage_name )
+        except AttributeError: pass
+        value = self.function( instance )
+        descriptor = _slots.discover_slot( type( instance ), storage_name )
+        if descriptor is not None:
+            descriptor.__set__( instance, value )
+            return value
+        try: attributes = instance.__dict__
+        except AttributeError:
+            from .exceptions import PropertyCacheInvalidity
+            raise PropertyCacheInvalidity(
+                __.typx.cast( str, self.name ),
+                "No slot or instance dictionary." ) from None
+        # Shadows property on later accesses, as it is not a data descriptor.
+        attributes[ __.typx.cast( str, self.name ) ] = value
+        return value
+
+
+def allocate_cached_properties(
+    clscls: type[ _nomina.T ]
+) -> type[ _nomina.T ]:
+    ''' Wraps metaclass constructor to allocate slots for cached properties.
+
+        Slots are allocated for cached properties in namespaces which declare
+        slots, including slotted reproductions by the dataclass decorator,
+        unless bases already allocate them.
+    '''
+    constructor = clscls.__new__
+
+    def construct(
+        clscls_: type[ _nomina.T ],
+        name: str,
+        bases: tuple[ type, ... ],
+        namespace: dict[ str, __.typx.Any ],
+        **arguments: __.typx.Any,
+    ) -> type:
+        slots = namespace.get( '__slots__' )
+        if slots is not None and not isinstance( slots, str ):
+            names = tuple(
+                value.storage_name or calculate_cache_attrname( name_ )
+                for name_, value in namespace.items( )
+                if isinstance( value, CachedProperty ) )
+            names = tuple(
+                name_ for name_ in names if name_ not in slots and not any(
+                    _slots.discover_slot( base, name_ ) for base in bases ) )
+            if names: namespace[ '__slots__' ] = _extend_slots( slots, names )
+        return constructor( clscls_, name, bases, namespace, **arguments )
+
+    setattr( clscls, '__new__', construct )
+    return clscls
+
+
+def calculate_cache_attrname( name: str ) -> str:
+    ''' Calculates name of concealed slot for value of cached property. '''
+    return _nomina.calculate_attrname( 'instance', f"cached_{name}" )
+
+
+def _extend_slots(
+    slots: __.cabc.Iterable[ str ] | __.cabc.Mapping[ str, __.typx.Any ],
+    names: __.cabc.Sequence[ str ],
+) -> tuple[ str, ... ] | __.types.MappingProxyType[ str, __.typx.Any ]:
+    ''' Extends slots declaration with additional names. '''
+    if isinstance( slots, __.cabc.Mapping ):
+        slots_ = dict( slots )
+        slots_.update( dict.fromkeys( names, 'Cached property value.' ) )
+        return __.types.MappingProxyType( slots_ )
+    return ( *slots, *names )
@@ -0,0 +1,275 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Row constructions: dataclass instances in bulk from rows of values. '''
+
+
+from . import behaviors as _behaviors
+from . import imports as __
+from . import nomina as _nomina
+
+
+ErrorClassProvider: __.typx.TypeAlias = (
+    __.cabc.Callable[ [ str ], type[ Exception ] ] )
+RowsConstructor: __.typx.TypeAlias = __.cabc.Callable[
+    [ __.cabc.Iterator[ __.typx.Any ] ], __.cabc.Iterator[ __.typx.Any ] ]
+
+
+def construct_from_rows(
+    cls: type[ _nomina.U ],
+    rows: __.cabc.Iterable[
+        __.cabc.Sequence[ __.typx.Any ]
+        | __.cabc.Mapping[ str, __.typx.Any ] ],
+    names: __.typx.Optional[ tuple[ str, ... ] ],
+    error_class_provider: ErrorClassProvider,
+) -> __.cabc.Iterator[ _nomina.U ]:
+    ''' Constructs instances of dataclass from rows of values, lazily.
+
+        Constructors are generated per class and names upon first use and
+        then retained by the class.
+    '''
+    constructors = cls.__dict__.get( constructors_name )
+    if constructors is None:
+        constructors = { }
+        # Class is immutable after construction; bypass enforcement.
+        type.__setattr__( cls, constructors_name, constructors )
+    constructor = constructors.get( names )
+    if constructor is None:
+        constructor = (
+            _produce_constructor( cls, names )
+            or _produce_constructor_general(
+                cls, names, error_class_provider ) )
+        constructors[ names ] = constructor
+    return constructor( iter( rows ) )
+
+
+constructors_name = _nomina.calculate_attrname( 'class', 'rows_constructors' )
+
+
+def _produce_constructor(
+    cls: type, names: __.typx.Optional[ tuple[ str, ... ] ]
+) -> __.typx.Optional[ RowsConstructor ]:
+    ''' Generates constructor which unrolls initialization into loop.
+
+        Returns nothing unless the class has a specialized dataclass
+        initializer and is instantiated by the standard type call and object
+        allocator, or if names do not match parameters of initializer. Such
+        cases are constructed by instantiation of the class instead, which
+        raises the customary errors.
+    '''
+    if not _behaviors.is_dataclass_initializer_specialized( cls ): return None
+    if type( cls ).__call__ is not type.__call__: return None
+    if cls.__new__ is not object.__new__: return None
+    initializer = cls.__dict__[ '__init__' ]
+    globals_ = initializer.__globals__
+    error_class_provider = globals_[ '__frigid_provide_error__' ]
+    namespace: dict[ str, __.typx.Any ] = {
+        '__frigid_activate__': globals_[ '__frigid_activate__' ],
+        '__frigid_behaviors__': globals_[ '__frigid_behaviors__' ],
+        '__frigid_class__': cls,
+        '__frigid_dict__': dict,
+        '__frigid_isinstance__': isinstance,
+        '__frigid_len__': len,
+        '__frigid_list__': list,
+        '__frigid_mapping__': __.cabc.Mapping,
+        '__frigid_new__': object.__new__,
+        '__frigid_tuple__': tuple,
+        '__frigid_type__': type,
+    }
+    initialization = _behaviors.produce_dataclass_initialization(
+        cls, initializer.__wrapped__, '__frigid_instance__', namespace,
+        error_class_provider )
+    if initialization is None: return None
+    parameters, _, lines = initialization
+    acquisitions = _produce_acquisitions(
+        parameters, names, namespace, error_class_provider )
+    if acquisitions is None: return None
+    mappings, sequences = acquisitions
+    mappings_ = [ f"        {line}" for line in mappings ]
+    sequences_ = [ f"        {line}" for line in sequences ]
+    # Exact types are tested first, as abstract types are slow to test.
+    body = [
+        "for __frigid_row__ in __frigid_rows__:",
+        "    __frigid_kind__ = __frigid_type__( __frigid_row__ )",
+        "    if __frigid_kind__ is __frigid_dict__:", *mappings_,
+        "    elif (  __frigid_kind__ is __frigid_tuple__",
+        "         or __frigid_kind__ is __frigid_list__",
+        "    ):", *sequences_,
+        "    elif __frigid_isinstance__(",
+        "        __frigid_row__, __frigid_mapping__",
+        "    ):", *mappings_,
+        "    else:", *sequences_,
+        "    __frigid_instance__ = __frigid_new__( __frigid_class__ )",
+        *( f"    {line}" for line in lines ),
+        "    __frigid_activate__( __frigid_instance__, __frigid_behaviors__ )",
+        "    yield __frigid_instance__",
+    ]
+    source = "def construct( __frigid_rows__ ):\n{}\n".format(
+        '\n'.join( f"    {line}" for line in body ) )
+    exec( source, namespace ) # noqa: S102
+    function = namespace[ 'construct' ]
+    function.__qualname__ = f"{cls.__qualname__}.__construct_rows__"
+    return function
+
+
+def _produce_constructor_general(
+    cls: type,
+    names: __.typx.Optional[ tuple[ str, ... ] ],
+    error_class_provider: ErrorClassProvider,
+) -> RowsConstructor:
+    ''' Produces constructor which instantiates class for each row. '''
+    parameters = __.inspect.signature( cls ).parameters
+    names_ = tuple( parameters ) if names is None else names
+    required = frozenset(
+        name for name in names_ if name in parameters
+        and parameters[ name ].default is parameters[ name ].empty )
+    verify = _produce_mapping_verifier(
+        names_, required, error_class_provider )
+    complete = _produce_sequence_completer(
+        names_, required, ( ), error_class_provider )
+
+    def construct(
+        rows: __.cabc.Iterator[ __.typx.Any ]
+    ) -> __.cabc.Iterator[ __.typx.Any ]:
+        for row in rows:
+            if isinstance( row, __.cabc.Mapping ):
+                verify( row )
+                yield cls( **row )
+            else: yield cls( **dict( zip( names_, complete( row ) ) ) )
+
+    construct.__qualname__ = f"{cls.__qualname__}.__construct_rows__"
+    return construct
+
+
+def _produce_acquisitions(
+    parameters: __.cabc.Sequence[ __.inspect.Parameter ],
+    names: __.typx.Optional[ tuple[ str, ... ] ],
+    namespace: dict[ str, __.typx.Any ],
+    error_class_provider: ErrorClassProvider,
+) -> __.typx.Optional[ tuple[ list[ str ], list[ str ] ] ]:
+    ''' Produces acquisitions of parameters from mapping and sequence rows.
+
+        Parameters become local variables of the generated loop, as the
+        body of the initialization refers to them. Named parameters without
+        defaults are required of mapping rows; other names are optional.
+        Sequence rows may omit trailing values which have defaults. Returns
+        nothing if any name is not a parameter or if any parameter without
+        default is not named.
+    '''
+    parameters_ = { parameter.name: parameter for parameter in parameters }
+    names_ = tuple( parameters_ ) if names is None else names
+    if len( frozenset( names_ ) ) != len( names_ ): return None
+    if not frozenset( names_ ) <= parameters_.keys( ): return None
+    required = frozenset(
+        name for name in names_
+        if parameters_[ name ].default is parameters_[ name ].empty )
+    namespace[ '__frigid_verify__' ] = _produce_mapping_verifier(
+        names_, required, error_class_provider )
+    namespace[ '__frigid_complete__' ] = _produce_sequence_completer(
+        names_, required,
+        tuple( parameters_[ name ].default for name in names_ ),
+        error_class_provider )
+    namespace[ '__frigid_lookup_error__' ] = KeyError
+    count = len( names_ )
+    partials = [ "__frigid_verify__( __frigid_row__ )" ]
+    defaults: list[ str ] = [ ]
+    for name, parameter in parameters_.items( ):
+        default = f"__frigid_default_{name}__"
+        if name in required:
+            partials.append( f"{name} = __frigid_row__[ {name!r} ]" )
+        elif name in names_:
+            partials.append(
+                f"{name} = __frigid_row__.get( {name!r}, {default} )" )
+        elif parameter.default is parameter.empty: return None
+        else: defaults.append( f"{name} = {default}" )
+    # Mappings with as many entries as names are acquired by subscription
+    # alone, since any absent name then implies an unknown name.
+    mappings = [
+        f"if __frigid_len__( __frigid_row__ ) == {count}:",
+        "    try:",
+        *( f"        {name} = __frigid_row__[ {name!r} ]"
+           for name in names_ ),
+        "    except __frigid_lookup_error__:",
+        "        __frigid_verify__( __frigid_row__ )",
+        "        raise",
+        "else:", *( f"    {line}" for line in partials ),
+        *defaults,
+    ] if names_ else [ *partials, *defaults ]
+    sequences = [
+        f"if __frigid_len__( __frigid_row__ ) != {count}:",
+        "    __frigid_row__ = __frigid_complete__( __frigid_row__ )",
+        *defaults,
+    ]
+    targets = f"( {', '.join( names_ )}, )" if names_ else "( )"
+    sequences.append( f"{targets} = __frigid_row__" )
+    return mappings, sequences
+
+
+def _produce_mapping_verifier(
+    names: tuple[ str, ... ],
+    required: frozenset[ str ],
+    error_class_provider: ErrorClassProvider,
+) -> __.cabc.Callable[ [ __.cabc.Mapping[ str, __.typx.Any ] ], None ]:
+    ''' Produces verifier of names in mapping rows.
+
+        Raises error for any absent name without default or unknown name.
+    '''
+    names_ = frozenset( names )
+
+    def verify( row: __.cabc.Mapping[ str, __.typx.Any ] ) -> None:
+        absent = [
+            name for name in names if name in required and name not in row ]
+        unknown = [ name for name in row if name not in names_ ]
+        if absent or unknown:
+            raise error_class_provider( 'NamesInvalidity' )( absent, unknown )
+
+    return verify
+
+
+def _produce_sequence_completer(
+    names: tuple[ str, ... ],
+    required: frozenset[ str ],
+    defaults: tuple[ __.typx.Any, ... ],
+    error_class_provider: ErrorClassProvider,
+) -> __.cabc.Callable[
+    [ __.cabc.Iterable[ __.typx.Any ] ], tuple[ __.typx.Any, ... ]
+]:
+    ''' Produces completer of sequence rows with defaults of omitted values.
+
+        Raises error for rows with more values than names or without values
+        for all required names. Without defaults, completed rows only have
+        the values which they supplied.
+    '''
+    total = len( names )
+    minimum = max(
+        ( index + 1 for index, name in enumerate( names )
+          if name in required ), default = 0 )
+
+    def complete(
+        row: __.cabc.Iterable[ __.typx.Any ]
+    ) -> tuple[ __.typx.Any, ... ]:
+        values = tuple( row )
+        count = len( values )
+        if not minimum <= count <= total:
+            raise error_class_provider( 'ValuesCountInvalidity' )(
+                total, count )
+        return ( *values, *defaults[ count: ] )
+
+    return complete
@@ -0,0 +1,218 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Instance slots: derivation from class namespaces. '''
+
+
+from . import imports as __
+from . import nomina as _nomina
+
+
+def accept_instances_slotting(
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> __.cabc.Callable[ [ type[ _nomina.T ] ], type[ _nomina.T ] ]:
+    ''' Produces decorator to accept 'instances_slotted' argument.
+
+        The decorator wraps the metaclass constructor. If the argument is
+        true and the class namespace does not declare ``__slots__``, then
+        slots are derived from the namespace before the class is
+        constructed. Standard behaviors then allocate their own slot
+        alongside the derived ones.
+    '''
+    def decorate( clscls: type[ _nomina.T ] ) -> type[ _nomina.T ]:
+        constructor = clscls.__new__
+
+        def construct(
+            clscls_: type[ _nomina.T ],
+            name: str,
+            bases: tuple[ type, ... ],
+            namespace: dict[ str, __.typx.Any ], *,
+            instances_slotted: bool = False,
+            **arguments: __.typx.Any,
+        ) -> type:
+            if instances_slotted and '__slots__' not in namespace:
+                namespace[ '__slots__' ] = derive_instances_slots(
+                    bases, namespace, error_class_provider )
+            return constructor(
+                clscls_, name, bases, namespace, **arguments )
+
+        setattr( clscls, '__new__', construct )
+        return clscls
+
+    return decorate
+
+
+def deduplicate_behaviors_slot(
+    clscls: type[ _nomina.T ]
+) -> type[ _nomina.T ]:
+    ''' Wraps metaclass constructor to omit inherited behaviors slot.
+
+        Standard behaviors add their slot to any class which declares
+        ``__slots__``, even if a base already provides it. Must be applied
+        before standard behaviors, which call the wrapped constructor after
+        they add the slot.
+    '''
+    original = clscls.__dict__.get( '__new__' )
+
+    def construct(
+        clscls_: type[ _nomina.T ],
+        name: str,
+        bases: tuple[ type, ... ],
+        namespace: dict[ str, __.typx.Any ],
+        **arguments: __.typx.Any,
+    ) -> type:
+        slots = namespace.get( '__slots__' )
+        if (    isinstance( slots, ( __.cabc.Mapping, tuple, list ) )
+            and _behaviors_name in slots
+            and _behaviors_name in _collect_inherited_slots( bases )
+        ):
+            namespace[ '__slots__' ] = tuple(
+                name_ for name_ in slots if name_ != _behaviors_name )
+        if original is None:
+            return super( clscls, clscls_ ).__new__( # pyright: ignore
+                clscls_, name, bases, namespace, **arguments )
+        return original( clscls_, name, bases, namespace, **arguments )
+
+    setattr( clscls, '__new__', construct )
+    return clscls
+
+
+def discover_slot(
+    cls: type, name: str
+) -> __.typx.Optional[ __.types.MemberDescriptorType ]:
+    ''' Discovers slot descriptor for attribute in MRO of class.
+
+        Nearest definition of attribute prevails. Absent, if it is not a slot.
+    '''
+    for base in cls.__mro__:
+        descriptor = base.__dict__.get( name )
+        if descriptor is None: continue
+        if isinstance( descriptor, __.types.MemberDescriptorType ):
+            return descriptor
+        return None
+    return None
+
+
+def derive_instances_slots(
+    bases: __.cabc.Sequence[ type ],
+    namespace: __.cabc.Mapping[ str, __.typx.Any ],
+    error_class_provider: __.cabc.Callable[ [ str ], type[ Exception ] ],
+) -> tuple[ str, ... ]:
+    ''' Derives names of instance slots from class namespace.
+
+        Names are taken from annotations, other than class variables, and
+        from attributes assigned on the instance by the initializer. Only
+        the initializer of the class itself is surveyed; attributes, which
+        are assigned by other methods, must be declared by annotations.
+        Names with class-level values and names already slotted by bases
+        are excluded. Names with class-level values, other than data
+        descriptors, which the initializer assigns cannot be slotted and are
+        rejected. Bases, whose instances have attributes dictionaries, are
+        rejected, since instances would still have such dictionaries.
+    '''
+    for base in bases:
+        if not base.__dictoffset__: continue
+        raise error_class_provider( 'InstancesSlottingFailure' )(
+            _describe_class( namespace ), base.__qualname__ )
+    names: dict[ str, None ] = { }
+    for name, annotation in _access_annotations( namespace ).items( ):
+        if _is_class_variable( annotation ): continue
+        names[ name ] = None
+    initializer = namespace.get( '__init__' )
+    if initializer is not None:
+        for name in _survey_assignments( initializer ):
+            if name not in namespace:
+                names[ name ] = None
+                continue
+            # Data descriptors, such as properties, handle assignments.
+            if hasattr( type( namespace[ name ] ), '__set__' ): continue
+            raise error_class_provider( 'SlotDerivationFailure' )(
+                _describe_class( namespace ), name )
+    inherited = _collect_inherited_slots( bases )
+    return tuple(
+        name for name in names
+        if name not in namespace and name not in inherited )
+
+
+_behaviors_name = _nomina.calculate_attrname( 'instance', 'behaviors' )
+_class_variable_regex = __.re.compile( r'''^(?:\w+\.)*ClassVar\b''' )
+_slots_special = frozenset( ( '__dict__', '__weakref__' ) )
+
+
+def _access_annotations(
+    namespace: __.cabc.Mapping[ str, __.typx.Any ]
+) -> __.cabc.Mapping[ str, __.typx.Any ]:
+    ''' Accesses annotations from class namespace. '''
+    annotations = namespace.get( '__annotations__' )
+    if annotations is not None: return annotations
+    annotate = namespace.get( '__annotate__' )
+    if annotate is None: return { }
+    # Python 3.14+: annotations are evaluated lazily.
+    import annotationlib # pragma: no cover
+    return annotationlib.call_annotate_function( # pragma: no cover
+        annotate, annotationlib.Format.FORWARDREF )
+
+
+def _collect_inherited_slots( bases: __.cabc.Sequence[ type ] ) -> set[ str ]:
+    ''' Collects names of slots, which are declared by bases. '''
+    names = set( _slots_special )
+    for base in bases:
+        for class_ in base.__mro__:
+            slots = class_.__dict__.get( '__slots__', ( ) )
+            if isinstance( slots, str ): slots = ( slots, )
+            names.update( slots )
+    return names
+
+
+def _describe_class( namespace: __.cabc.Mapping[ str, __.typx.Any ] ) -> str:
+    ''' Describes class under construction from its namespace. '''
+    mname = namespace.get( '__module__' )
+    qname = namespace.get( '__qualname__', '<unknown>' )
+    return f"{mname}.{qname}" if mname else qname
+
+
+def _is_class_variable( annotation: __.typx.Any ) -> bool:
+    ''' Is annotation of class variable? '''
+    if isinstance( annotation, str ):
+        return _class_variable_regex.match( annotation ) is not None
+    if annotation is __.typx.ClassVar: return True
+    return __.typx.get_origin( annotation ) is __.typx.ClassVar
+
+
+def _survey_assignments( initializer: __.typx.Any ) -> __.cabc.Iterator[ str ]:
+    ''' Surveys names of attributes assigned on instance by initializer.
+
+        Inspects bytecode for attribute stores on the first argument.
+    '''
+    import dis
+    code = getattr( __.inspect.unwrap( initializer ), '__code__', None )
+    if code is None or not code.co_argcount: return
+    self_name = code.co_varnames[ 0 ]
+    loads: tuple[ str, ... ] = ( )
+    for instruction in dis.get_instructions( code ):
+        if (    instruction.opname == 'STORE_ATTR'
+            and loads[ -1: ] == ( self_name, )
+        ): yield instruction.argval
+        # Superinstructions may load several locals at once.
+        if instruction.opname.startswith( 'LOAD_FAST' ):
+            argval = instruction.argval
+            loads = argval if isinstance( argval, tuple ) else ( argval, )
+        else: loads = ( )
@@ -0,0 +1,126 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Trusted constructions: dataclass instances from verified field values. '''
+
+
+from . import behaviors as _behaviors
+from . import imports as __
+from . import interns as _interns
+from . import nomina as _nomina
+from . import slots as _slots
+
+
+def produce_trusted_constructor(
+    cls: type[ _nomina.U ]
+) -> __.cabc.Callable[ ..., _nomina.U ]:
+    ''' Produces constructor of dataclass instances from trusted values.
+
+        The constructor is generated upon first request and retained by the
+        class.
+    '''
+    constructor = cls.__dict__.get( constructor_name )
+    if constructor is None:
+        constructor = _produce_constructor( cls )
+        # Class is immutable after construction; bypass enforcement.
+        type.__setattr__( cls, constructor_name, constructor )
+    return constructor
+
+
+constructor_name = _nomina.calculate_attrname( 'class', 'trusted_constructor' )
+
+
+_omission = object( ) # Distinct from any value of any field.
+
+
+def _produce_constructor(
+    cls: type
+) -> __.cabc.Callable[ ..., __.typx.Any ]:
+    ''' Generates constructor which assigns fields from its arguments.
+
+        Fields become keyword-only parameters, so that unknown and missing
+        fields are reported as for any function. Slotted fields and behaviors
+        are assigned via their slot descriptors; others via the assignment
+        of objects.
+    '''
+    namespace: dict[ str, __.typx.Any ] = {
+        '__frigid_behaviors__': _behaviors.calculate_instance_behaviors( cls ),
+        '__frigid_class__': cls,
+        '__frigid_new__': cls.__new__,
+        '__frigid_setattr__': object.__setattr__,
+    }
+    activator = _slots.discover_slot( cls, _behaviors.instance_behaviors_name )
+    namespace[ '__frigid_activate__' ] = (
+        _behaviors.activate_instance_behaviors if activator is None
+        else activator.__set__ )
+    parameters: list[ str ] = [ ]
+    lines = [ "__frigid_instance__ = __frigid_new__( __frigid_class__ )" ]
+    for field in __.dcls.fields( cls ): # pyright: ignore
+        if field.name == _behaviors.instance_behaviors_name: continue
+        parameters.append(
+            _produce_field_assignment( cls, field, lines, namespace ) )
+    lines.append(
+        "__frigid_activate__( __frigid_instance__, __frigid_behaviors__ )" )
+    interns = _interns.access_instances_interns( cls )
+    if interns is None: lines.append( "return __frigid_instance__" )
+    else:
+        namespace[ '__frigid_intern__' ] = interns.intern
+        lines.append( "return __frigid_intern__( __frigid_instance__ )" )
+    signature = ', '.join( ( '*', *parameters ) ) if parameters else ''
+    body = '\n'.join( f"    {line}" for line in lines )
+    exec( # noqa: S102
+        f"def construct( {signature} ):\n{body}\n", namespace )
+    function = namespace[ 'construct' ]
+    function.__qualname__ = f"{cls.__qualname__}.__construct_trusted__"
+    return function
+
+
+def _produce_field_assignment(
+    cls: type,
+    field: __.dcls.Field[ __.typx.Any ],
+    lines: list[ str ],
+    namespace: dict[ str, __.typx.Any ],
+) -> str:
+    ''' Produces assignment of field for generated constructor.
+
+        Appends lines to body of constructor and records defaults, default
+        factories, and assigners into its namespace. Returns parameter.
+    '''
+    name = field.name
+    if field.default_factory is not __.dcls.MISSING:
+        namespace[ f"__frigid_factory_{name}__" ] = field.default_factory
+        namespace[ '__frigid_omission__' ] = _omission
+        parameter = f"{name} = __frigid_omission__"
+        lines.append(
+            f"if {name} is __frigid_omission__: "
+            f"{name} = __frigid_factory_{name}__( )" )
+    elif field.default is not __.dcls.MISSING:
+        namespace[ f"__frigid_default_{name}__" ] = field.default
+        parameter = f"{name} = __frigid_default_{name}__"
+    else: parameter = name
+    descriptor = _slots.discover_slot( cls, name )
+    if descriptor is None:
+        lines.append(
+            f"__frigid_setattr__( __frigid_instance__, {name!r}, {name} )" )
+    else:
+        namespace[ f"__frigid_assign_{name}__" ] = descriptor.__set__
+        lines.append(
+            f"__frigid_assign_{name}__( __frigid_instance__, {name} )" )
+    return parameter
@@ -0,0 +1,182 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Visibility caches: memoized attribute surveys of concealing classes. '''
+
+
+from . import imports as __
+from . import nomina as _nomina
+
+
+class VisiblesCache:
+    ''' Sorted visible attribute names, keyed by namespace of surveyee.
+
+        Classes are immutable after construction and so have one entry.
+        Instances are keyed by the names in their attribute dictionaries,
+        which are empty for slotted instances, so that instances of the same
+        shape share an entry. Entries are flushed together once their number
+        reaches a limit.
+    '''
+
+    __slots__ = ( 'hits', 'misses', 'table' )
+
+    def __init__( self ) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.table: dict[ tuple[ str, ... ], tuple[ str, ... ] ] = { }
+
+    def record(
+        self, key: tuple[ str, ... ], names: __.cabc.Iterable[ str ]
+    ) -> tuple[ str, ... ]:
+        ''' Records names under key. Returns sorted names. '''
+        self.misses += 1
+        if len( self.table ) >= _entries_limit: self.table.clear( )
+        names_ = self.table[ key ] = tuple( sorted( names ) )
+        return names_
+
+
+def access_visibles_caches(
+    cls: type
+) -> tuple[ VisiblesCache, ... ]:
+    ''' Returns caches of visible attribute names for class and instances.
+    '''
+    return tuple(
+        cache for cache in (
+            cls.__dict__.get( classes_cache_name ),
+            cls.__dict__.get( instances_cache_name ) )
+        if cache is not None )
+
+
+def allocate_class_visibles_cache( cls: type ) -> None:
+    ''' Allocates cache of visible attribute names for class.
+
+        Only classes which conceal attributes receive caches. Names of
+        classes with total visibility are not filtered and are left uncached,
+        since concealed attributes may still be attached to such classes
+        after construction. Classes with mutable attributes are also left
+        uncached, since their attributes may change after construction.
+    '''
+    names = getattr(
+        cls, _nomina.calculate_attrname( 'class', 'visibles_names' ),
+        frozenset( ) )
+    if names == '*' or _has_mutables( cls, 'class' ): return
+    behaviors = getattr(
+        cls, _nomina.mangle_attrname( cls, _class_behaviors_name ),
+        frozenset( ) )
+    if _nomina.concealment_label not in behaviors: return
+    # Class is immutable after construction; bypass enforcement.
+    type.__setattr__( cls, classes_cache_name, VisiblesCache( ) )
+
+
+def produce_class_surveyor(
+    clscls: type, hook: __.cabc.Callable[ [ type ], __.typx.Any ]
+) -> __.cabc.Callable[ [ type ], list[ str ] ]:
+    ''' Produces class attributes surveyor specialized to metaclass.
+
+        Surveys of classes with caches are memoized. All others are
+        performed by the standard hook.
+    '''
+
+    def survey( cls: type ) -> list[ str ]:
+        cache = (
+            cls.__dict__.get( classes_cache_name )
+            if clscls is type( cls ) else None )
+        if cache is None: return hook( cls )
+        names = cache.table.get( ( ) )
+        if names is None: names = cache.record( ( ), hook( cls ) )
+        else: cache.hits += 1
+        return list( names )
+
+    return survey
+
+
+def produce_instances_surveyor(
+    cls: type, behaviors_name: str
+) -> __.cabc.Callable[ [ object ], list[ str ] ]:
+    ''' Produces instance attributes surveyor specialized to class.
+
+        Allocates cache of visible attribute names for instances of class.
+        Surveys of instances with active concealment are memoized by shape.
+        Modules which supply their own surveys are not memoized. Neither
+        are instances of classes with mutable attributes, whether on the
+        class or on its instances.
+    '''
+    successor = _discover_hook_successor( cls, '__dir__' )
+    cacheable = not (
+        _has_mutables( cls, 'class' ) or _has_mutables( cls, 'instances' ) )
+    cache = VisiblesCache( )
+    table = cache.table if cacheable else { }
+    modular = issubclass( cls, __.types.ModuleType )
+    core = __.ccstd.behaviors.survey_visible_attributes
+    concealment_label = _nomina.concealment_label
+
+    def survey( self: object ) -> list[ str ]:
+        # Only enforce behaviors at start of MRO.
+        if cls is not type( self ): return super( cls, self ).__dir__( )
+        if concealment_label not in getattr(
+            self, behaviors_name, _behaviors_empty
+        ): return successor( self )
+        namespace = getattr( self, '__dict__', None )
+        key = ( ) if namespace is None else tuple( namespace )
+        names = table.get( key )
+        if names is not None:
+            cache.hits += 1
+            return list( names )
+        names_ = core(
+            self,
+            ligation = __.funct.partial( successor, self ),
+            attributes_namer = _nomina.calculate_attrname,
+            level = 'instances' )
+        if not cacheable or ( modular and '__dir__' in key ):
+            return list( names_ )
+        return list( cache.record( key, names_ ) )
+
+    if cacheable:
+        # Class is immutable after construction; bypass enforcement.
+        type.__setattr__( cls, instances_cache_name, cache )
+    return survey
+
+
+classes_cache_name = _nomina.calculate_attrname( 'class', 'visibles_cache' )
+instances_cache_name = _nomina.calculate_attrname(
+    'instances', 'visibles_cache' )
+
+
+_behaviors_empty: frozenset[ str ] = frozenset( )
+_class_behaviors_name = _nomina.calculate_attrname( 'class', 'behaviors' )
+_entries_limit = 1024
+
+
+def _has_mutables( cls: type, level: str ) -> bool:
+    ''' Are any attributes at level of class declared mutable? '''
+    return any(
+        getattr( cls, _nomina.calculate_attrname( level, aspect ), ( ) )
+        for aspect in (
+            'mutables_names', 'mutables_predicates', 'mutables_regexes' ) )
+
+
+def _discover_hook_successor(
+    cls: type, hook_name: str
+) -> __.cabc.Callable[ ..., __.typx.Any ]:
+    ''' Discovers next hook in MRO of class. '''
+    for base in cls.__mro__[ 1: ]: # pragma: no branch
+        if hook_name in base.__dict__: return base.__dict__[ hook_name ]
+    return getattr( object, hook_name ) # pragma: no cover
@@ -32,15 +32,46 @@ from . import exceptions
 # --- END: Injected by Copier ---
 
 from .classes import *
-from .dictionaries import *
-from .installers import *
 from .modules import *
-from .namespaces import *
-from .sequences import *
+
+if __.typx.TYPE_CHECKING: # pragma: no cover
+    from .dictionaries import *
+    from .digests import *
+    from .installers import *
+    from .namespaces import *
+    from .sequences import *
 
 
 __version__: __.typx.Annotated[ str, __.ddoc.Visibilities.Reveal ]
 __version__ = '4.3a0'
 
 
+# Submodules, which are imported upon first access of them or their exports.
+_exports = __.types.MappingProxyType( {
+    'AbstractDictionary': 'dictionaries',
+    'Dictionary': 'dictionaries',
+    'DictionarySchema': 'dictionaries',
+    'InvalidEntriesTreatments': 'dictionaries',
+    'MergeConflictsPolicies': 'dictionaries',
+    'ValidatorDictionary': 'dictionaries',
+    'deep_merge': 'dictionaries',
+    'dictionaries': 'dictionaries',
+    'digest': 'digests',
+    'digests': 'digests',
+    'install': 'installers',
+    'installers': 'installers',
+    'Namespace': 'namespaces',
+    'namespaces': 'namespaces',
+    'one': 'sequences',
+    'sequences': 'sequences',
+} )
+__getattr__ = __.produce_exports_accessor( __name__, _exports )
+
+
 finalize_module( __name__, dynadoc_table = __.fragments, recursive = True )
+
+
+# Survey of names is bound after finalization, so that docstring
+# introspection does not load the lazily imported submodules.
+__dir__ = __.produce_exports_surveyor( __name__, _exports )
+__all__ = tuple( __dir__( ) )
@@ -32,6 +32,10 @@ abc_class_mutables = (
     '_abc_negative_cache_version',
     '_abc_registry',
 )
+cached_property = __.CachedProperty
+evolve = __.evolve
+FieldConverter = __.FieldConverter
+FieldValidator = __.FieldValidator
 is_public_identifier = __.is_public_identifier
 mutables_default = ( )
 visibles_default = ( is_public_identifier, )
@@ -42,22 +46,69 @@ def _provide_error_class( name: str ) -> type[ Exception ]:
     match name:
         case 'AttributeImmutability':
             from .exceptions import AttributeImmutability as error
+        case 'FieldInvalidity':
+            from .exceptions import FieldInvalidity as error
+        case 'InstancesSlottingFailure':
+            from .exceptions import InstancesSlottingFailure as error
+        case 'NamesInvalidity':
+            from .exceptions import NamesInvalidity as error
+        case 'SlotDerivationFailure':
+            from .exceptions import SlotDerivationFailure as error
+        case 'ValuesCountInvalidity':
+            from .exceptions import ValuesCountInvalidity as error
         case _:
             from .exceptions import ErrorProvideFailure
             raise ErrorProvideFailure( name, reason = 'Does not exist.' )
     return error
 
 
+class ClassFactoryExtraArguments(
+    __.ccstd.ClassFactoryExtraArguments, total = False
+):
+    ''' Extra arguments accepted by metaclasses for standard classes. '''
+
+    instances_slotted: bool
+
+
+class DataclassFactoryExtraArguments(
+    __.ccstd.ClassFactoryExtraArguments, total = False
+):
+    ''' Extra arguments accepted by metaclasses for frozen dataclasses. '''
+
+    instances_hash_cached: bool
+    instances_interned: bool
+
+
 _dataclass_core = __.dcls.dataclass( kw_only = True, slots = True )
-_dynadoc_configuration = (
-    __.ccstd.dynadoc.produce_dynadoc_configuration( table = __.fragments ) )
-_class_factory = __.funct.partial(
-    __.ccstd.class_factory,
+_dynadoc_configuration = __.produce_class_dynadoc_configuration( )
+# Configuration is resolved once and shared by all metaclasses.
+_class_decorator = __.ccstd.class_factory(
     attributes_namer = __.calculate_attrname,
     dynadoc_configuration = _dynadoc_configuration,
     error_class_provider = _provide_error_class )
 
 
+def _class_factory( ) -> __.ClassDecorator[ __.T ]:
+    ''' Produces decorator to apply standard behaviors to metaclass.
+
+        Also specializes class and instance attribute hooks to each
+        metaclass and class, respectively, allocates slots for cached
+        properties, and arranges deferred or precomputed docstrings, per
+        mode.
+    '''
+    def decorate( clscls: type[ __.T ] ) -> type[ __.T ]:
+        clscls = __.deduplicate_behaviors_slot( clscls )
+        clscls = __.accelerate_classes_behaviors( _class_decorator( clscls ) )
+        clscls = __.allocate_cached_properties( clscls )
+        clscls = __.accelerate_instances_behaviors(
+            clscls, error_class_provider = _provide_error_class )
+        clscls = __.defer_class_docstrings( clscls )
+        return __.restore_class_docstrings( clscls )
+
+    return decorate
+
+
+@__.accept_instances_slotting( error_class_provider = _provide_error_class )
 @_class_factory( )
 class Class( type ):
     ''' Metaclass for standard classes. '''
@@ -72,11 +123,14 @@ class Class( type ):
         bases: tuple[ type, ... ],
         namespace: dict[ str, __.typx.Any ], *,
         decorators: __.ClassDecorators[ __.T ] = ( ),
-        **arguments: __.typx.Unpack[ __.ccstd.ClassFactoryExtraArguments ],
+        **arguments: __.typx.Unpack[ ClassFactoryExtraArguments ],
     ) -> __.T:
         return super( ).__new__( clscls, name, bases, namespace )
 
 
+@__.accept_instances_interning
+@__.accept_instances_hash_caching
+@__.allocate_instances_digests
 @_class_factory( )
 @__.typx.dataclass_transform( frozen_default = True, kw_only_default = True )
 class Dataclass( type ):
@@ -93,11 +147,22 @@ class Dataclass( type ):
         bases: tuple[ type, ... ],
         namespace: dict[ str, __.typx.Any ], *,
         decorators: __.ClassDecorators[ __.T ] = ( ),
-        **arguments: __.typx.Unpack[ __.ccstd.ClassFactoryExtraArguments ],
+        **arguments: __.typx.Unpack[ DataclassFactoryExtraArguments ],
     ) -> __.T:
         return super( ).__new__( clscls, name, bases, namespace )
 
 
+@__.intern_instances( Dataclass )
+@__.accept_instances_hash_caching
+@__.allocate_instances_digests
+@_class_factory( )
+@__.typx.dataclass_transform( frozen_default = True, kw_only_default = True )
+class _DataclassInterned( Dataclass ):
+    ''' Metaclass for standard dataclasses with interned instances. '''
+
+    _dynadoc_fragments_ = Dataclass._dynadoc_fragments_
+
+
 @_class_factory( )
 @__.typx.dataclass_transform( kw_only_default = True )
 class DataclassMutable( type ):
@@ -119,6 +184,7 @@ class DataclassMutable( type ):
         return super( ).__new__( clscls, name, bases, namespace )
 
 
+@__.accept_instances_slotting( error_class_provider = _provide_error_class )
 @_class_factory( )
 class AbstractBaseClass( __.abc.ABCMeta ):
     ''' Metaclass for standard abstract base classes. '''
@@ -134,11 +200,12 @@ class AbstractBaseClass( __.abc.ABCMeta ):
         bases: tuple[ type, ... ],
         namespace: dict[ str, __.typx.Any ], *,
         decorators: __.ClassDecorators[ __.T ] = ( ),
-        **arguments: __.typx.Unpack[ __.ccstd.ClassFactoryExtraArguments ],
+        **arguments: __.typx.Unpack[ ClassFactoryExtraArguments ],
     ) -> __.T:
         return super( ).__new__( clscls, name, bases, namespace )
 
 
+@__.accelerate_instances_checks
 @_class_factory( )
 class ProtocolClass( type( __.typx.Protocol ) ):
     ''' Metaclass for standard protocol classes. '''
@@ -159,6 +226,10 @@ class ProtocolClass( type( __.typx.Protocol ) ):
         return super( ).__new__( clscls, name, bases, namespace )
 
 
+@__.accept_instances_interning
+@__.accept_instances_hash_caching
+@__.allocate_instances_digests
+@__.accelerate_instances_checks
 @_class_factory( )
 @__.typx.dataclass_transform( frozen_default = True, kw_only_default = True )
 class ProtocolDataclass( type( __.typx.Protocol ) ):
@@ -175,11 +246,25 @@ class ProtocolDataclass( type( __.typx.Protocol ) ):
         bases: tuple[ type, ... ],
         namespace: dict[ str, __.typx.Any ], *,
         decorators: __.ClassDecorators[ __.T ] = ( ),
-        **arguments: __.typx.Unpack[ __.ccstd.ClassFactoryExtraArguments ],
+        **arguments: __.typx.Unpack[ DataclassFactoryExtraArguments ],
     ) -> __.T:
         return super( ).__new__( clscls, name, bases, namespace )
 
 
+@__.intern_instances( ProtocolDataclass )
+@__.accept_instances_hash_caching
+@__.allocate_instances_digests
+@__.accelerate_instances_checks
+@_class_factory( )
+@__.typx.dataclass_transform( frozen_default = True, kw_only_default = True )
+class _ProtocolDataclassInterned( ProtocolDataclass ):
+    ''' Metaclass for standard protocol dataclasses with interned instances.
+    '''
+
+    _dynadoc_fragments_ = ProtocolDataclass._dynadoc_fragments_
+
+
+@__.accelerate_instances_checks
 @_class_factory( )
 @__.typx.dataclass_transform( kw_only_default = True )
 class ProtocolDataclassMutable( type( __.typx.Protocol ) ):
@@ -289,6 +374,116 @@ class DataclassProtocolMutable(
         'class instance conceal' )
 
 
+class InstancesInternsSurvey( DataclassObject ):
+    ''' Statistics on canonical instances of interned dataclass. '''
+
+    size: __.typx.Annotated[
+        int, __.ddoc.Doc( ''' Number of canonical instances alive. ''' ) ]
+    hits: __.typx.Annotated[
+        int, __.ddoc.Doc( ''' Instantiations which found existing ones. ''' ) ]
+    misses: __.typx.Annotated[
+        int, __.ddoc.Doc( ''' Instantiations which returned new ones. ''' ) ]
+
+    @property
+    def hit_rate( self ) -> float:
+        ''' Fraction of instantiations which returned existing instances. '''
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def survey_instances_interns( cls: type ) -> InstancesInternsSurvey:
+    ''' Surveys canonical instances of dataclass with interned instances. '''
+    interns = __.access_instances_interns( cls )
+    if interns is None:
+        from .exceptions import InstancesInternmentAbsence
+        raise InstancesInternmentAbsence(
+            __.ccutils.describe_object( cls ) )
+    return InstancesInternsSurvey(
+        size = len( interns.table ),
+        hits = interns.hits, misses = interns.misses )
+
+
+class VisiblesCachesSurvey( DataclassObject ):
+    ''' Statistics on cached visible attribute names of class. '''
+
+    size: __.typx.Annotated[
+        int, __.ddoc.Doc( ''' Number of cached attribute surveys. ''' ) ]
+    hits: __.typx.Annotated[
+        int, __.ddoc.Doc( ''' Attribute surveys which were cached. ''' ) ]
+    misses: __.typx.Annotated[
+        int, __.ddoc.Doc( ''' Attribute surveys which were performed. ''' ) ]
+
+    @property
+    def hit_rate( self ) -> float:
+        ''' Fraction of attribute surveys which were cached. '''
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def survey_visibles_caches( cls: type ) -> VisiblesCachesSurvey:
+    ''' Surveys cached visible attribute names of class and its instances.
+
+        Modules are instances of module classes; the survey of a module
+        class covers all of its modules. Surveys of classes without caches
+        are empty.
+    '''
+    caches = __.access_visibles_caches( cls )
+    return VisiblesCachesSurvey(
+        size = sum( len( cache.table ) for cache in caches ),
+        hits = sum( cache.hits for cache in caches ),
+        misses = sum( cache.misses for cache in caches ) )
+
+
+def construct_from_rows(
+    cls: type[ __.U ],
+    rows: __.cabc.Iterable[
+        __.cabc.Sequence[ __.typx.Any ]
+        | __.cabc.Mapping[ str, __.typx.Any ] ],
+    /,
+    names: __.Absential[ __.cabc.Iterable[ str ] ] = __.absent,
+) -> __.cabc.Iterator[ __.U ]:
+    ''' Constructs instances of dataclass from rows of values, lazily.
+
+        Rows are sequences of values, in the same order as the names, or
+        mappings from names to values. Names default to the parameters of
+        the initializer, in order. Parameters, which are not named, receive
+        their defaults. Mappings may omit names of parameters which have
+        defaults, but may not have other entries. Sequences may omit
+        trailing values of parameters which have defaults.
+
+        Instances are constructed as rows are consumed, so that rows may be
+        streamed from generators. Each instance is initialized as if by the
+        class, including its post-initialization hook. For dataclasses
+        produced by the metaclasses of this package, the initialization is
+        unrolled into a loop over the rows, which is generated per class and
+        names upon first use and then retained by the class.
+    '''
+    from .__.rows import construct_from_rows as construct
+    names_ = None if __.is_absent( names ) else tuple( names )
+    return construct(
+        cls, rows, names_, error_class_provider = _provide_error_class )
+
+
+def produce_trusted_constructor(
+    cls: type[ __.U ]
+) -> __.cabc.Callable[ ..., __.U ]:
+    ''' Produces constructor of dataclass instances from trusted values.
+
+        The constructor accepts field values, including those of fields
+        which are not initialized by arguments, as nominative arguments and
+        assigns them directly, as if restored from a snapshot of an
+        instance. Neither the initializer nor the post-initialization hook
+        is run; values must already be as they would have left them.
+        Omitted fields receive their defaults. Instances of classes, which
+        intern them, are canonical instances.
+
+        The constructor is generated upon first request and retained by the
+        class.
+    '''
+    from .__.trusts import produce_trusted_constructor as produce
+    return produce( cls )
+
+
 @__.typx.overload
 def dataclass_with_standard_behaviors( # pragma: no cover
     cls: type[ __.U ], /, *,
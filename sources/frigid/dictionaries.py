@@ -51,6 +51,12 @@
     * :py:class:`ValidatorDictionary`:
       Validates entries before addition using a supplied predicate function.
 
+    * :py:class:`DictionarySchema`:
+      Declarative criteria for entries, compiled into a validation routine.
+
+    * :py:func:`deep_merge`:
+      Merges layers of nested dictionaries, reusing unchanged subtrees.
+
     >>> from frigid import Dictionary
     >>> d = Dictionary( x = 1, y = 2 )
     >>> d[ 'z' ] = 3  # Attempt to add entry
@@ -70,6 +76,8 @@
 
 from . import __
 from . import classes as _classes
+from . import modules as _modules
+from . import namespaces as _namespaces
 
 
 class AbstractDictionary( __.cabc.Mapping[ __.H, __.V ] ):
@@ -172,9 +180,9 @@ class Dictionary( # noqa: PLW1641
 ):
     ''' Immutable dictionary. '''
 
-    __slots__ = ( '_data_', )
+    __slots__ = ( '_data_', __.digest_name )
 
-    _data_: __.ImmutableDictionary[ __.H, __.V ]
+    _data_: __.cabc.Mapping[ __.H, __.V ]
     _dynadoc_fragments_ = ( 'dictionary entries protect', )
 
     def __init__(
@@ -215,6 +223,42 @@ class Dictionary( # noqa: PLW1641
             return self._data_ != other
         return NotImplemented
 
+    @classmethod
+    def _from_data_(
+        cls, data: __.cabc.Mapping[ __.H, __.V ]
+    ) -> __.typx.Self:
+        ''' Produces dictionary which shares data without copying.
+
+            Data must not be mutated afterwards.
+        '''
+        self = cls.__new__( cls )
+        self._data_ = data
+        __.activate_instance_behaviors(
+            self, __.calculate_instance_behaviors( cls ) )
+        return self
+
+    @classmethod
+    def _from_trusted_(
+        cls,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        ''' Produces dictionary from trusted entries, without verification.
+
+            Duplicate keys are not detected; later entries prevail. Suitable
+            for entries of other dictionaries or of trusted snapshots.
+        '''
+        return cls._from_data_(
+            __.ImmutableDictionary._from_trusted_( *iterables, **entries ) )
+
+    def as_namespace( self ) -> _namespaces.Namespace:
+        ''' Provides namespace which shares entries of dictionary.
+
+            Entries are not copied. As both dictionary and namespace are
+            immutable, each behaves as an independent object.
+        '''
+        return _namespaces.Namespace._from_data_( self._data_ )
+
     def copy( self ) -> __.typx.Self:
         ''' Provides fresh copy of dictionary. '''
         return type( self )( self )
@@ -252,6 +296,103 @@ class Dictionary( # noqa: PLW1641
         return type( self )( *iterables, **entries )
 
 
+class DictionarySchema( _classes.DataclassObject ):
+    ''' Declarative schema for entries of validator dictionaries.
+
+        Compiles its criteria into a single validation routine, which checks
+        all entries in one loop, without a function call per entry. Can be
+        supplied wherever an entry validator is accepted, since it is
+        callable with a key and value. Reusable across dictionaries.
+    '''
+
+    keys_types: __.typx.Annotated[
+        __.typx.Optional[ type | tuple[ type, ... ] ],
+        __.ddoc.Doc( ''' Types, one of which each key must have. ''' ),
+    ] = None
+    keys_allowed: __.typx.Annotated[
+        __.typx.Optional[ __.cabc.Collection[ __.cabc.Hashable ] ],
+        __.ddoc.Doc( ''' Keys, outside of which none are valid. ''' ),
+    ] = None
+    values_types: __.typx.Annotated[
+        __.typx.Optional[ type | tuple[ type, ... ] ],
+        __.ddoc.Doc( ''' Types, one of which each value must have. ''' ),
+    ] = None
+    values_allowed: __.typx.Annotated[
+        __.typx.Optional[ __.cabc.Collection[ __.cabc.Hashable ] ],
+        __.ddoc.Doc( ''' Values, outside of which none are valid. ''' ),
+    ] = None
+    values_minimum: __.typx.Annotated[
+        __.Absential[ __.typx.Any ],
+        __.ddoc.Doc( ''' Inclusive lower bound of values. ''' ),
+    ] = __.absent
+    values_maximum: __.typx.Annotated[
+        __.Absential[ __.typx.Any ],
+        __.ddoc.Doc( ''' Inclusive upper bound of values. ''' ),
+    ] = __.absent
+    entries_types: __.typx.Annotated[
+        __.typx.Optional[
+            __.cabc.Mapping[ __.cabc.Hashable, type | tuple[ type, ... ] ] ],
+        __.ddoc.Doc( ''' Types, one of which value must have, by key. ''' ),
+    ] = None
+    predicate: __.typx.Annotated[
+        __.typx.Optional[ __.DictionaryValidator[ __.typx.Any, __.typx.Any ] ],
+        __.ddoc.Doc( ''' Validator of entries which satisfy the schema. ''' ),
+    ] = None
+
+    def __post_init__( self ) -> None:
+        if self.keys_allowed is not None:
+            self.keys_allowed = frozenset( self.keys_allowed )
+        if self.values_allowed is not None:
+            self.values_allowed = frozenset( self.values_allowed )
+        if self.entries_types is not None:
+            self.entries_types = __.types.MappingProxyType(
+                dict( self.entries_types ) )
+
+    def __call__( self, key: __.typx.Any, value: __.typx.Any ) -> bool:
+        return self.verifier( key, value )
+
+    @_classes.cached_property
+    def locator( self ) -> __.cabc.Callable[
+        [ __.cabc.Iterable[ tuple[ __.typx.Any, __.typx.Any ] ] ],
+        __.cabc.Iterator[ int ]
+    ]:
+        ''' Compiled routine which yields indices of invalid entries. '''
+        return _produce_schema_routines( self )[ 1 ]
+
+    @_classes.cached_property
+    def verifier( self ) -> __.cabc.Callable[
+        [ __.typx.Any, __.typx.Any ], bool
+    ]:
+        ''' Compiled routine which validates one entry. '''
+        return _produce_schema_routines( self )[ 0 ]
+
+
+class InvalidEntriesTreatments( __.enum.Enum ):
+    ''' How invalid entries are treated upon construction of dictionary.
+
+        Error raises for the first invalid entry. ErrorAll raises once for
+        every invalid entry. Exclude constructs from valid entries only.
+    '''
+
+    Error = 'error'
+    ErrorAll = 'error-all'
+    Exclude = 'exclude'
+
+
+class MergeConflictsPolicies( __.enum.Enum ):
+    ''' How conflicting values of entries are treated upon deep merge.
+
+        Override takes the value from the latest layer. Error raises unless
+        the values are equal. Combine concatenates sequences into tuples and
+        otherwise takes the value from the latest layer. Values, which are
+        dictionaries in every layer, are merged rather than in conflict.
+    '''
+
+    Combine = 'combine'
+    Error = 'error'
+    Override = 'override'
+
+
 class ValidatorDictionary( Dictionary[ __.H, __.V ] ):
     ''' Immutable dictionary with validation of entries on initialization. '''
 
@@ -269,24 +410,71 @@ class ValidatorDictionary( Dictionary[ __.H, __.V ] ):
         **entries: __.DictionaryNominativeArgument[ __.V ],
     ) -> None:
         self._validator_ = validator
-        entries_: list[ tuple[ __.H, __.V ] ] = [ ]
-        from itertools import chain
-        # Collect entries in case an iterable is a generator
-        # which would be consumed during validation, before initialization.
-        for key, value in chain.from_iterable( map( # pyright: ignore
-            lambda element: ( # pyright: ignore
-                element.items( )
-                if isinstance( element, __.cabc.Mapping )
-                else element
-            ),
-            ( *iterables, entries )
-        ) ):
-            if not self._validator_( key, value ): # pyright: ignore
-                from .exceptions import EntryInvalidity
-                raise EntryInvalidity( key, value )
-            entries_.append( ( key, value ) ) # pyright: ignore
+        entries_ = _collect_entries( iterables, entries )
+        for index in _locate_invalid_entries( validator, entries_ ):
+            from .exceptions import EntryInvalidity
+            raise EntryInvalidity( *entries_[ index ] )
         super( ).__init__( entries_ )
 
+    @classmethod
+    def from_entries(
+        cls,
+        validator: __.DictionaryValidator[ __.H, __.V ],
+        /,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        treatment: InvalidEntriesTreatments = (
+            InvalidEntriesTreatments.ErrorAll ),
+        invalids: __.Absential[
+            __.cabc.MutableSequence[ tuple[ __.H, __.V ] ] ] = __.absent,
+    ) -> __.typx.Self:
+        ''' Produces dictionary, treating invalid entries as directed.
+
+            All entries are validated in a single pass. Unless invalid
+            entries are to be excluded, construction fails if there are any.
+            If a sequence of invalids is supplied, then every invalid entry
+            is appended to it, regardless of treatment.
+        '''
+        entries = _collect_entries( iterables, { } )
+        indices = tuple( _locate_invalid_entries( validator, entries ) )
+        rejects = [ entries[ index ] for index in indices ]
+        if not __.is_absent( invalids ): invalids.extend( rejects )
+        if rejects:
+            match treatment:
+                case InvalidEntriesTreatments.Error:
+                    from .exceptions import EntryInvalidity
+                    raise EntryInvalidity( *rejects[ 0 ] )
+                case InvalidEntriesTreatments.ErrorAll:
+                    from .exceptions import EntriesInvalidity
+                    raise EntriesInvalidity( rejects )
+                case InvalidEntriesTreatments.Exclude:
+                    excludes = frozenset( indices )
+                    entries = [
+                        entry for index, entry in enumerate( entries )
+                        if index not in excludes ]
+        # Entries are already validated; only detect duplicate keys.
+        return cls._from_trusted_(
+            validator, __.ImmutableDictionary( entries ) )
+
+    @classmethod
+    def _from_trusted_( # pyright: ignore
+        cls,
+        validator: __.DictionaryValidator[ __.H, __.V ],
+        /,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        ''' Produces dictionary from trusted entries, without verification.
+
+            Entries are neither validated nor checked for duplicate keys.
+        '''
+        self = cls.__new__( cls )
+        self._validator_ = validator
+        self._data_ = __.ImmutableDictionary._from_trusted_(
+            *iterables, **entries )
+        __.activate_instance_behaviors(
+            self, __.calculate_instance_behaviors( cls ) )
+        return self
+
     def __repr__( self ) -> str:
         return "{fqname}( {validator}, {contents} )".format(
             fqname = __.ccutils.qualify_class_name( type( self ) ),
@@ -304,3 +492,231 @@ class ValidatorDictionary( Dictionary[ __.H, __.V ] ):
     ) -> __.typx.Self:
         ''' Creates new dictionary with same behavior but different data. '''
         return type( self )( self._validator_, *iterables, **entries )
+
+
+def deep_merge(
+    *layers: __.cabc.Mapping[ __.typx.Any, __.typx.Any ],
+    policy: MergeConflictsPolicies = MergeConflictsPolicies.Override,
+    memo: __.Absential[
+        __.cabc.MutableMapping[ __.cabc.Hashable, __.typx.Any ] ] = __.absent,
+) -> Dictionary[ __.typx.Any, __.typx.Any ]:
+    ''' Merges layers of nested dictionaries, later layers prevailing.
+
+        Nested dictionaries, which are immutable dictionaries in more than one
+        layer, are merged recursively. Other values, which are present in more
+        than one layer, are in conflict and are treated according to the
+        policy. Subtrees, which are present in only one layer or are
+        identical across layers, are reused by identity rather than copied.
+        Merged dictionaries are produced via the dictionaries of the first
+        layer in which they appear, preserving their classes and validators.
+
+        Merging proceeds iteratively, so that depth of trees is not limited
+        by recursion. If a memo is supplied, then merged subtrees are
+        recorded in it by the identities of their layers; subsequent merges
+        with the same memo reuse the results for subtrees, which no layer
+        has replaced, so that a merge after change to one layer only revisits
+        the changed subtrees.
+    '''
+    if not layers: return Dictionary( )
+    memo_ = None if __.is_absent( memo ) else memo
+    frames: list[ tuple[ __.typx.Any, ... ] ] = [ ]
+    nodes: __.cabc.Sequence[ __.typx.Any ] = layers
+    path: tuple[ __.typx.Any, ... ] = ( )
+    result = None
+    while True:
+        if nodes is not None:
+            memokey = ( policy, *map( id, nodes ) )
+            if memo_ is not None and memokey in memo_:
+                result = memo_[ memokey ][ 1 ]
+            else:
+                merger = _merge_dictionaries( nodes, path, policy )
+                frames.append( ( merger, memokey, nodes ) )
+                result = None
+        if not frames: return result
+        merger, memokey, nodes_ = frames[ -1 ]
+        try: nodes, path = merger.send( result )
+        except StopIteration as completion:
+            result = completion.value
+            # Layers are retained, so that their identities remain valid.
+            if memo_ is not None: memo_[ memokey ] = ( nodes_, result )
+            frames.pop( )
+            nodes = None
+
+
+def _collect_entries(
+    iterables: __.cabc.Sequence[
+        __.DictionaryPositionalArgument[ __.H, __.V ] ],
+    entries: __.cabc.Mapping[ str, __.V ],
+) -> list[ tuple[ __.H, __.V ] ]:
+    ''' Collects entries from iterables and nominative entries, in order.
+
+        Entries are collected in case an iterable is a generator which would
+        be consumed during validation, before initialization.
+    '''
+    from itertools import chain
+    return list( chain.from_iterable( map( # pyright: ignore
+        lambda element: ( # pyright: ignore
+            element.items( )
+            if isinstance( element, __.cabc.Mapping )
+            else element
+        ),
+        ( *iterables, entries )
+    ) ) )
+
+
+def _locate_invalid_entries(
+    validator: __.DictionaryValidator[ __.H, __.V ],
+    entries: __.cabc.Sequence[ tuple[ __.H, __.V ] ],
+) -> __.cabc.Iterator[ int ]:
+    ''' Yields indices of entries which validator rejects. '''
+    if isinstance( validator, DictionarySchema ):
+        return validator.locator( entries )
+    return (
+        index for index, ( key, value ) in enumerate( entries )
+        if not validator( key, value ) )
+
+
+def _merge_dictionaries(
+    nodes: __.cabc.Sequence[ __.cabc.Mapping[ __.typx.Any, __.typx.Any ] ],
+    path: tuple[ __.typx.Any, ... ],
+    policy: MergeConflictsPolicies,
+) -> __.cabc.Generator[
+    tuple[ __.cabc.Sequence[ __.typx.Any ], tuple[ __.typx.Any, ... ] ],
+    __.typx.Any,
+    Dictionary[ __.typx.Any, __.typx.Any ],
+]:
+    ''' Merges dictionaries of one level, delegating nested merges.
+
+        Yields dictionaries to be merged for an entry, along with path of
+        keys to the entry, and receives the merged dictionary. Returns the
+        merged dictionary for this level.
+    '''
+    data: dict[ __.typx.Any, __.typx.Any ] = { }
+    for key in dict.fromkeys( __.itertools.chain.from_iterable( nodes ) ):
+        values = [ node[ key ] for node in nodes if key in node ]
+        value = values[ -1 ]
+        if len( values ) > 1:
+            value = _merge_values( values, ( *path, key ), policy )
+            if isinstance( value, _DictionariesMerge ):
+                value = yield value.nodes, ( *path, key )
+        data[ key ] = value
+    for node in nodes:
+        if not isinstance( node, AbstractDictionary ): continue
+        if len( node ) != len( data ): continue
+        if all( key in node and node[ key ] is value
+                for key, value in data.items( ) ): return node
+    base = nodes[ 0 ]
+    if isinstance( base, _DictionaryOperations ):
+        return base.with_data( data )
+    return Dictionary._from_data_( data )
+
+
+class _DictionariesMerge( __.typx.NamedTuple ):
+    ''' Dictionaries, which are to be merged for an entry. '''
+
+    nodes: __.cabc.Sequence[ AbstractDictionary[ __.typx.Any, __.typx.Any ] ]
+
+
+def _merge_values(
+    values: __.cabc.Sequence[ __.typx.Any ],
+    path: tuple[ __.typx.Any, ... ],
+    policy: MergeConflictsPolicies,
+) -> __.typx.Any:
+    ''' Merges values of entry from several layers, according to policy.
+
+        Returns dictionaries to merge, if the prevailing values are
+        dictionaries. Else, returns the resolved value.
+    '''
+    first = values[ 0 ]
+    if all( value is first for value in values ): return first
+    leaves = [
+        index for index, value in enumerate( values )
+        if not isinstance( value, AbstractDictionary ) ]
+    if not leaves: return _DictionariesMerge( values )
+    if policy is MergeConflictsPolicies.Error and any(
+        value != first for value in values
+    ):
+        from .exceptions import EntryMergeFailure
+        raise EntryMergeFailure( path )
+    tail = values[ leaves[ -1 ] + 1 : ]
+    if len( tail ) > 1: return _DictionariesMerge( tail )
+    if tail: return tail[ 0 ]
+    if policy is not MergeConflictsPolicies.Combine: return values[ -1 ]
+    result = first
+    for value in values[ 1 : ]:
+        if _is_combinable( result ) and _is_combinable( value ):
+            result = ( *result, *value )
+        else: result = value
+    return result
+
+
+def _is_combinable( value: __.typx.Any ) -> bool:
+    ''' Is value a sequence, which is combinable by concatenation? '''
+    return (
+        isinstance( value, __.cabc.Sequence )
+        and not isinstance( value, ( str, bytes, bytearray ) ) )
+
+
+def _produce_schema_conditions(
+    schema: DictionarySchema, namespace: dict[ str, __.typx.Any ]
+) -> list[ str ]:
+    ''' Produces conditions of schema as expressions over entry.
+
+        Records criteria into namespace of routines. Cheaper conditions
+        precede costlier ones, so that evaluation short-circuits early.
+    '''
+    conditions: list[ str ] = [ ]
+    for name, template in (
+        ( 'keys_types', "isinstance( key, {} )" ),
+        ( 'values_types', "isinstance( value, {} )" ),
+        ( 'keys_allowed', "key in {}" ),
+        ( 'values_allowed', "value in {}" ),
+        ( 'values_minimum', "{} <= value" ),
+        ( 'values_maximum', "value <= {}" ),
+        ( 'entries_types',
+          "isinstance( value, {}.get( key, object ) )" ),
+    ):
+        criterion = getattr( schema, name )
+        if criterion is None or __.is_absent( criterion ): continue
+        namespace[ f"__frigid_{name}__" ] = criterion
+        conditions.append( template.format( f"__frigid_{name}__" ) )
+    return conditions
+
+
+def _produce_schema_routines(
+    schema: DictionarySchema
+) -> tuple[
+    __.cabc.Callable[ [ __.typx.Any, __.typx.Any ], bool ],
+    __.cabc.Callable[
+        [ __.cabc.Iterable[ tuple[ __.typx.Any, __.typx.Any ] ] ],
+        __.cabc.Iterator[ int ] ],
+]:
+    ''' Generates verifier of one entry and locator of invalid entries.
+
+        Entries which cannot be checked against criteria, such as unhashable
+        values against allowed values, are invalid. Errors from predicate
+        are not suppressed.
+    '''
+    namespace: dict[ str, __.typx.Any ] = {
+        '__frigid_predicate__': schema.predicate }
+    condition = ' and '.join(
+        _produce_schema_conditions( schema, namespace ) ) or 'True'
+    predication = (
+        " and __frigid_predicate__( key, value )"
+        if schema.predicate is not None else '' )
+    source = (
+        "def verify( key, value ):\n"
+        f"    try: valid = {condition}\n"
+        "    except TypeError: return False\n"
+        f"    return bool( valid{predication} )\n"
+        "def locate( entries ):\n"
+        "    for index, ( key, value ) in enumerate( entries ):\n"
+        f"        try: valid = {condition}\n"
+        "        except TypeError: valid = False\n"
+        f"        if valid{predication}: continue\n"
+        "        yield index\n" )
+    exec( source, namespace ) # noqa: S102
+    return namespace[ 'verify' ], namespace[ 'locate' ]
+
+
+_modules.finalize_module( __name__, dynadoc_table = __.fragments )
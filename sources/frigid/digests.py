@@ -0,0 +1,235 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+''' Content digests of immutable data structures.
+
+    Digests are stable across processes and hash randomization, so that they
+    can serve as cache keys or be compared across runs. Each container is
+    digested from the digests of its members, which are memoized on
+    dictionaries and dataclass instances, so that unchanged subtrees are not
+    digested again. Namespaces memoize digests only if their classes opt in.
+
+    >>> from frigid import Dictionary, digest
+    >>> tree = Dictionary( name = 'oak', leaves = ( 1, 2, 3 ) )
+    >>> digest( tree ) == digest( Dictionary( leaves = ( 1, 2, 3 ), name = 'oak' ) )
+    True
+''' # noqa: E501
+
+
+import hashlib as _hashlib
+import struct as _struct
+
+from . import __
+from . import dictionaries as _dictionaries
+from . import modules as _modules
+from . import namespaces as _namespaces
+
+
+def digest( value: __.typx.Any ) -> bytes:
+    ''' Computes content digest of immutable value.
+
+        The digest is a 32-byte BLAKE2b hash over a canonical encoding of
+        the value. Supported values are ``None``, booleans, integers, floats,
+        complex numbers, strings, bytes, enumeration members, tuples, frozen
+        sets, immutable dictionaries, namespaces, and instances of frozen or
+        immutable dataclasses, nested arbitrarily. Entries of dictionaries and
+        namespaces and members of frozen sets are digested regardless of
+        order. Fields of dataclasses, which are compared for equality, are
+        digested along with the qualified name of their class.
+
+        Digests are equal if contents and types of scalars are equal; e.g.,
+        ``1`` and ``1.0`` have different digests. Digests of dictionaries
+        and dataclass instances are memoized on them, as are digests of
+        namespaces, whose classes set ``_digests_memoized_``. Traversal is
+        iterative, so that depth of trees is not limited by recursion.
+    '''
+    encoding = _encode_scalar( value )
+    if encoding is not None:
+        hasher = _hashlib.blake2b( digest_size = 32, person = _person )
+        hasher.update( encoding )
+        return hasher.digest( )
+    recalls: dict[ int, bytes ] = { }
+    result = _recall( value, recalls ) or _digest_scalars( value )
+    if result is not None: return result
+    frames = [ ( value, _digest_container( value, recalls ) ) ]
+    while True:
+        node, digester = frames[ -1 ]
+        try: member = digester.send( result )
+        except StopIteration as completion:
+            result = completion.value
+            _memoize( node, result, recalls )
+            frames.pop( )
+            if not frames: return result
+            continue
+        result = _recall( member, recalls ) or _digest_scalars( member )
+        if result is None:
+            frames.append( ( member, _digest_container( member, recalls ) ) )
+
+
+_mutables_names_name = __.calculate_attrname( 'instances', 'mutables_names' )
+_mutables_predicates_name = __.calculate_attrname(
+    'instances', 'mutables_predicates' )
+_mutables_regexes_name = __.calculate_attrname(
+    'instances', 'mutables_regexes' )
+_person = b'frigid.digest.1' # Version of encoding.
+
+
+def _digest_container(
+    node: __.typx.Any, recalls: dict[ int, bytes ]
+) -> __.cabc.Generator[ __.typx.Any, __.typx.Optional[ bytes ], bytes ]:
+    ''' Digests container from encodings of its members.
+
+        Yields members, which are containers without known digests, and
+        receives their digests. Returns digest of container.
+    '''
+    label, members, ordered = _survey_container( node )
+    hasher = _hashlib.blake2b( digest_size = 32, person = _person )
+    hasher.update( label )
+    encodings: list[ bytes ] = [ ]
+    for member in members:
+        encoding = b''
+        for value in member:
+            part = _encode_scalar( value )
+            if part is None:
+                digest_ = (
+                    _recall( value, recalls ) or _digest_scalars( value ) )
+                if digest_ is None: digest_ = yield value
+                part = b'@' + __.typx.cast( bytes, digest_ )
+            encoding += part
+        if ordered: hasher.update( encoding )
+        else: encodings.append( encoding )
+    # Encodings are self-delimiting, so sorted concatenation is unambiguous.
+    for encoding in sorted( encodings ): hasher.update( encoding )
+    return hasher.digest( )
+
+
+def _digest_scalars( node: __.typx.Any ) -> __.typx.Optional[ bytes ]:
+    ''' Digests tuple or frozen set of scalars, without traversal.
+
+        Returns nothing for other values or if any member is not a scalar.
+        Equivalent to digest of container from its members.
+    '''
+    kind = type( node )
+    if kind is not tuple and kind is not frozenset: return None
+    encodings: list[ bytes ] = [ ]
+    for value in node:
+        encoding = _encode_scalar( value )
+        if encoding is None: return None
+        encodings.append( encoding )
+    if kind is frozenset: encodings.sort( )
+    hasher = _hashlib.blake2b( digest_size = 32, person = _person )
+    hasher.update( b't' if kind is tuple else b's' )
+    hasher.update( b''.join( encodings ) )
+    return hasher.digest( )
+
+
+def _encode_enum( value: __.enum.Enum ) -> bytes:
+    return b''.join( (
+        b'e',
+        _frame( __.ccutils.qualify_class_name( type( value ) ).encode( ) ),
+        _frame( value.name.encode( ) ) ) )
+
+
+def _encode_integer( value: int ) -> bytes:
+    return b'i' + _frame(
+        value.to_bytes( value.bit_length( ) // 8 + 1, 'big', signed = True ) )
+
+
+def _encode_scalar( value: __.typx.Any ) -> __.typx.Optional[ bytes ]:
+    ''' Encodes scalar value. Returns nothing for other values. '''
+    encoder = _scalars_encoders.get( type( value ) )
+    if encoder is not None: return encoder( value )
+    if isinstance( value, __.enum.Enum ): return _encode_enum( value )
+    return None
+
+
+def _frame( data: bytes ) -> bytes:
+    ''' Prefixes data with its length. '''
+    return _struct.pack( '>Q', len( data ) ) + data
+
+
+def _is_immutable_dataclass( cls: type ) -> bool:
+    ''' Are instances of class immutable dataclass instances? '''
+    parameters = getattr( cls, '__dataclass_params__', None )
+    if parameters is None: return False
+    if parameters.frozen: return True
+    names = getattr( cls, _mutables_names_name, None )
+    return (
+            names is not None and not names
+        and not getattr( cls, _mutables_predicates_name, ( ) )
+        and not getattr( cls, _mutables_regexes_name, ( ) ) )
+
+
+def _memoize(
+    node: __.typx.Any, digest_: bytes, recalls: dict[ int, bytes ]
+) -> None:
+    ''' Memoizes digest on container, if possible, and for traversal. '''
+    # Nodes are reachable from root, so identities are stable in traversal.
+    recalls[ id( node ) ] = digest_
+    if type( node ) is tuple or type( node ) is frozenset: return
+    descriptor = __.discover_digest_slot( type( node ) )
+    if descriptor is not None: descriptor.__set__( node, digest_ )
+
+
+def _recall(
+    node: __.typx.Any, recalls: dict[ int, bytes ]
+) -> __.typx.Optional[ bytes ]:
+    ''' Recalls known digest of container, if any. '''
+    digest_ = recalls.get( id( node ) )
+    if digest_ is not None: return digest_
+    if type( node ) is tuple or type( node ) is frozenset: return None
+    return getattr( node, __.digest_name, None )
+
+
+def _survey_container(
+    node: __.typx.Any
+) -> tuple[ bytes, __.cabc.Iterable[ tuple[ __.typx.Any, ... ] ], bool ]:
+    ''' Surveys label, members, and ordering of members of container. '''
+    if isinstance( node, tuple ):
+        return b't', ( ( value, ) for value in node ), True
+    if isinstance( node, frozenset ):
+        return b's', ( ( value, ) for value in node ), False
+    if isinstance( node, _dictionaries.AbstractDictionary ):
+        return b'd', node.items( ), False
+    if isinstance( node, _namespaces.Namespace ):
+        return b'n', node.__dict__.items( ), False
+    cls = type( node )
+    if _is_immutable_dataclass( cls ):
+        label = b'c' + _frame( __.ccutils.qualify_class_name( cls ).encode( ) )
+        return label, (
+            ( field.name, getattr( node, field.name ) )
+            for field in __.dcls.fields( node ) if field.compare ), True
+    from .exceptions import ValueDigestFailure
+    raise ValueDigestFailure( __.ccutils.qualify_class_name( cls ) )
+
+
+_scalars_encoders: dict[ type, __.cabc.Callable[ [ __.typx.Any ], bytes ] ] = {
+    type( None ): lambda value: b'N',
+    bool: lambda value: b'T' if value else b'F',
+    int: _encode_integer,
+    float: lambda value: b'f' + _struct.pack( '>d', value ),
+    complex: lambda value: (
+        b'j' + _struct.pack( '>dd', value.real, value.imag ) ),
+    str: lambda value: (
+        b'u' + _frame( value.encode( 'utf-8', 'surrogatepass' ) ) ),
+    bytes: lambda value: b'b' + _frame( value ),
+}
+
+
+_modules.finalize_module( __name__, dynadoc_table = __.fragments )
@@ -49,6 +49,35 @@ class AttributeImmutability( Omnierror, AttributeError ):
             f"Could not assign or delete attribute {name!r} on {target}." )
 
 
+class ConstructorProductionFailure( Omnierror, TypeError ):
+
+    def __init__( self, class_name: str ) -> None:
+        super( ).__init__(
+            f"Could not produce positional constructor for class "
+            f"{class_name!r}. Class has custom initializer or allocator." )
+
+
+class EntriesInvalidity( Omnierror, ValueError ):
+
+    entries_listed_maximum = 5
+
+    def __init__(
+        self,
+        entries: __.cabc.Sequence[ tuple[ __.cabc.Hashable, __.typx.Any ] ],
+    ) -> None:
+        self.entries = tuple( entries )
+        count = len( self.entries )
+        listing = ', '.join(
+            f"{key!r}: {value!r}" for key, value
+            in self.entries[ : self.entries_listed_maximum ] )
+        if count > self.entries_listed_maximum:
+            listing = (
+                f"{listing}, and {count - self.entries_listed_maximum} more" )
+        super( ).__init__(
+            f"Could not add {count} invalid entries to dictionary. "
+            f"Entries: {listing}" )
+
+
 class EntryImmutability( Omnierror, TypeError ):
 
     def __init__( self, key: __.cabc.Hashable ) -> None:
@@ -66,8 +95,92 @@ class EntryInvalidity( Omnierror, ValueError ):
             f"and value, {value!r}, to dictionary." )
 
 
+class EntryMergeFailure( Omnierror, ValueError ):
+
+    def __init__( self, path: __.cabc.Sequence[ __.cabc.Hashable ] ) -> None:
+        self.path = tuple( path )
+        super( ).__init__(
+            "Could not merge conflicting values of entry at keys path, "
+            f"{list( self.path )!r}." )
+
+
 class ErrorProvideFailure( Omnierror, RuntimeError ):
 
     def __init__( self, name: str, reason: str ):
         super( ).__init__(
             f"Could not provide error class {name!r}. Reason: {reason}" )
+
+
+class FieldInvalidity( Omnierror, ValueError ):
+
+    def __init__(
+        self, name: str, value: __.typx.Any, target: str
+    ) -> None:
+        super( ).__init__(
+            f"Could not initialize field {name!r} on {target} "
+            f"with invalid value, {value!r}." )
+
+
+class InstancesInternmentAbsence( Omnierror, TypeError ):
+
+    def __init__( self, target: str ) -> None:
+        super( ).__init__(
+            f"Could not survey interned instances of {target}. "
+            "Class does not intern its instances." )
+
+
+class InstancesSlottingFailure( Omnierror, TypeError ):
+
+    def __init__( self, class_name: str, base_name: str ) -> None:
+        super( ).__init__(
+            f"Could not slot instances of class {class_name!r}. "
+            f"Instances of base class {base_name!r} have attributes "
+            "dictionary." )
+
+
+class NamesInvalidity( Omnierror, TypeError, ValueError ):
+
+    def __init__(
+        self,
+        absent: __.cabc.Iterable[ __.cabc.Hashable ],
+        unknown: __.cabc.Iterable[ __.cabc.Hashable ],
+        duplicate: __.cabc.Iterable[ __.cabc.Hashable ] = ( ),
+    ) -> None:
+        self.absent = tuple( absent )
+        self.unknown = tuple( unknown )
+        self.duplicate = tuple( duplicate )
+        message = "Could not match names of entries to expected names."
+        if self.absent:
+            listing = ', '.join( repr( name ) for name in self.absent )
+            message = f"{message} Absent: {listing}."
+        if self.unknown:
+            listing = ', '.join( repr( name ) for name in self.unknown )
+            message = f"{message} Unknown: {listing}."
+        if self.duplicate:
+            listing = ', '.join( repr( name ) for name in self.duplicate )
+            message = f"{message} Duplicate: {listing}."
+        super( ).__init__( message )
+
+
+class SlotDerivationFailure( Omnierror, TypeError ):
+
+    def __init__( self, class_name: str, name: str ) -> None:
+        super( ).__init__(
+            f"Could not derive instance slot for attribute {name!r} "
+            f"of class {class_name!r}. Attribute has class-level value "
+            "and is assigned by initializer." )
+
+
+class ValueDigestFailure( Omnierror, TypeError ):
+
+    def __init__( self, class_name: str ) -> None:
+        super( ).__init__(
+            f"Could not digest value of class {class_name!r}. "
+            "Only immutable values of supported classes are digestible." )
+
+
+class ValuesCountInvalidity( Omnierror, TypeError, ValueError ):
+
+    def __init__( self, expected: int, actual: int ) -> None:
+        super( ).__init__(
+            f"Could not match {actual} values to {expected} names." )
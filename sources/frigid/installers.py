@@ -22,6 +22,7 @@
 
 
 from . import __
+from . import modules as _modules
 
 
 def install(
@@ -36,3 +37,6 @@ def install(
     if single_name:
         from .sequences import one
         setattr( builtins, single_name, one )
+
+
+_modules.finalize_module( __name__, dynadoc_table = __.fragments )
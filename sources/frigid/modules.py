@@ -40,9 +40,19 @@ from . import __
 from . import classes as _classes
 
 
+DocstringsModes = __.DocstringsModes
 ModuleNamespaceDictionary: __.typx.TypeAlias = (
     __.cabc.Mapping[ str, __.typx.Any ] )
 
+DocstringsArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.Absential[ DocstringsModes ],
+    __.ddoc.Doc(
+        ''' When to render Dynadoc introspection into docstrings.
+
+            Defaults to mode from environment variable, if set, else eager.
+            Skip, if Python is running with docstrings stripped.
+        ''' ),
+]
 DynadocIntrospectionArgument: __.typx.TypeAlias = __.typx.Annotated[
     __.Absential[ __.ddoc.IntrospectionControl ],
     __.ddoc.Doc(
@@ -72,6 +82,11 @@ ReplacementClassArgument: __.typx.TypeAlias = __.typx.Annotated[
     type[ __.types.ModuleType ],
     __.ddoc.Doc( ''' New class for module. ''' ),
 ]
+TimingsArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.Absential[ __.cabc.MutableMapping[ str, float ] ],
+    __.ddoc.Doc(
+        ''' Mapping into which to record seconds spent per module. ''' ),
+]
 
 
 class Module( _classes.Object, __.types.ModuleType ):
@@ -80,34 +95,211 @@ class Module( _classes.Object, __.types.ModuleType ):
     _dynadoc_fragments_ = ( 'module', 'module conceal', 'module protect' )
 
 
+class _ModuleDocstring:
+    ''' Module docstring, which may be rendered upon first access. '''
+
+    __slots__ = ( 'docstring', )
+
+    def __init__( self, docstring: __.typx.Any ) -> None:
+        self.docstring = docstring
+
+    def __get__(
+        self, instance: object, owner: __.typx.Optional[ type ] = None
+    ) -> __.typx.Optional[ str ]:
+        if instance is None: docstring = self.docstring
+        else: docstring = vars( instance ).get( '__doc__' )
+        if isinstance( docstring, __.DocstringDeferral ):
+            return docstring.render( owner if instance is None else instance )
+        return docstring
+
+    def __set__( self, instance: object, value: __.typx.Any ) -> None:
+        vars( instance )[ '__doc__' ] = value
+
+    def __delete__( self, instance: object ) -> None:
+        del vars( instance )[ '__doc__' ]
+
+
+# Class is immutable after creation; bypass enforcement.
+type.__setattr__(
+    Module, '__doc__', _ModuleDocstring( vars( Module )[ '__doc__' ] ) )
+
+
+_module_behaviors = frozenset( (
+    __.concealment_label, __.immutability_label ) )
+
+
 def finalize_module( # noqa: PLR0913
     module: ModuleArgument, /,
     *fragments: __.ddoc.interfaces.Fragment,
     attributes_namer: __.AttributesNamer = __.calculate_attrname,
+    docstrings: DocstringsArgument = __.absent,
     dynadoc_introspection: DynadocIntrospectionArgument = __.absent,
     dynadoc_table: FinalizeModuleDynadocTableArgument = __.absent,
     recursive: RecursiveArgument = False,
     replacement_class: ReplacementClassArgument = Module,
+    timings: TimingsArgument = __.absent,
 ) -> None:
     ''' Combines Dynadoc docstring assignment and module reclassification.
 
         Applies module docstring generation via Dynadoc introspection,
         then reclassifies modules for immutability and concealment.
 
-        When recursive is False, automatically excludes module targets from
-        dynadoc introspection to document only the provided module. When
-        recursive is True, automatically includes module targets so Dynadoc
-        can recursively document all modules.
+        When recursive is True, submodules are discovered by package prefix
+        from ``sys.modules`` rather than by walking module attributes. Each
+        submodule is finalized individually, deepest first, with module
+        targets excluded from Dynadoc introspection so that no module is
+        documented twice. Private submodules, such as those beneath a
+        package named ``__``, are reclassified but not introspected.
+        Submodules which are already instances of the replacement class are
+        skipped; this makes repeated finalization of partially-finalized
+        package trees incremental.
+
+        In lazy docstrings mode, docstrings of modules and of classes
+        produced by this package are rendered upon first access instead.
+        Functions and other members are still documented during
+        finalization, since their docstrings cannot be rendered upon access.
+        Lazy mode requires a replacement class which can render docstrings
+        upon access; other replacement classes are documented eagerly.
+
+        In eager docstrings mode, precomputed docstrings, which are generated
+        into wheels of this package at build time, are used instead of
+        introspection, if they are current.
+
+        If a timings mapping is supplied, then the seconds spent finalizing
+        each module are recorded into it by module name.
     '''
-    nomargs: dict[ str, __.typx.Any ] = dict(
-        attributes_namer = attributes_namer,
-        recursive = recursive,
-        replacement_class = replacement_class )
-    if not __.is_absent( dynadoc_introspection ):
-        nomargs[ 'dynadoc_introspection' ] = dynadoc_introspection
-    if not __.is_absent( dynadoc_table ):
-        nomargs[ 'dynadoc_table' ] = dynadoc_table
-    __.ccstd.finalize_module( module, *fragments, **nomargs )
+    if isinstance( module, str ): module = __.sys.modules[ module ]
+    docstrings = _resolve_docstrings_mode( docstrings, replacement_class )
+    precomputed = (
+            docstrings is DocstringsModes.Eager
+        and module.__name__ in __.docstrings_cache )
+    if __.is_absent( dynadoc_introspection ):
+        dynadoc_introspection = (
+            __.ccstd.dynadoc.dynadoc_introspection_on_package )
+    docargs: dict[ str, __.typx.Any ] = { }
+    if not __.is_absent( dynadoc_table ): docargs[ 'table' ] = dynadoc_table
+    introspection = _exclude_module_targets( dynadoc_introspection )
+    configuration = (
+        __.ccstd.dynadoc.produce_dynadoc_configuration(
+            introspection = introspection, **docargs )
+        if docstrings is DocstringsModes.Lazy else None )
+    introspective = (
+            docstrings is DocstringsModes.Lazy
+        or ( docstrings is DocstringsModes.Eager and not precomputed ) )
+    if configuration is not None:
+        introspection = __.produce_members_introspection( introspection )
+    docargs[ 'introspection' ] = (
+        introspection if introspective
+        else __.dynadoc_introspection_disabled )
+    seal = _produce_module_sealer( attributes_namer, replacement_class )
+    for module_ in _collect_modules(
+        module, recursive = recursive, excludes = replacement_class
+    ):
+        time_start = __.time.perf_counter( )
+        if module_ is module:
+            __.ccstd.dynadoc.assign_module_docstring(
+                module_, *fragments, **docargs )
+        elif introspective and not _is_private_module( module_, module ):
+            __.ccstd.dynadoc.assign_module_docstring( module_, **docargs )
+        if not isinstance( module_, replacement_class ): seal( module_ )
+        if precomputed: __.restore_module_docstrings( module_ )
+        elif configuration is not None and (
+            module_ is module or not _is_private_module( module_, module )
+        ): _defer_docstrings( module_, configuration )
+        if not __.is_absent( timings ):
+            timings[ module_.__name__ ] = (
+                __.time.perf_counter( ) - time_start )
+
+
+def _collect_modules(
+    module: __.types.ModuleType, /,
+    recursive: bool,
+    excludes: __.typx.Optional[ type[ __.types.ModuleType ] ] = None,
+) -> list[ __.types.ModuleType ]:
+    ''' Collects loaded submodules, if recursive, and then module.
+
+        Submodules are indexed by package prefix from ``sys.modules`` and
+        ordered deepest first. Submodules which are instances of the
+        excluded class are omitted.
+    '''
+    if not recursive: return [ module ]
+    prefix = f"{module.__name__}."
+    modules = [
+        module_ for mname, module_ in tuple( __.sys.modules.items( ) )
+        if mname.startswith( prefix )
+        and isinstance( module_, __.types.ModuleType )
+        and not ( excludes and isinstance( module_, excludes ) ) ]
+    modules.sort( key = lambda m: m.__name__.count( '.' ), reverse = True )
+    modules.append( module )
+    return modules
+
+
+def _defer_docstrings(
+    module: __.types.ModuleType, /,
+    configuration: __.DynadocConfiguration,
+) -> None:
+    ''' Replaces module docstring with deferral of its rendering. '''
+    if not isinstance(
+        vars( type( module ) ).get( '__doc__' ), _ModuleDocstring
+    ): return
+    namespace = vars( module )
+    docstring = namespace.get( '__doc__' )
+    if isinstance( docstring, __.DocstringDeferral ): return
+    namespace[ '__doc__' ] = __.DocstringDeferral( docstring, configuration )
+
+
+def _exclude_module_targets(
+    introspection: __.ddoc.IntrospectionControl
+) -> __.ddoc.IntrospectionControl:
+    ''' Excludes modules from introspection targets.
+
+        Each module of a package tree is documented individually.
+    '''
+    module_target = __.ddoc.IntrospectionTargets.Module
+    if not ( introspection.targets & module_target ): return introspection
+    return introspection.with_limit(
+        __.ddoc.IntrospectionLimit( targets_exclusions = module_target ) )
+
+
+def _is_private_module(
+    module: __.types.ModuleType, package: __.types.ModuleType
+) -> bool:
+    ''' Is submodule, or any package between it and package, private? '''
+    mname = module.__name__.removeprefix( f"{package.__name__}." )
+    return any( part.startswith( '_' ) for part in mname.split( '.' ) )
+
+
+def _produce_module_sealer(
+    attributes_namer: __.AttributesNamer,
+    replacement_class: type[ __.types.ModuleType ],
+) -> __.cabc.Callable[ [ __.types.ModuleType ], None ]:
+    ''' Produces function which reclassifies and seals modules.
+
+        Behaviors attribute name is mangled once for the replacement class
+        rather than per module. Module classes cannot add slots, so behaviors
+        are recorded directly into module namespaces.
+    '''
+    name_m = __.ccutils.mangle_name(
+        replacement_class, attributes_namer( 'instance', 'behaviors' ) )
+
+    def seal( module: __.types.ModuleType ) -> None:
+        module.__class__ = replacement_class
+        vars( module )[ name_m ] = _module_behaviors
+
+    return seal
+
+
+def _resolve_docstrings_mode(
+    docstrings: DocstringsArgument,
+    replacement_class: type[ __.types.ModuleType ],
+) -> DocstringsModes:
+    ''' Resolves docstrings mode for replacement class. '''
+    if __.is_absent( docstrings ): docstrings = __.docstrings_mode
+    if (    docstrings is DocstringsModes.Lazy
+        and not isinstance(
+            vars( replacement_class ).get( '__doc__' ), _ModuleDocstring )
+    ): return DocstringsModes.Eager
+    return docstrings
 
 
 @__.typx.deprecated( "Use 'finalize_module' function instead." )
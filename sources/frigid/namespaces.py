@@ -46,38 +46,536 @@
 
 from . import __
 from . import classes as _classes
+from . import modules as _modules
+
+
+_behaviors: dict[ type, tuple[ __.typx.Any, __.typx.Any ] ] = { }
+_nested_shapes: dict[
+    type, tuple[ type, tuple[ __.typx.Any, ... ] ] ] = { }
+_shapes: dict[
+    tuple[ type, tuple[ __.typx.Any, ... ] ],
+    tuple[ type, __.typx.Optional[ tuple[ __.typx.Any, ... ] ] ],
+] = { }
+# Beyond this, new shapes are dictionary-backed and other caches are not
+# extended.
+_shapes_maximum = 1024
+_shapeables: dict[ type, bool ] = { }
 
 
 class Namespace( metaclass = _classes.Class ): # noqa: PLW1641
     # TODO: Dynadoc fragments.
-    ''' Immutable namespaces. '''
+    ''' Immutable namespaces.
+
+        Instances with the same attribute names share a slotted class,
+        which is generated on first use and then cached. Attributes, which
+        cannot be slotted, are stored in an instance dictionary instead.
+        Generated classes are subclasses of the namespace class, which
+        they impersonate in representations and error messages; instances
+        should be tested with 'isinstance' rather than by identity of type.
+
+        Subclasses, which do not declare slots or which define their own
+        initializers or allocators, store attributes in instance
+        dictionaries and receive initialization arguments unaltered.
+        Subclasses, which set '_digests_memoized_', retain content digests
+        of their instances in a slot.
+    '''
+
+    __slots__ = ( )
 
-    __slots__ = ( '__dict__', )
+    _digests_memoized_: __.typx.ClassVar[ bool ] = False
+    _shape_names_: __.typx.ClassVar[
+        __.typx.Optional[ tuple[ str, ... ] ] ] = None
+    _shape_origin_: __.typx.ClassVar[ __.typx.Optional[ type ] ] = None
+
+    def __new__(
+        cls,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **attributes: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        origin = cls._shape_origin_ or cls
+        if origin is not Namespace and not _is_shapeable( origin ):
+            # Attributes are populated during initialization.
+            shape, _ = _access_shape( origin, ( None, ) )
+            return super( ).__new__( shape )
+        if iterables: attributes = _merge_attributes( iterables, attributes )
+        shape, slots = _access_shape( origin, tuple( attributes ) )
+        self = super( ).__new__( shape )
+        if slots is None: self.__dict__.update( attributes )
+        else:
+            for slot, value in zip( slots, attributes.values( ) ):
+                slot.__set__( self, value )
+        return self
 
     def __init__(
         self,
         *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
         **attributes: __.DictionaryNominativeArgument[ __.V ],
     ) -> None:
-        self.__dict__.update( # pyright: ignore
-            __.ImmutableDictionary(
-                *iterables, **attributes ) )
+        # Attributes of shapeable classes are populated during construction.
+        cls = type( self )
+        if cls._shape_names_ is None and not _is_shapeable(
+            cls._shape_origin_ or cls
+        ):
+            self.__dict__.update( # pyright: ignore
+                __.ImmutableDictionary( *iterables, **attributes ) )
         super( ).__init__( )
 
+    @classmethod
+    def _from_data_(
+        cls, data: __.cabc.Mapping[ __.typx.Any, __.typx.Any ]
+    ) -> __.typx.Self:
+        ''' Produces namespace which shares data, if possible.
+
+            Data must not be mutated afterwards.
+        '''
+        if isinstance( data, _AttributesView ): return data.namespace
+        origin = cls._shape_origin_ or cls
+        if not isinstance( data, dict ): return origin( data )
+        shape, _ = _access_shape( origin, ( None, ) )
+        _, behaviors = _access_behaviors( shape )
+        self = super( ).__new__( shape )
+        object.__setattr__( self, '__dict__', data )
+        __.activate_instance_behaviors( self, behaviors )
+        return self
+
+    @classmethod
+    def _from_trusted_(
+        cls,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **attributes: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        ''' Produces namespace from trusted attributes, without verification.
+
+            Duplicate names are not detected; later values prevail. Suitable
+            for attributes of other namespaces or of trusted snapshots.
+        '''
+        if iterables:
+            attributes_: dict[ __.typx.Any, __.typx.Any ] = { }
+            for element in iterables: attributes_.update( element )
+            attributes_.update( attributes )
+            attributes = attributes_
+        origin = cls._shape_origin_ or cls
+        shape, slots = _access_shape( origin, tuple( attributes ) )
+        if slots is None: return origin._from_data_( attributes )
+        behaviors_slot, behaviors = _access_behaviors( shape )
+        self = super( ).__new__( shape )
+        for slot, value in zip( slots, attributes.values( ) ):
+            slot.__set__( self, value )
+        behaviors_slot.__set__( self, behaviors )
+        return self
+
+    def as_dictionary( self ) -> __.cabc.Mapping[ __.typx.Any, __.typx.Any ]:
+        ''' Provides dictionary which shares attributes of namespace.
+
+            Attributes are not copied. As both namespace and dictionary are
+            immutable, each behaves as an independent object.
+        '''
+        from .dictionaries import Dictionary
+        if type( self )._shape_names_ is None:
+            return Dictionary._from_data_( self.__dict__ )
+        return Dictionary._from_data_( _AttributesView( self ) )
+
+    @classmethod
+    def factory(
+        cls,
+        names: __.typx.Annotated[
+            __.cabc.Iterable[ __.cabc.Hashable ],
+            __.ddoc.Doc( ''' Attribute names, in positional order. ''' ),
+        ],
+    ) -> __.cabc.Callable[ ..., __.typx.Self ]:
+        ''' Produces fast constructor for namespaces with same attributes.
+
+            The constructor accepts attribute values positionally. Validation
+            of names and lookup of the namespace class occur once, rather than
+            per constructed namespace. Classes with custom initializers or
+            allocators are rejected, since the constructor would bypass them.
+        '''
+        names_ = tuple( names )
+        if len( frozenset( names_ ) ) != len( names_ ):
+            from .exceptions import NamesInvalidity
+            raise NamesInvalidity( ( ), ( ), duplicate = dict.fromkeys(
+                name for i, name in enumerate( names_ )
+                if name in names_[ : i ] ) )
+        origin = cls._shape_origin_ or cls
+        if _is_constructed_customarily( origin ):
+            from .exceptions import ConstructorProductionFailure
+            raise ConstructorProductionFailure( origin.__qualname__ )
+        return _produce_constructor( origin, names_ )
+
+    @classmethod
+    def from_rows(
+        cls,
+        names: __.typx.Annotated[
+            __.cabc.Iterable[ __.cabc.Hashable ],
+            __.ddoc.Doc( ''' Attribute names, in positional order. ''' ),
+        ],
+        rows: __.typx.Annotated[
+            __.cabc.Iterable[
+                __.cabc.Sequence[ __.typx.Any ]
+                | __.cabc.Mapping[ __.typx.Any, __.typx.Any ] ],
+            __.ddoc.Doc(
+                ''' Sequences of values, in same order as names,
+                    or mappings from names to values. ''' ),
+        ],
+    ) -> tuple[ __.typx.Self, ... ]:
+        ''' Produces namespaces with same attributes from rows of values.
+
+            Mappings must have entries for all names and no others.
+        '''
+        names_ = tuple( names )
+        produce = cls.factory( names_ )
+        expected = frozenset( names_ )
+
+        def acquire(
+            row: __.cabc.Mapping[ __.typx.Any, __.typx.Any ]
+        ) -> list[ __.typx.Any ]:
+            if row.keys( ) != expected:
+                from .exceptions import NamesInvalidity
+                raise NamesInvalidity(
+                    [ name for name in names_ if name not in row ],
+                    [ name for name in row if name not in expected ] )
+            return [ row[ name ] for name in names_ ]
+
+        return tuple(
+            produce( *(
+                acquire( row )
+                if isinstance( row, __.cabc.Mapping ) else row ) )
+            for row in rows )
+
+    @classmethod
+    def from_nested(
+        cls,
+        mapping: __.typx.Annotated[
+            __.cabc.Mapping[ __.typx.Any, __.typx.Any ],
+            __.ddoc.Doc( ''' Mapping, which may contain other mappings. ''' ),
+        ],
+    ) -> __.typx.Self:
+        ''' Produces namespace which lazily wraps nested mappings.
+
+            Values, which are mappings, become namespaces on first attribute
+            access rather than on construction. Each such namespace is
+            memoized, so that subsequent accesses return the same object.
+            Nested mappings are copied on construction, so that later
+            mutations of them do not alter the namespace.
+        '''
+        return _produce_nested(
+            cls._shape_origin_ or cls, _snapshot_nested( mapping ) )
+
+    @property
+    def __dict__( self ) -> dict[ str, __.typx.Any ]: # pyright: ignore
+        # Fresh dictionary from slots. Overridden on dictionary-backed shapes.
+        names = type( self )._shape_names_ or ( )
+        return { name: getattr( self, name ) for name in names }
+
+    def __reduce__( self ) -> tuple[ __.typx.Any, ... ]:
+        origin = type( self )._shape_origin_ or type( self )
+        if _is_shapeable( origin ): return origin, ( dict( self.__dict__ ), )
+        # Initializers of subclasses may have other signatures.
+        return origin._from_trusted_, ( dict( self.__dict__ ), )
+
     def __repr__( self ) -> str:
         attributes = ', '.join(
             f"{key} = {value!r}" for key, value
             in getattr( self, '__dict__', { } ).items( ) )
-        fqname = __.ccutils.qualify_class_name( type( self ) )
+        origin = type( self )._shape_origin_ or type( self )
+        fqname = __.ccutils.qualify_class_name( origin )
         if not attributes: return f"{fqname}( )"
         return f"{fqname}( {attributes} )"
 
     def __eq__( self, other: __.typx.Any ) -> __.ComparisonResult:
         if isinstance( other, ( Namespace, __.types.SimpleNamespace ) ):
-            return self.__dict__ == other.__dict__
+            return _equate_attributes( self.__dict__, other.__dict__ )
         return NotImplemented
 
     def __ne__( self, other: __.typx.Any ) -> __.ComparisonResult:
         if isinstance( other, ( Namespace, __.types.SimpleNamespace ) ):
-            return self.__dict__ != other.__dict__
+            return not _equate_attributes( self.__dict__, other.__dict__ )
         return NotImplemented
+
+
+class _AttributesView( __.cabc.Mapping[ str, __.typx.Any ] ):
+    ''' Mapping over slotted attributes of namespace. '''
+
+    __slots__ = ( 'namespace', )
+
+    def __init__( self, namespace: Namespace ) -> None:
+        self.namespace = namespace
+
+    def __getitem__( self, name: str ) -> __.typx.Any:
+        if name not in type( self.namespace )._shape_names_: # pyright: ignore
+            raise KeyError( name )
+        return getattr( self.namespace, name )
+
+    def __iter__( self ) -> __.cabc.Iterator[ str ]:
+        return iter( type( self.namespace )._shape_names_ ) # pyright: ignore
+
+    def __len__( self ) -> int:
+        return len( type( self.namespace )._shape_names_ ) # pyright: ignore
+
+    def __repr__( self ) -> str:
+        return repr( dict( self.items( ) ) )
+
+
+class _NestedAttribute:
+    ''' Wraps mapping in slot as nested namespace on first access. '''
+
+    __slots__ = ( 'slot', )
+
+    def __init__( self, slot: __.typx.Any ) -> None:
+        self.slot = slot
+
+    def __get__(
+        self, instance: __.typx.Any, owner: __.typx.Optional[ type ] = None
+    ) -> __.typx.Any:
+        if instance is None: return self
+        value = self.slot.__get__( instance, owner )
+        if isinstance( value, __.cabc.Mapping ):
+            value = _produce_nested( type( instance )._shape_origin_, value )
+            self.slot.__set__( instance, value )
+        return value
+
+
+def _snapshot_nested(
+    mapping: __.cabc.Mapping[ __.typx.Any, __.typx.Any ]
+) -> dict[ __.typx.Any, __.typx.Any ]:
+    ''' Copies mapping and mappings nested within it. '''
+    return {
+        name: (
+            _snapshot_nested( value )
+            if isinstance( value, __.cabc.Mapping ) else value )
+        for name, value in mapping.items( ) }
+
+
+def _access_behaviors( shape: type ) -> tuple[ __.typx.Any, __.typx.Any ]:
+    ''' Accesses slot and value of instance behaviors for namespace class. '''
+    behaviors = _behaviors.get( shape )
+    if behaviors is not None: return behaviors
+    # Behaviors are the same for all instances of a class.
+    behaviors = (
+        getattr( shape, __.instance_behaviors_name ),
+        __.calculate_instance_behaviors( shape ) )
+    if len( _behaviors ) >= _shapes_maximum: return behaviors
+    return _behaviors.setdefault( shape, behaviors )
+
+
+def _access_nested_shape(
+    shape: type, slots: tuple[ __.typx.Any, ... ]
+) -> __.typx.Optional[ tuple[ type, tuple[ __.typx.Any, ... ] ] ]:
+    ''' Accesses cached class, which lazily wraps nested mappings.
+
+        Returns nothing, if cache is full.
+    '''
+    nested = _nested_shapes.get( shape )
+    if nested is not None: return nested
+    if len( _nested_shapes ) >= _shapes_maximum: return None
+    return _nested_shapes.setdefault(
+        shape, _produce_nested_shape( shape, slots ) )
+
+
+def _access_shape(
+    origin: type, names: tuple[ __.typx.Any, ... ]
+) -> tuple[ type, __.typx.Optional[ tuple[ __.typx.Any, ... ] ] ]:
+    ''' Accesses cached class and slot descriptors for attribute names. '''
+    shape = _shapes.get( ( origin, names ) )
+    if shape is not None: return shape
+    if (    len( _shapes ) >= _shapes_maximum
+        or not _is_shapeable( origin )
+        or not all( _is_slottable_name( origin, name ) for name in names )
+    ): names = ( None, ) # Dictionary-backed shape for class.
+    shape = _shapes.get( ( origin, names ) )
+    if shape is None:
+        shape = _shapes.setdefault(
+            ( origin, names ), _produce_shape( origin, names ) )
+    return shape
+
+
+def _produce_constructor(
+    origin: type[ Namespace ], names: tuple[ __.typx.Any, ... ]
+) -> __.cabc.Callable[ ..., __.typx.Any ]:
+    ''' Produces constructor which bypasses general initialization. '''
+    shape, slots = _access_shape( origin, names )
+    behaviors_slot, behaviors = _access_behaviors( shape )
+    count = len( names )
+    new = object.__new__
+
+    def produce( *values: __.typx.Any ) -> __.typx.Any:
+        if len( values ) != count:
+            from .exceptions import ValuesCountInvalidity
+            raise ValuesCountInvalidity( count, len( values ) )
+        self = new( shape )
+        if slots is None: self.__dict__.update( zip( names, values ) )
+        else:
+            for slot, value in zip( slots, values ):
+                slot.__set__( self, value )
+        behaviors_slot.__set__( self, behaviors )
+        return self
+
+    return produce
+
+
+def _equate_attributes(
+    attributes: __.cabc.Mapping[ __.typx.Any, __.typx.Any ],
+    attributes_: __.cabc.Mapping[ __.typx.Any, __.typx.Any ],
+) -> bool:
+    ''' Are attributes equal, treating nested mappings as namespaces?
+
+        Nested mappings equal namespaces with same attributes, as produced
+        from them by 'from_nested'.
+    '''
+    if attributes == attributes_: return True
+    if attributes.keys( ) != attributes_.keys( ): return False
+    for name, value in attributes.items( ):
+        value_ = attributes_[ name ]
+        if (
+            isinstance( value, Namespace )
+            and isinstance( value_, __.cabc.Mapping )
+        ):
+            equal = _equate_attributes( value.__dict__, value_ )
+        elif (
+            isinstance( value_, Namespace )
+            and isinstance( value, __.cabc.Mapping )
+        ):
+            equal = _equate_attributes( value, value_.__dict__ )
+        else: equal = value == value_
+        if not equal: return False
+    return True
+
+
+def _is_constructed_customarily( origin: type ) -> bool:
+    ''' Does any class between it and namespace base customize construction?
+
+        Initializers are wrapped by class decoration, so only custom
+        initializers have wrapped originals.
+    '''
+    bases = origin.__mro__[ : origin.__mro__.index( Namespace ) ]
+    return any(
+            '__new__' in base.__dict__
+        or getattr(
+            base.__dict__.get( '__init__' ), '__wrapped__', None ) is not None
+        for base in bases )
+
+
+def _is_shapeable( origin: type ) -> bool:
+    ''' Can attributes of namespace class be stored in generated shapes?
+
+        Only if every class between it and the namespace base declares slots
+        and defines neither initializer nor allocator. Otherwise, instances
+        have dictionaries, which would hide slotted attributes, or
+        initializers, which expect their own arguments.
+    '''
+    shapeable = _shapeables.get( origin )
+    if shapeable is not None: return shapeable
+    bases = origin.__mro__[ : origin.__mro__.index( Namespace ) ]
+    shapeable = (
+            all( '__slots__' in base.__dict__ for base in bases )
+        and not _is_constructed_customarily( origin ) )
+    if len( _shapeables ) >= _shapes_maximum: return shapeable
+    return _shapeables.setdefault( origin, shapeable )
+
+
+def _is_slottable_name( origin: type, name: __.typx.Any ) -> bool:
+    return (
+            isinstance( name, str )
+        and name.isidentifier( )
+        and not name.startswith( '__' )
+        and name != __.digest_name
+        and not hasattr( origin, name ) )
+
+
+def _merge_attributes(
+    iterables: __.cabc.Sequence[
+        __.DictionaryPositionalArgument[ __.H, __.V ] ],
+    attributes: dict[ str, __.typx.Any ],
+) -> dict[ __.typx.Any, __.typx.Any ]:
+    ''' Merges attributes in order received, forbidding duplicates. '''
+    attributes_: dict[ __.typx.Any, __.typx.Any ] = { }
+    from itertools import chain
+    for name, value in chain.from_iterable( map( # pyright: ignore
+        lambda element: ( # pyright: ignore
+            element.items( )
+            if isinstance( element, __.cabc.Mapping )
+            else element
+        ),
+        ( *iterables, attributes )
+    ) ):
+        if name in attributes_:
+            from .exceptions import EntryImmutability
+            raise EntryImmutability( name )
+        attributes_[ name ] = value
+    return attributes_
+
+
+def _produce_nested(
+    origin: type[ Namespace ], mapping: dict[ __.typx.Any, __.typx.Any ]
+) -> Namespace:
+    ''' Produces namespace which lazily wraps snapshot of nested mappings. '''
+    shape, slots = _access_shape( origin, tuple( mapping ) )
+    nested = (
+        None if slots is None else _access_nested_shape( shape, slots ) )
+    if nested is None: # Unslottable names or full cache. Wrap eagerly.
+        return origin._from_trusted_( {
+            name: (
+                _produce_nested( origin, value )
+                if isinstance( value, dict ) else value )
+            for name, value in mapping.items( ) } )
+    shape, slots = nested
+    behaviors_slot, behaviors = _access_behaviors( shape )
+    self = object.__new__( shape )
+    for slot, value in zip( slots, mapping.values( ) ):
+        slot.__set__( self, value )
+    behaviors_slot.__set__( self, behaviors )
+    return self
+
+
+def _produce_shape(
+    origin: type, names: tuple[ __.typx.Any, ... ]
+) -> tuple[ type, __.typx.Optional[ tuple[ __.typx.Any, ... ] ] ]:
+    ''' Produces slotted or dictionary-backed subclass of namespace class. '''
+    digests: tuple[ str, ... ] = (
+        ( __.digest_name, )
+        if getattr( origin, '_digests_memoized_', False ) else ( ) )
+    if names == ( None, ):
+        # Unslotted subclasses already have instance dictionaries.
+        if origin.__dictoffset__: return origin, None
+        slots: tuple[ str, ... ] = ( '__dict__', *digests )
+        names_ = None
+        qualname = f"{origin.__qualname__}[...]"
+    else:
+        names_ = names
+        slots = ( *names, *digests )
+        qualname = "{qualname}[{names}]".format(
+            qualname = origin.__qualname__, names = ', '.join( names ) )
+    # Qualified names of shapes must differ, as private names derive from
+    # them. Shapes impersonate their origins in errors instead.
+    shape = type( origin )(
+        origin.__name__, ( origin, ), {
+            '__doc__': origin.__doc__,
+            '__module__': origin.__module__,
+            '__qualname__': qualname,
+            '__slots__': slots,
+            __.impersonation_name: origin,
+            '_shape_names_': names_,
+            '_shape_origin_': origin,
+        } )
+    if names_ is None: return shape, None
+    return shape, tuple( shape.__dict__[ name ] for name in names_ )
+
+
+def _produce_nested_shape(
+    shape: type, slots: tuple[ __.typx.Any, ... ]
+) -> tuple[ type, tuple[ __.typx.Any, ... ] ]:
+    ''' Produces subclass of slotted class, which wraps nested mappings. '''
+    names: tuple[ str, ... ] = shape._shape_names_ # pyright: ignore
+    nested = type( shape )(
+        shape.__name__, ( shape, ), {
+            '__doc__': shape.__doc__,
+            '__module__': shape.__module__,
+            '__qualname__': f"{shape.__qualname__}.<nested>",
+            '__slots__': ( ),
+            **{ name: _NestedAttribute( slot )
+                for name, slot in zip( names, slots ) },
+        } )
+    return nested, slots
+
+
+_modules.finalize_module( __name__, dynadoc_table = __.fragments )
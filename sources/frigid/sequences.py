@@ -22,6 +22,7 @@
 
 
 from . import __
+from . import modules as _modules
 
 
 def one( value: __.V ) -> tuple[ __.V, ... ]:
@@ -36,3 +37,6 @@ def one( value: __.V ) -> tuple[ __.V, ... ]:
         * Situations where formatter behavior with trailing commas is undesired
     '''
     return value,
+
+
+_modules.finalize_module( __name__, dynadoc_table = __.fragments )
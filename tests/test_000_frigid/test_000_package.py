@@ -26,6 +26,13 @@ import pytest
 from . import __
 
 
+_IMPORT_DEFERRALS_PROBE = '''
+import sys
+import {package_name}
+print( *sorted( sys.modules ) )
+'''
+
+
 @pytest.mark.parametrize( 'package_name', __.PACKAGES_NAMES )
 def test_000_sanity( package_name ):
     ''' Package is sane. '''
@@ -41,3 +48,64 @@ def test_100_sanity( module_qname ):
     module = __.cache_import_module( module_qname )
     assert module.__package__ == package_name
     assert module.__name__ == module_qname
+
+
+@pytest.mark.parametrize(
+    'name, module_name',
+    (
+        ( 'Dictionary', 'dictionaries' ),
+        ( 'digest', 'digests' ),
+        ( 'install', 'installers' ),
+        ( 'Namespace', 'namespaces' ),
+        ( 'one', 'sequences' ),
+    )
+)
+def test_200_lazy_exports( name, module_name ):
+    ''' Package provides exports of submodules upon access. '''
+    package = __.cache_import_module( __.PACKAGE_NAME )
+    module = getattr( package, module_name )
+    assert module is __.cache_import_module(
+        f"{__.PACKAGE_NAME}.{module_name}" )
+    assert getattr( package, name ) is getattr( module, name )
+    assert vars( package )[ name ] is getattr( module, name )
+    assert isinstance( module, package.Module )
+
+
+def test_201_lazy_exports_absence( ):
+    ''' Package raises attribute error for nonexistent attribute. '''
+    package = __.cache_import_module( __.PACKAGE_NAME )
+    with pytest.raises( AttributeError ):
+        package.nonexistent_attribute
+    assert not hasattr( package, 'nonexistent_attribute' )
+
+
+def test_202_lazy_exports_survey( ):
+    ''' Package surveys and star-exports names of unloaded submodules. '''
+    package = __.cache_import_module( __.PACKAGE_NAME )
+    for name in ( 'Dictionary', 'Namespace', 'digest', 'install', 'one' ):
+        assert name in dir( package )
+        assert name in package.__all__
+    assert 'construct_from_rows' in package.__all__
+    assert not any( name.startswith( '_' ) for name in package.__all__ )
+    namespace = { }
+    exec( f"from {__.PACKAGE_NAME} import *", namespace ) # noqa: S102
+    assert namespace[ 'Namespace' ] is package.Namespace
+
+
+@pytest.mark.parametrize( 'mode', ( 'eager', 'lazy', 'skip' ) )
+def test_203_lazy_exports_deferral( mode ):
+    ''' Package import does not load deferred submodules or helpers. '''
+    import os
+    import subprocess
+    import sys
+    environment = dict( os.environ, FRIGID_DOCSTRINGS = mode )
+    probe = _IMPORT_DEFERRALS_PROBE.format( package_name = __.PACKAGE_NAME )
+    result = subprocess.run( # noqa: S603
+        ( sys.executable, '-c', probe ),
+        capture_output = True, check = True, env = environment, text = True )
+    modules = frozenset( result.stdout.split( ) )
+    assert f"{__.PACKAGE_NAME}.classes" in modules
+    for name in (
+        'dictionaries', 'digests', 'installers', 'namespaces', 'sequences',
+        '__.exceptions', '__.rows', '__.trusts',
+    ): assert f"{__.PACKAGE_NAME}.{name}" not in modules
@@ -33,3 +33,22 @@ def test_100_exports( module_name ):
     ''' Module exports expected names. '''
     module = __.cache_import_module( f"{__.PACKAGE_NAME}.__.imports" )
     assert hasattr( module, module_name )
+
+
+def test_200_discover_slot( ):
+    ''' Slot descriptors are discovered, unless shadowed. '''
+    module = __.cache_import_module( f"{__.PACKAGE_NAME}.__.slots" )
+
+    class Base:
+        __slots__ = ( 'value', )
+
+    class Derivative( Base ):
+        __slots__ = ( )
+
+    class Shadow( Base ):
+        value = 1
+
+    assert Base.__dict__[ 'value' ] is (
+        module.discover_slot( Derivative, 'value' ) )
+    assert module.discover_slot( Shadow, 'value' ) is None
+    assert module.discover_slot( Derivative, 'other' ) is None
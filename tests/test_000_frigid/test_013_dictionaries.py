@@ -67,6 +67,30 @@ def test_202_immutable_dictionary_prevents_key_overwrite( ):
         module.ImmutableDictionary( [ ( 'a', 1 ) ], { 'a': 2 } )
 
 
+def test_203_immutable_dictionary_reports_duplicates_in_order( ):
+    ''' Dictionary reports first duplicate key within or across inputs. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.__.exceptions" )
+    with pytest.raises( exceptions.EntryImmutability, match = "'b'" ):
+        module.ImmutableDictionary(
+            ( pair for pair in ( ( 'a', 1 ), ( 'b', 2 ), ( 'b', 3 ) ) ) )
+    with pytest.raises( exceptions.EntryImmutability, match = "'c'" ):
+        module.ImmutableDictionary( { 'c': 1, 'd': 2 }, c = 3, d = 4 )
+
+
+def test_204_immutable_dictionary_from_trusted( ):
+    ''' Dictionary is produced from trusted entries and is protected. '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.__.exceptions" )
+    dct = module.ImmutableDictionary._from_trusted_(
+        ( pair for pair in ( ( 'a', 1 ), ( 'a', 2 ) ) ), b = 3 )
+    assert { 'a': 2, 'b': 3 } == dct
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct[ 'c' ] = 4
+    with pytest.raises( exceptions.EntryImmutability ):
+        del dct[ 'a' ]
+
+
 def test_210_immutable_dictionary_entry_protection( ):
     ''' Dictionary prevents entry modification and deletion. '''
     module = cache_import_module( MODULE_QNAME )
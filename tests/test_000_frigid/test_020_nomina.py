@@ -41,4 +41,26 @@ from .__ import PACKAGE_NAME, cache_import_module
 def test_100_is_public_identifier( name, expected ):
     ''' Function correctly identifies public identifiers. '''
     module = cache_import_module( f"{PACKAGE_NAME}.__.nomina" )
-    assert module.is_public_identifier( name ) is expected
\ No newline at end of file
+    assert module.is_public_identifier( name ) is expected
+
+
+def test_110_mangle_attrname( ):
+    ''' Mangled names match Classcore and are memoized per class. '''
+    import classcore.utilities as ccutils
+    module = cache_import_module( f"{PACKAGE_NAME}.__.nomina" )
+
+    class Foo: pass
+
+    name_m = module.mangle_attrname( Foo, '_behaviors_' )
+    assert ccutils.mangle_name( Foo, '_behaviors_' ) == name_m
+    assert name_m is module.mangle_attrname( Foo, '_behaviors_' )
+    Foo.__qualname__ = 'Bar'
+    assert name_m != module.mangle_attrname( Foo, '_behaviors_' )
+
+
+def test_111_mangle_attrname_limit( ):
+    ''' Memoized names are flushed when limit is reached. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.__.nomina" )
+    for _ in range( module._mangled_names_limit + 1 ):
+        module.mangle_attrname( type( 'Foo', ( ), { } ), '_behaviors_' )
+    assert len( module._mangled_names ) <= module._mangled_names_limit
@@ -21,11 +21,68 @@
 ''' Assert correct function of classes module. '''
 
 
+import dataclasses
+import typing
+import weakref
+
+from types import MappingProxyType as DictionaryProxy
+
 import pytest
+import typing_extensions as typx
 
 from .__ import PACKAGE_NAME, cache_import_module
 
 
+behaviors = cache_import_module( f"{PACKAGE_NAME}.__.behaviors" )
+classes = cache_import_module( f"{PACKAGE_NAME}.classes" )
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+
+# Dataclasses defined at module level: slotted replacements of nested classes
+# lose their qualified names before Classcore can track their construction.
+
+
+class InitializedData( classes.DataclassObject ):
+    value: int
+    items: list[ int ] = dataclasses.field( default_factory = list )
+    fixed: int = dataclasses.field( default = 5, init = False )
+    derived: int = dataclasses.field( init = False )
+    scale: dataclasses.InitVar[ int ] = 2
+    position: int = dataclasses.field( default = 0, kw_only = False )
+
+    def __post_init__( self, scale: int ) -> None:
+        self.derived = self.value * scale
+
+
+class InitializedDataDerivative( InitializedData ):
+    label: str = 'data'
+
+
+class InitializedDataCustom( classes.DataclassObject ):
+    value: int
+
+    def __init__( self, value: int ) -> None:
+        self.value = value * 10
+
+
+class InitializedDataProtocol( classes.DataclassProtocol ):
+    value: int
+
+
+class InitializedDataShadowing( classes.DataclassObject ):
+    type: str
+    self: int = 0
+    instance: int = 0
+
+
+class InitializedDataActivating( classes.DataclassObject ):
+    value: int
+
+    def __post_init__( self ) -> None:
+        behaviors.activate_instance_behaviors(
+            self, frozenset( ( 'custom', ) ) )
+
+
 def test_100_provide_error_class_failure():
     ''' Error provider raises for unknown error names. '''
     classes_module = cache_import_module( f"{PACKAGE_NAME}.classes" )
@@ -36,4 +93,971 @@ def test_100_provide_error_class_failure():
     
     message = str( exc_info.value )
     assert 'NonExistentError' in message
-    assert 'Does not exist' in message
\ No newline at end of file
+    assert 'Does not exist' in message
+
+
+def test_110_specialized_hooks_enforce_immutability( ):
+    ''' Specialized attribute hooks enforce immutability after init. '''
+    import re
+    classes_module = cache_import_module( f"{PACKAGE_NAME}.classes" )
+    exceptions_module = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+
+    class Example(
+        classes_module.Object,
+        instances_mutables = (
+            'counter',
+            re.compile( r'cache_.*' ),
+            lambda name: name.startswith( 'scratch_' ) ),
+    ):
+        def __init__( self ) -> None:
+            self.value = 42
+            super( ).__init__( )
+
+    assert '__setattr__' in Example.__dict__
+    obj = Example( )
+    obj.counter = 1
+    obj.cache_result = 2
+    obj.scratch_area = 3
+    del obj.counter
+    del obj.cache_result
+    del obj.scratch_area
+    with pytest.raises( exceptions_module.AttributeImmutability ):
+        obj.value = 13
+    with pytest.raises( exceptions_module.AttributeImmutability ):
+        del obj.value
+    assert 42 == obj.value
+
+    class Derivative( Example ): pass
+
+    derivative = Derivative( )
+    derivative.counter = 1
+    with pytest.raises( exceptions_module.AttributeImmutability ):
+        derivative.value = 13
+
+
+def test_111_specialized_hooks_for_mutable_instances( ):
+    ''' Specialized attribute hooks permit changes on mutable instances. '''
+    classes_module = cache_import_module( f"{PACKAGE_NAME}.classes" )
+
+    class Example( classes_module.ObjectMutable ): pass
+
+    obj = Example( )
+    obj.value = 42
+    obj.value = 13
+    del obj.value
+    assert not hasattr( obj, 'value' )
+
+
+def test_112_specialization_preserves_custom_hooks( ):
+    ''' Classes with custom hooks or cores are not specialized. '''
+    classes_module = cache_import_module( f"{PACKAGE_NAME}.classes" )
+    exceptions_module = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    assignments: list[ str ] = [ ]
+
+    class Custom( classes_module.Object ):
+        def __setattr__( self, name: str, value: object ) -> None:
+            assignments.append( name )
+            super( ).__setattr__( name, value )
+
+    obj = Custom( )
+    assert not assignments  # Behaviors are activated without custom hook.
+    with pytest.raises( exceptions_module.AttributeImmutability ):
+        obj.value = 42
+    assert not assignments
+
+    def assign_core( obj: object, /, *, ligation, name, value, **nomargs ):
+        assignments.append( f"core:{name}" )
+        ligation( name, value )
+
+    class Cored(
+        classes_module.Object, instances_assigner_core = assign_core
+    ): pass
+
+    cored = Cored( )
+    cored.value = 42
+    assert 'core:value' in assignments
+    assert 42 == cored.value
+
+
+def test_113_specialized_initializer_shares_behaviors( ):
+    ''' Instances of class share one set of activated behaviors. '''
+
+    class Initialized( classes.Object ):
+        def __init__( self, value: int ) -> None:
+            self.value = value
+            super( ).__init__( )
+
+    class Derivative( Initialized ): pass
+
+    obj1, obj2 = Initialized( 1 ), Initialized( 2 )
+    name = next(
+        name for name in obj1.__dict__ if name.startswith( '_frigid' ) )
+    assert obj1.__dict__[ name ] is obj2.__dict__[ name ]
+    assert isinstance( obj1.__dict__[ name ], frozenset )
+    assert 1 == obj1.value
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj1.value = 3
+    obj3 = Derivative( 3 )
+    assert 3 == obj3.value
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj3.value = 4
+
+
+def test_114_specialized_initializer_merges_behaviors( ):
+    ''' Specialized initializers merge behaviors activated beforehand. '''
+
+    class Initialized( classes.Object ):
+        def __init__( self, value: int ) -> None:
+            self.value = value
+            behaviors.activate_instance_behaviors(
+                self, frozenset( ( 'custom', ) ) )
+            super( ).__init__( )
+
+    obj = Initialized( 1 )
+    name = next(
+        name for name in obj.__dict__ if name.startswith( '_frigid' ) )
+    assert 'custom' in obj.__dict__[ name ]
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj.value = 2
+    obj_ = InitializedDataActivating( value = 1 )
+    extant = getattr( obj_, behaviors.instance_behaviors_name )
+    assert 'custom' in extant
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj_.value = 2
+
+
+def test_115_specialization_fallback( monkeypatch ):
+    ''' Unrecognized Classcore releases leave standard hooks in place. '''
+    # Modules are immutable; patch their namespaces instead.
+    monkeypatch.setitem( vars( behaviors ), '_classcore_verified', False )
+
+    class Initialized( classes.Object ):
+        def __init__( self, value: int ) -> None:
+            self.value = value
+            super( ).__init__( )
+
+    class Implicit( classes.Object ): pass
+
+    assert 'initialize_with_original' == (
+        Initialized.__init__.__code__.co_name )
+    assert 'initialize_with_super' == Implicit.__init__.__code__.co_name
+    assert 'assign_with_super' == Initialized.__setattr__.__code__.co_name
+    assert 'delete_with_super' == Initialized.__delattr__.__code__.co_name
+    obj = Initialized( 1 )
+    assert 1 == obj.value
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj.value = 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        del obj.value
+    with pytest.raises( exceptions.AttributeImmutability ):
+        Implicit( ).value = 2
+
+
+def test_120_dataclass_specialized_initializer( ):
+    ''' Generated dataclass initializer is specialized. '''
+    assert InitializedData.__init__.__code__.co_filename == '<string>'
+    assert '<string>' == (
+        InitializedDataProtocol.__init__.__code__.co_filename )
+    obj = InitializedData( 3, value = 1 )
+    assert 1 == obj.value
+    assert [ ] == obj.items
+    assert 5 == obj.fixed
+    assert 2 == obj.derived
+    assert 3 == obj.position
+    assert obj.items is not InitializedData( value = 1 ).items
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj.value = 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        del obj.value
+    with pytest.raises( TypeError ):
+        InitializedData( )
+    protocol_obj = InitializedDataProtocol( value = 1 )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        protocol_obj.value = 2
+
+
+def test_121_dataclass_specialized_initializer_inheritance( ):
+    ''' Specialized initializer handles inherited fields and replacement. '''
+    obj = InitializedDataDerivative( value = 2, scale = 3 )
+    assert 6 == obj.derived
+    assert 'data' == obj.label
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj.label = 'other'
+    obj_ = dataclasses.replace( obj, label = 'other' )
+    assert 'other' == obj_.label
+    assert 4 == obj_.derived
+
+
+def test_122_dataclass_custom_initializer_preserved( ):
+    ''' Initializers from class bodies are not replaced. '''
+    assert InitializedDataCustom.__init__.__code__.co_filename != '<string>'
+    obj = InitializedDataCustom( 1 )
+    assert 10 == obj.value
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj.value = 2
+
+
+def test_123_dataclass_specialized_initializer_shadowing( ):
+    ''' Fields may shadow builtins and names used by initializer. '''
+    assert '<string>' == (
+        InitializedDataShadowing.__init__.__code__.co_filename )
+    obj = InitializedDataShadowing( type = 'x', self = 1 )
+    assert 'x' == obj.type
+    assert 1 == obj.self
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj.type = 'y'
+    construct = classes.produce_trusted_constructor( InitializedDataShadowing )
+    assert obj == construct( type = 'x', self = 1 )
+    assert 2 == construct( type = 'x', instance = 2 ).instance
+
+
+def test_130_instances_slotted_derivation( ):
+    ''' Slots are derived from annotations and initializer assignments. '''
+
+    class Point(
+        metaclass = classes.Class, instances_slotted = True
+    ):
+        kind: typing.ClassVar[ str ] = 'point'
+        label: 'typing.ClassVar[ str ]' = 'pt'
+        scale: float = 1.0
+        x: int
+
+        def __init__( self, x: int, y: int ) -> None:
+            self.x = x
+            self.y = y
+            self._cache = None
+
+    assert ( 'x', 'y', '_cache' ) == Point.__slots__[ : 3 ]
+    point = Point( 1, 2 )
+    assert not hasattr( point, '__dict__' )
+    assert ( 1, 2 ) == ( point.x, point.y )
+    assert 'x' in dir( point )
+    assert '_cache' not in dir( point )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        point.x = 3
+    with pytest.raises( exceptions.AttributeImmutability ):
+        del point.y
+
+
+def test_131_instances_slotted_inheritance( ):
+    ''' Slots of bases are not duplicated; explicit slots are kept. '''
+
+    class Base(
+        metaclass = classes.AbstractBaseClass, instances_slotted = True
+    ):
+        def __init__( self, x: int ) -> None: self.x = x
+
+    class Derivative( Base, instances_slotted = True ):
+        def __init__( self, x: int, y: int ) -> None:
+            super( ).__init__( x )
+            self.y = y
+
+    class Explicit( metaclass = classes.Class, instances_slotted = True ):
+        __slots__ = ( 'z', )
+
+        def __init__( self, z: int ) -> None: self.z = z
+
+    assert ( 'y', ) == Derivative.__slots__
+    obj = Derivative( 1, 2 )
+    assert not hasattr( obj, '__dict__' )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj.x = 3
+    assert 'z' == Explicit.__slots__[ 0 ]
+    assert 3 == Explicit( 3 ).z
+
+
+def test_132_instances_unslotted_by_default( ):
+    ''' Classes are not slotted unless requested. '''
+
+    class Plain( metaclass = classes.Class ):
+        def __init__( self, x: int ) -> None: self.x = x
+
+    assert '__slots__' not in Plain.__dict__
+    assert 1 == Plain( 1 ).__dict__[ 'x' ]
+
+
+def test_133_instances_slotted_conflicts( ):
+    ''' Initializer assignments to class-level values are rejected. '''
+    with pytest.raises( exceptions.SlotDerivationFailure ) as exc_info:
+
+        class Point( metaclass = classes.Class, instances_slotted = True ):
+            x: int = 5
+
+            def __init__( self ) -> None: self.x = 6
+
+    assert "'x'" in str( exc_info.value )
+    assert 'Point' in str( exc_info.value )
+
+    class Gauge( metaclass = classes.Class, instances_slotted = True ):
+        _level: int # Assigned by setter rather than initializer.
+
+        def __init__( self, level: int ) -> None:
+            self.level = level
+
+        @property
+        def level( self ) -> int: return self._level
+
+        @level.setter
+        def level( self, value: int ) -> None: self._level = value
+
+    assert ( '_level', ) == Gauge.__slots__[ : 1 ]
+    assert 3 == Gauge( 3 ).level
+
+
+def test_134_instances_slotted_dictionary_bases( ):
+    ''' Bases with instance dictionaries are rejected for slotting. '''
+    with pytest.raises( exceptions.InstancesSlottingFailure ) as exc_info:
+
+        class Point( classes.Object, instances_slotted = True ):
+            def __init__( self, x: int ) -> None: self.x = x
+
+    assert 'Point' in str( exc_info.value )
+    assert "'Object'" in str( exc_info.value )
+
+
+class Handler(
+    classes.Protocol,
+    typx.Protocol,
+    decorators = ( typx.runtime_checkable, ),
+):
+    ''' Runtime-checkable protocol with method members. '''
+
+    def handle( self, message: str ) -> None: ...
+
+
+class Labeled(
+    classes.Protocol,
+    typx.Protocol,
+    decorators = ( typx.runtime_checkable, ),
+):
+    ''' Runtime-checkable protocol with data member. '''
+
+    label: str
+
+
+def test_140_protocol_members_exclude_behaviors( ):
+    ''' Protocol members exclude attributes of standard behaviors. '''
+    assert { 'handle' } == Handler.__protocol_attrs__
+    assert { 'label' } == Labeled.__protocol_attrs__
+    assert { 'label' } == Labeled.__non_callable_proto_members__
+
+
+def test_141_protocol_instance_checks_cached( ):
+    ''' Verdicts are cached per type and forgotten with type. '''
+    import gc
+
+    class Conforming:
+        __slots__ = ( )
+
+        def handle( self, message: str ) -> None: pass
+
+    class Nonconforming:
+        __slots__ = ( )
+
+    assert isinstance( Conforming( ), Handler )
+    assert not isinstance( Nonconforming( ), Handler )
+    verdicts = getattr( Handler, '_frigid_class_verdicts_' )
+    assert { True, False } == set( verdicts.table.values( ) )
+    assert isinstance( Conforming( ), Handler )
+    assert not isinstance( Nonconforming( ), Handler )
+    del Conforming, Nonconforming
+    gc.collect( )
+    assert not verdicts.table
+
+
+def test_142_protocol_instance_checks_registration( ):
+    ''' Registration of virtual subclasses invalidates verdicts. '''
+
+    class Registered: pass
+
+    assert not isinstance( Registered( ), Handler )
+    Handler.register( Registered )
+    assert isinstance( Registered( ), Handler )
+
+
+def test_143_protocol_instance_checks_data_members( ):
+    ''' Protocols with data members are checked per instance. '''
+
+    class Record:
+        def __init__( self, label: typing.Optional[ str ] = None ) -> None:
+            if label is not None: self.label = label
+
+    assert not isinstance( Record( ), Labeled )
+    assert isinstance( Record( 'x' ), Labeled )
+    assert getattr( Labeled, '_frigid_class_verdicts_' ) is None
+
+
+def test_144_protocol_instance_checks_instance_members( ):
+    ''' Instances which may supply members are checked per instance. '''
+    from types import SimpleNamespace
+
+    class Slotted:
+        __slots__ = ( 'handle', )
+
+    assert isinstance( SimpleNamespace( handle = print ), Handler )
+    assert not isinstance( SimpleNamespace( ), Handler )
+    assert isinstance( SimpleNamespace( handle = print ), Handler )
+    slotted = Slotted( )
+    slotted.handle = print
+    assert isinstance( slotted, Handler )
+    verdicts = getattr( Handler, '_frigid_class_verdicts_' )
+    assert None is verdicts.table[ weakref.ref( SimpleNamespace ) ]
+    assert None is verdicts.table[ weakref.ref( Slotted ) ]
+    assert not isinstance( 42, Handler )
+    assert False is verdicts.table[ weakref.ref( int ) ]
+
+
+def test_150_metaclass_hooks_specialized( ):
+    ''' Metaclass attribute hooks are specialized and enforce immutability. '''
+    for metaclass in (
+        classes.Class, classes.Dataclass, classes.AbstractBaseClass,
+        classes.ProtocolClass,
+    ):
+        assert 'assign' == metaclass.__setattr__.__name__
+        assert 'delete' == metaclass.__delattr__.__name__
+
+    class Foo( metaclass = classes.Class ):
+        value = 1
+
+    with pytest.raises( exceptions.AttributeImmutability ):
+        Foo.value = 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        del Foo.value
+    assert 1 == Foo.value
+
+
+class Currency( classes.DataclassObject, instances_interned = True ):
+    ''' Dataclass with interned instances. '''
+
+    code: str
+    digits: int = 2
+
+
+class CurrencyObsolete( Currency ):
+    ''' Subclass which inherits interning. '''
+
+
+class Quantity( classes.DataclassObject, instances_interned = True ):
+    ''' Dataclass with interned instances and post-initialization. '''
+
+    magnitude: typing.Any
+
+    def __post_init__( self ) -> None: pass
+
+
+class QuantityProtocol(
+    classes.DataclassProtocol, typx.Protocol, instances_interned = True
+):
+    ''' Protocol dataclass with interned instances. '''
+
+    magnitude: typing.Any
+
+
+class QuantityConcrete( QuantityProtocol ):
+    ''' Implementation of protocol dataclass with interned instances. '''
+
+    magnitude: typing.Any
+
+
+class Unit( classes.DataclassObject, instances_interned = True ):
+    ''' Dataclass with interned instances, for surveys. '''
+
+    symbol: str
+
+
+def test_160_interned_instances_identical( ):
+    ''' Equal instances of interned dataclasses are identical. '''
+    usd = Currency( code = 'USD' )
+    assert usd is Currency( code = 'USD' )
+    assert usd is Currency( code = 'USD', digits = 2 )
+    assert usd is not Currency( code = 'EUR' )
+    assert usd is not CurrencyObsolete( code = 'USD' )
+    assert CurrencyObsolete( code = 'DEM' ) is CurrencyObsolete( code = 'DEM' )
+    assert Quantity( magnitude = 1 ) is Quantity( magnitude = 1 )
+    assert (
+        QuantityConcrete( magnitude = 1 )
+        is QuantityConcrete( magnitude = 1 ) )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        usd.code = 'EUR'  # pyright: ignore
+
+
+def test_161_interned_instances_distinctions( ):
+    ''' Values of different types or unhashable values are not conflated. '''
+    assert Quantity( magnitude = 1 ) is not Quantity( magnitude = True )
+    assert Quantity( magnitude = [ 1 ] ) is not Quantity( magnitude = [ 1 ] )
+    assert Quantity( magnitude = [ 1 ] ) == Quantity( magnitude = [ 1 ] )
+
+
+def test_162_interned_instances_survey( ):
+    ''' Surveys report live canonical instances and hit rates. '''
+    import gc
+    assert 0.0 == classes.survey_instances_interns( Unit ).hit_rate
+    meter = Unit( symbol = 'm' )
+    Unit( symbol = 'm' )
+    Unit( symbol = 's' )
+    gc.collect( )
+    survey = classes.survey_instances_interns( Unit )
+    assert 1 == survey.size
+    assert 1 == survey.hits
+    assert 2 == survey.misses
+    assert 1 / 3 == survey.hit_rate
+    del meter
+    gc.collect( )
+    assert 0 == classes.survey_instances_interns( Unit ).size
+    with pytest.raises( exceptions.InstancesInternmentAbsence ):
+        classes.survey_instances_interns( InitializedData )
+
+
+def test_163_interned_instances_isolation( ):
+    ''' Other dataclasses are not affected by interning. '''
+    import copy
+    import inspect
+    assert classes.Dataclass is type( InitializedData )
+    assert InitializedData( value = 1 ) is not InitializedData( value = 1 )
+    assert 'code' in inspect.signature( Currency ).parameters
+    usd = Currency( code = 'USD' )
+    assert usd == copy.deepcopy( usd )
+
+
+def test_164_interned_instances_reproduction( ):
+    ''' Copies and unpickled instances are canonical instances. '''
+    import copy
+    import pickle
+    usd = Currency( code = 'USD' )
+    assert usd is copy.copy( usd )
+    assert usd is copy.deepcopy( usd )
+    assert usd is pickle.loads( pickle.dumps( usd ) ) # noqa: S301
+    dem = CurrencyObsolete( code = 'DEM' )
+    assert dem is pickle.loads( pickle.dumps( dem ) ) # noqa: S301
+    assert dem is copy.deepcopy( dem )
+    quantity = Quantity( magnitude = [ 1 ] )
+    duplicate = copy.deepcopy( quantity )
+    assert duplicate == quantity
+    assert duplicate.magnitude is not quantity.magnitude
+    restored = pickle.loads( pickle.dumps( quantity ) ) # noqa: S301
+    assert quantity == restored
+
+
+class Fingerprint( classes.DataclassObject, instances_hash_cached = True ):
+    ''' Dataclass with memoized hashes. '''
+
+    digest: str
+    parts: tuple[ int, ... ] = ( )
+    note: str = dataclasses.field( default = '', compare = False )
+
+
+class FingerprintExtended( Fingerprint ):
+    ''' Subclass which inherits memoized hashes. '''
+
+    salt: int = 0
+
+
+class FingerprintCustom(
+    classes.DataclassObject, instances_hash_cached = True
+):
+    ''' Dataclass with memoized hashes and its own hash function. '''
+
+    digest: str
+
+    def __hash__( self ) -> int: return 42
+
+
+def test_170_instances_hash_memoized( ):
+    ''' Hashes are computed from hashed fields and memoized in slot. '''
+    name = '_frigid_instance_hash_'
+    fingerprint = Fingerprint( digest = 'abc', parts = ( 1, 2 ) )
+    assert not hasattr( fingerprint, name )
+    assert hash( ( 'abc', ( 1, 2 ) ) ) == hash( fingerprint )
+    assert hash( fingerprint ) == getattr( fingerprint, name )
+    assert hash( fingerprint ) == hash(
+        Fingerprint( digest = 'abc', parts = ( 1, 2 ), note = 'x' ) )
+    assert name not in {
+        field.name for field in dataclasses.fields( fingerprint ) }
+    assert name not in dataclasses.asdict( fingerprint )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        setattr( fingerprint, name, 0 )
+    extended = FingerprintExtended( digest = 'abc', salt = 1 )
+    assert hash( ( 'abc', ( ), 1 ) ) == hash( extended )
+    assert name not in FingerprintExtended.__slots__ # inherited
+    assert 42 == hash( FingerprintCustom( digest = 'abc' ) )
+
+
+def test_171_instances_hash_not_pickled( ):
+    ''' Memoized hashes are omitted from pickled state. '''
+    import pickle
+    fingerprint = Fingerprint( digest = 'abc' )
+    hash( fingerprint )
+    _, state = fingerprint.__getstate__( )
+    assert '_frigid_instance_hash_' not in state
+    fingerprint_ = pickle.loads( pickle.dumps( fingerprint ) )  # noqa: S301
+    assert fingerprint == fingerprint_
+    assert not hasattr( fingerprint_, '_frigid_instance_hash_' )
+    assert hash( fingerprint ) == hash( fingerprint_ )
+
+
+def test_172_instances_hash_optional( ):
+    ''' Instances of other dataclasses remain unhashable. '''
+    with pytest.raises( TypeError ):
+        hash( InitializedData( value = 1 ) )
+
+
+class Pattern( classes.DataclassObject ):
+    ''' Dataclass with cached property. '''
+
+    source: str
+
+    @classes.cached_property
+    def length( self ) -> int:
+        ''' Length of source. '''
+        return len( self.source ) + next( _computations )
+
+
+_computations = iter( range( 0, 1_000_000, 1_000 ) )
+
+
+def test_180_cached_property_slotted( ):
+    ''' Cached property stores value in concealed slot, once. '''
+    pattern = Pattern( source = 'a+' )
+    length = pattern.length
+    assert length == pattern.length
+    assert '_frigid_instance_cached_length_' in Pattern.__slots__
+    assert 'length' in dir( pattern )
+    assert '_frigid_instance_cached_length_' not in dir( pattern )
+    assert 'length' not in {
+        field.name for field in dataclasses.fields( pattern ) }
+    assert ' Length of source. ' == Pattern.length.__doc__
+    with pytest.raises( exceptions.AttributeImmutability ):
+        pattern.length = 0  # pyright: ignore
+    with pytest.raises( exceptions.AttributeImmutability ):
+        del pattern.length
+
+
+def test_181_cached_property_unslotted( ):
+    ''' Cached property stores value in instance dictionary, once. '''
+
+    class Doubler( classes.Object ):
+        def __init__( self, value: int ) -> None: self.value = value
+
+        @classes.cached_property
+        def doubled( self ) -> list[ int ]: return [ self.value * 2 ]
+
+    doubler = Doubler( 3 )
+    assert doubler.doubled is doubler.doubled
+    assert [ 6 ] == vars( doubler )[ 'doubled' ]
+    with pytest.raises( exceptions.AttributeImmutability ):
+        doubler.doubled = [ ]  # pyright: ignore
+
+
+def test_182_cached_property_invalidities( ):
+    ''' Cached properties must be named consistently and have storage. '''
+    def compute( self: object ) -> int: return 1
+    prop = classes.cached_property( compute )
+    with pytest.raises( TypeError ):
+        prop.__get__( object( ) )
+
+    class Holder:
+        __slots__ = ( )
+        value = prop
+
+    # Python 3.11 wraps errors from '__set_name__'.
+    with pytest.raises( ( RuntimeError, TypeError ) ):
+        type( 'Holder2', ( ), { 'other': prop } )
+    exceptions_ = cache_import_module( f"{PACKAGE_NAME}.__.exceptions" )
+    with pytest.raises(
+        exceptions_.PropertyCacheInvalidity, match = "property 'value'"
+    ): Holder( ).value
+
+
+class Gauge( classes.DataclassObject ):
+    label: typx.Annotated[
+        str,
+        classes.FieldConverter( str.strip ),
+        classes.FieldValidator( bool ),
+    ]
+    level: typx.Annotated[
+        int,
+        typx.Doc( 'Level of gauge.' ),
+        classes.FieldConverter( int ),
+        classes.FieldValidator( lambda level: 0 <= level <= 10 ),
+    ] = 5
+    marks: typx.Annotated[
+        tuple[ int, ... ],
+        classes.FieldConverter( tuple ),
+        classes.FieldValidator( lambda marks: min( marks, default = 0 ) >= 0 ),
+    ] = dataclasses.field( default_factory = list )
+
+
+class GaugeInterned( classes.DataclassObject, instances_interned = True ):
+    code: typx.Annotated[ str, classes.FieldConverter( str.upper ) ]
+
+
+class Phase( classes.DataclassObject ):
+    name: str
+    count: int = 0
+    history: tuple[ str, ... ] = ( )
+
+
+class PhaseRequired( classes.DataclassObject ):
+    value: int
+    offset: dataclasses.InitVar[ int ]
+    total: int = dataclasses.field( init = False )
+
+    def __post_init__( self, offset: int ) -> None:
+        self.total = self.value + offset
+
+
+def test_190_evolve_copies_and_changes( ):
+    ''' Evolution copies unchanged fields and assigns changed ones. '''
+    phase = Phase( name = 'idle', history = ( 'boot', ) )
+    phase_ = classes.evolve( phase, count = 1 )
+    assert Phase( name = 'idle', count = 1, history = ( 'boot', ) ) == phase_
+    assert phase_.history is phase.history
+    assert 0 == phase.count
+    with pytest.raises( exceptions.AttributeImmutability ):
+        phase_.count = 2  # pyright: ignore
+    assert phase_ == classes.evolve( phase_ )
+    assert classes.evolve( phase_ ) is not phase_
+    with pytest.raises( TypeError ):
+        classes.evolve( phase, label = 'x' )
+
+
+def test_191_evolve_initialization_semantics( ):
+    ''' Evolution resets uninitialized fields and runs post-init hook. '''
+    obj = InitializedData( value = 2, scale = 3 )
+    obj_ = classes.evolve( obj, value = 5 )
+    assert 10 == obj_.derived
+    assert 5 == obj_.fixed
+    assert obj_.items is obj.items
+    assert 15 == classes.evolve( obj, value = 5, scale = 3 ).derived
+    with pytest.raises( ValueError ):
+        classes.evolve( obj, derived = 1 )
+    required = PhaseRequired( value = 1, offset = 2 )
+    assert 4 == classes.evolve( required, offset = 3 ).total
+    with pytest.raises( ValueError ):
+        classes.evolve( required, value = 2 )
+
+
+def test_192_evolve_variant_classes( ):
+    ''' Evolution respects subclasses, custom initializers, and interns. '''
+    obj = InitializedDataDerivative( value = 2, scale = 3 )
+    obj_ = classes.evolve( obj, label = 'other' )
+    assert type( obj_ ) is InitializedDataDerivative
+    assert 'other' == obj_.label
+    assert 4 == obj_.derived
+    parent = InitializedData( value = 3 )
+    assert 2 == classes.evolve( parent, value = 1 ).derived
+    custom = classes.evolve( InitializedDataCustom( value = 1 ), value = 2 )
+    assert 20 == custom.value
+    assert Currency( code = 'EUR' ) is classes.evolve(
+        Currency( code = 'USD' ), code = 'EUR' )
+    fingerprint = Fingerprint( digest = 'a', parts = ( 1, 2 ) )
+    assert hash( fingerprint ) == hash( fingerprint )
+    fingerprint_ = classes.evolve( fingerprint, parts = ( 3, ) )
+    assert hash( Fingerprint( digest = 'a', parts = ( 3, ) ) ) == hash(
+        fingerprint_ )
+
+    @dataclasses.dataclass( frozen = True )
+    class Plain:
+        value: int
+
+    assert Plain( value = 2 ) == classes.evolve(
+        Plain( value = 1 ), value = 2 )
+
+
+def test_200_visibles_caches_instances( ):
+    ''' Instance attributes surveys are cached by instance shape. '''
+
+    class Sample( classes.Object ):
+        def __init__( self, extra: bool = False ) -> None:
+            self.value = 1
+            self._hidden = 2
+            if extra: self.extra = 3
+
+    assert 0 == classes.survey_visibles_caches( Sample ).size
+    sample = Sample( )
+    names = dir( sample )
+    assert 'value' in names
+    assert '_hidden' not in names
+    assert names == dir( Sample( ) )
+    assert 'extra' in dir( Sample( extra = True ) )
+    survey = classes.survey_visibles_caches( Sample )
+    assert 2 == survey.size
+    assert 1 == survey.hits
+    assert 2 == survey.misses
+    assert 1 / 3 == survey.hit_rate
+    phase = Phase( name = 'idle' )
+    assert [ 'count', 'history', 'name' ] == [
+        name for name in dir( phase ) if not name.startswith( '__' ) ]
+    assert dir( phase ) == dir( Phase( name = 'busy' ) )
+
+
+def test_201_visibles_caches_classes( ):
+    ''' Class attributes surveys are cached, unless fully visible. '''
+
+    class Sample( classes.Object ):
+        value = 1
+        _hidden = 2
+
+    names = dir( Sample )
+    assert 'value' in names
+    assert '_hidden' not in names
+    assert names == dir( Sample )
+    survey = classes.survey_visibles_caches( Sample )
+    assert 1 == survey.size
+    assert 1 == survey.hits
+
+    class Open( classes.Object, class_visibles = '*' ):
+        _hidden = 2
+
+    assert '_hidden' in dir( Open )
+    assert 0 == classes.survey_visibles_caches( Open ).size
+    assert 0.0 == classes.survey_visibles_caches( int ).hit_rate
+
+
+def test_202_visibles_caches_mutables( ):
+    ''' Attributes surveys are not cached for classes with mutables. '''
+
+    class Tunable( classes.Object, class_mutables = ( 'level', ) ):
+        pass
+
+    tunable = Tunable( )
+    assert 'level' not in dir( Tunable )
+    assert 'level' not in dir( tunable )
+    Tunable.level = 1
+    assert 'level' in dir( Tunable )
+    assert 'level' in dir( tunable )
+    assert 0 == classes.survey_visibles_caches( Tunable ).size
+
+    class Sample( classes.Object, instances_mutables = ( 'level', ) ):
+        pass
+
+    sample = Sample( )
+    assert 'level' not in dir( sample )
+    sample.level = 1
+    assert 'level' in dir( sample )
+    assert 0 == classes.survey_visibles_caches( Sample ).size
+
+
+def test_210_trusted_constructor( ):
+    ''' Trusted constructor assigns fields without initialization. '''
+    construct = classes.produce_trusted_constructor( InitializedData )
+    assert construct is classes.produce_trusted_constructor( InitializedData )
+    obj = construct( value = 2, derived = 7 )
+    assert 7 == obj.derived
+    assert 5 == obj.fixed
+    assert [ ] == obj.items
+    assert obj.items is not construct( value = 2, derived = 7 ).items
+    assert InitializedData( value = 2, scale = 3 ) == construct(
+        value = 2, derived = 6 )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        obj.value = 3  # pyright: ignore
+    with pytest.raises( TypeError ):
+        construct( value = 2 )
+    with pytest.raises( TypeError ):
+        construct( value = 2, derived = 4, scale = 2 )
+    derivative = classes.produce_trusted_constructor(
+        InitializedDataDerivative )( value = 1, derived = 2, label = 'x' )
+    assert type( derivative ) is InitializedDataDerivative
+    assert Currency( code = 'USD' ) is classes.produce_trusted_constructor(
+        Currency )( code = 'USD' )
+
+
+def test_220_construct_from_rows( ):
+    ''' Instances are constructed lazily from sequences or mappings. '''
+    rows = ( ( 4, 2, [ 1 ], 3 ), { 'value': 1, 'scale': 5 } )
+    instances = classes.construct_from_rows( InitializedData, iter( rows ) )
+    assert not isinstance( instances, tuple )
+    first, second = instances
+    assert InitializedData(
+        4, value = 2, items = [ 1 ], scale = 3 ) == first
+    assert 6 == first.derived
+    assert InitializedData( value = 1, scale = 5 ) == second
+    with pytest.raises( exceptions.AttributeImmutability ):
+        first.value = 3  # pyright: ignore
+    named = classes.construct_from_rows(
+        InitializedData, ( ( 7, 1 ), { 'scale': 1, 'value': 8 } ),
+        names = ( 'scale', 'value' ) )
+    assert [ 7, 8 ] == [ instance.derived for instance in named ]
+    shortened = classes.construct_from_rows(
+        InitializedData, ( ( 1, 2 ), ( 1, 2, [ 3 ] ) ) )
+    assert InitializedData( 1, value = 2 ) == next( shortened )
+    assert [ 3 ] == next( shortened ).items
+    with pytest.raises( exceptions.ValuesCountInvalidity ):
+        list( classes.construct_from_rows( InitializedData, ( ( 1, ), ) ) )
+    with pytest.raises( exceptions.ValuesCountInvalidity ):
+        list( classes.construct_from_rows(
+            InitializedData, ( ( 1, 2, [ ], 3, 4 ), ) ) )
+    with pytest.raises( exceptions.NamesInvalidity, match = "'value'" ):
+        list( classes.construct_from_rows( InitializedData, ( { }, ) ) )
+    with pytest.raises( exceptions.NamesInvalidity, match = "'extra'" ):
+        list( classes.construct_from_rows(
+            InitializedData, ( { 'value': 1, 'extra': 0 }, ) ) )
+    proxied = classes.construct_from_rows(
+        InitializedData,
+        ( DictionaryProxy( { 'value': 3 } ), [ 0, 3, [ ], 2 ] ) )
+    assert [ 6, 6 ] == [ instance.derived for instance in proxied ]
+    shadowing = classes.construct_from_rows(
+        InitializedDataShadowing, ( ( 'x', 1 ), { 'type': 'y' } ) )
+    assert [ 'x', 'y' ] == [ instance.type for instance in shadowing ]
+
+
+def test_221_construct_from_rows_variant_classes( ):
+    ''' Rows construct instances of classes without unrolled loops. '''
+    assert [ Currency( code = 'EUR' ) ] == list(
+        classes.construct_from_rows( Currency, ( ( 'EUR', 2 ), ) ) )
+    assert Currency( code = 'USD' ) is next(
+        classes.construct_from_rows( Currency, ( { 'code': 'USD' }, ) ) )
+    customs = classes.construct_from_rows(
+        InitializedDataCustom, ( ( 1, ), { 'value': 2 } ) )
+    assert [ 10, 20 ] == [ custom.value for custom in customs ]
+    with pytest.raises( TypeError ):
+        list( classes.construct_from_rows(
+            InitializedData, ( ( 1, 2 ), ), names = ( 'value', 'other' ) ) )
+
+    @dataclasses.dataclass( frozen = True )
+    class Plain:
+        value: int
+        label: str = 'x'
+
+    assert [ Plain( value = 1 ), Plain( value = 2, label = 'y' ) ] == list(
+        classes.construct_from_rows(
+            Plain, ( { 'value': 1 }, ( 2, 'y' ) ) ) )
+    assert Plain( value = 3 ) == next(
+        classes.construct_from_rows( Plain, ( ( 3, ), ) ) )
+    with pytest.raises( exceptions.ValuesCountInvalidity ):
+        list( classes.construct_from_rows( Plain, ( ( 1, 'y', 0 ), ) ) )
+    with pytest.raises( exceptions.NamesInvalidity ):
+        list( classes.construct_from_rows( Plain, ( { 'label': 'y' }, ) ) )
+
+
+def test_230_fields_processors( ):
+    ''' Initializers convert and validate arguments before assignment. '''
+    gauge = Gauge( label = ' fuel ', level = '7', marks = [ 1, 2 ] )
+    assert Gauge( label = 'fuel', level = 7, marks = ( 1, 2 ) ) == gauge
+    assert ( ) == Gauge( label = 'oil' ).marks
+    with pytest.raises( exceptions.FieldInvalidity, match = "'label'" ):
+        Gauge( label = '  ' )
+    with pytest.raises( exceptions.FieldInvalidity, match = "'level'" ):
+        Gauge( label = 'oil', level = 11 )
+    with pytest.raises( exceptions.FieldInvalidity ) as info:
+        Gauge( label = 'oil', level = 'high' )
+    assert isinstance( info.value.__cause__, ValueError )
+    assert isinstance( info.value, ValueError )
+    with pytest.raises(
+        exceptions.FieldInvalidity, match = "'marks'"
+    ) as info: Gauge( label = 'oil', marks = ( 1, 'x' ) )
+    assert isinstance( info.value.__cause__, TypeError )
+    assert GaugeInterned( code = 'eur' ) is GaugeInterned( code = 'EUR' )
+    rows = classes.construct_from_rows(
+        Gauge, ( ( 'oil', '3' ), ), names = ( 'label', 'level' ) )
+    assert 3 == next( rows ).level
+
+
+def test_231_fields_processors_evolution( ):
+    ''' Evolution converts and validates changed fields only. '''
+    gauge = Gauge( label = 'fuel', marks = [ 1 ] )
+    assert 8 == classes.evolve( gauge, level = '8' ).level
+    assert ( 3, ) == classes.evolve( gauge, marks = [ 3 ] ).marks
+    assert gauge.marks is classes.evolve( gauge, level = 1 ).marks
+    with pytest.raises( exceptions.FieldInvalidity ):
+        classes.evolve( gauge, level = -1 )
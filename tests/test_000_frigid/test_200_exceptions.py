@@ -31,7 +31,10 @@ CLASS_NAMES = (
     'AttributeImmutability',
     'EntryImmutability',
     'EntryInvalidity',
+    'EntryMergeFailure',
     'ErrorProvideFailure',
+    'ValueDigestFailure',
+    'ValuesCountInvalidity',
 )
 MODULE_QNAME = f"{PACKAGE_NAME}.exceptions"
 
@@ -62,3 +65,12 @@ def test_200_error_provide_failure():
     assert 'TestError' in message
     assert 'Testing' in message
     assert 'Could not provide error class' in message
+
+
+def test_210_values_count_invalidity():
+    ''' ValuesCountInvalidity formats message correctly. '''
+    module = cache_import_module( MODULE_QNAME )
+    exc = module.ValuesCountInvalidity( 3, 2 )
+    message = str( exc )
+    assert '3 names' in message
+    assert '2 values' in message
@@ -37,6 +37,21 @@ THESE_CLASSES_NAMES = ( 'Namespace', )
 
 base = cache_import_module( f"{PACKAGE_NAME}.__" )
 exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+namespaces = cache_import_module( f"{PACKAGE_NAME}.namespaces" )
+
+
+# Subclasses defined at module level, so that their instances can be pickled.
+
+
+class NamespaceUnslotted( namespaces.Namespace ): pass
+
+
+class NamespaceInitialized( namespaces.Namespace ):
+
+    __slots__ = ( )
+
+    def __init__( self, label, *iterables, **attributes ):
+        super( ).__init__( *iterables, label = label, **attributes )
 
 
 @pytest.mark.parametrize(
@@ -91,9 +106,9 @@ def test_102_string_representation( module_qname, class_name ):
     module = cache_import_module( module_qname )
     factory = getattr( module, class_name )
     ns1 = factory( )
-    assert base.ccutils.qualify_class_name( type( ns1 ) ) in repr( ns1 )
+    assert base.ccutils.qualify_class_name( factory ) in repr( ns1 )
     ns2 = factory( a = 1, b = 2 )
-    assert base.ccutils.qualify_class_name( type( ns2 ) ) in repr( ns2 )
+    assert base.ccutils.qualify_class_name( factory ) in repr( ns2 )
     assert 'a = 1, b = 2' in repr( ns2 )
 
 
@@ -144,6 +159,352 @@ def test_106_namespace_initialization_validation( module_qname, class_name ):
     assert 9 == ns4.i
 
 
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_110_namespace_shapes( module_qname, class_name ):
+    ''' Namespaces with same attribute names share slotted class. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    ns1 = factory( foo = 1, bar = 2 )
+    ns2 = factory( { 'foo': 3 }, bar = 4 )
+    assert type( ns1 ) is type( ns2 )
+    assert isinstance( ns1, factory )
+    assert 'foo' in type( ns1 ).__slots__
+    assert 'bar' in type( ns1 ).__slots__
+    assert { 'foo': 1, 'bar': 2 } == vars( ns1 )
+    assert type( ns1 ) is not type( factory( bar = 2, foo = 1 ) )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns2.foo = 5
+    assert 3 == ns2.foo
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_111_namespace_unslottable_names( module_qname, class_name ):
+    ''' Namespaces with unslottable names use instance dictionary. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    ns = factory( { 'not-identifier': 1, 2: 'two' }, __repr__ = 3 )
+    assert { 'not-identifier': 1, 2: 'two', '__repr__': 3 } == ns.__dict__
+    assert '__repr__ = 3' in repr( ns )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns.__repr__ = 4
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns.new_attr = 5
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_112_namespace_duplicate_names( module_qname, class_name ):
+    ''' Namespace rejects duplicate attribute names. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    with pytest.raises( exceptions.EntryImmutability ):
+        factory( { 'foo': 1 }, foo = 2 )
+
+
+def test_113_namespace_subclasses( ):
+    ''' Subclasses with dictionaries or initializers are not shaped. '''
+    import copy
+    import pickle
+    assert type( namespaces.Namespace( foo = 1 ) ) is not namespaces.Namespace
+    unslotted = NamespaceUnslotted( foo = 1 )
+    assert type( unslotted ) is NamespaceUnslotted
+    assert { 'foo': 1 } == vars( unslotted )
+    assert namespaces.Namespace( foo = 1 ) == unslotted
+    assert 'NamespaceUnslotted( foo = 1 )' in repr( unslotted )
+    initialized = NamespaceInitialized( 'x', { 'foo': 1 } )
+    assert { 'label': 'x', 'foo': 1 } == vars( initialized )
+    with pytest.raises( exceptions.AttributeImmutability ) as info:
+        initialized.foo = 2
+    assert str( info.value ).endswith( ".NamespaceInitialized'." )
+    for original in ( unslotted, initialized ):
+        for restored in (
+            pickle.loads( pickle.dumps( original ) ), # noqa: S301
+            copy.copy( original ),
+            copy.deepcopy( original ),
+        ):
+            assert original == restored
+            assert type( original ) is type( restored )
+            with pytest.raises( exceptions.AttributeImmutability ):
+                restored.foo = 3
+        assert { 'bar': 3 } == vars(
+            type( original )._from_trusted_( bar = 3 ) )
+    produce = NamespaceUnslotted.factory( ( 'foo', ) )
+    assert { 'foo': 2 } == vars( produce( 2 ) )
+    with pytest.raises(
+        exceptions.ConstructorProductionFailure,
+        match = "'NamespaceInitialized'",
+    ): NamespaceInitialized.factory( ( 'foo', ) )
+    with pytest.raises( exceptions.AttributeImmutability ) as info:
+        namespaces.Namespace( foo = 1, bar = 2 ).foo = 3
+    assert 'Namespace[' not in str( info.value )
+
+
+def test_114_namespace_caches_limits( monkeypatch ):
+    ''' Caches of namespace classes are not extended beyond maximum. '''
+    monkeypatch.setitem( vars( namespaces ), '_shapes_maximum', 0 )
+
+    class Limited( namespaces.Namespace ):
+        __slots__ = ( )
+
+    ns = Limited.from_nested( { 'outer': { 'inner': 1 } } )
+    assert 1 == ns.outer.inner
+    assert namespaces.Namespace( foo = 1 ) == Limited( foo = 1 )
+    assert Limited not in vars( namespaces )[ '_shapeables' ]
+    for name in ( '_behaviors', '_nested_shapes' ):
+        assert not any(
+            issubclass( shape, Limited )
+            for shape in vars( namespaces )[ name ] )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_120_namespace_pickle_copy( module_qname, class_name ):
+    ''' Namespace survives pickle and copy round-trips. '''
+    import copy
+    import pickle
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    original = factory( foo = 1, bar = [ 2 ] )
+    for restored in (
+        pickle.loads( pickle.dumps( original ) ), # noqa: S301
+        copy.copy( original ),
+        copy.deepcopy( original ),
+    ):
+        assert original == restored
+        assert original is not restored
+        assert type( original ) is type( restored )
+        with pytest.raises( exceptions.AttributeImmutability ):
+            restored.foo = 3
+    assert original.bar is not copy.deepcopy( original ).bar
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_130_namespace_factory( module_qname, class_name ):
+    ''' Namespace factory produces equivalent immutable namespaces. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    produce = factory.factory( ( 'foo', 'bar' ) )
+    ns1 = produce( 1, 2 )
+    ns2 = factory( foo = 1, bar = 2 )
+    assert ns1 == ns2
+    assert type( ns1 ) is type( ns2 )
+    assert repr( ns1 ) == repr( ns2 )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns1.foo = 3
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns1.baz = 3
+    assert 'bar' in dir( ns1 )
+    produce_unslottable = factory.factory( ( 'not-identifier', 2 ) )
+    ns3 = produce_unslottable( 1, 'two' )
+    assert { 'not-identifier': 1, 2: 'two' } == ns3.__dict__
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns3.baz = 3
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_131_namespace_factory_validation( module_qname, class_name ):
+    ''' Namespace factory validates names and count of values. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    with pytest.raises(
+        exceptions.NamesInvalidity, match = r"Duplicate: 'foo'\.$"
+    ): factory.factory( ( 'foo', 'bar', 'foo', 'foo' ) )
+    produce = factory.factory( ( 'foo', 'bar' ) )
+    with pytest.raises( exceptions.ValuesCountInvalidity ):
+        produce( 1 )
+    with pytest.raises( exceptions.ValuesCountInvalidity ):
+        produce( 1, 2, 3 )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_135_namespace_from_rows( module_qname, class_name ):
+    ''' Namespaces are produced in bulk from sequences or mappings. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    rows = ( ( 1, 2 ), [ 3, 4 ], { 'bar': 6, 'foo': 5 } )
+    namespaces = factory.from_rows( ( 'foo', 'bar' ), iter( rows ) )
+    assert isinstance( namespaces, tuple )
+    assert 3 == len( namespaces )
+    assert factory( foo = 1, bar = 2 ) == namespaces[ 0 ]
+    assert factory( foo = 3, bar = 4 ) == namespaces[ 1 ]
+    assert factory( foo = 5, bar = 6 ) == namespaces[ 2 ]
+    assert ( ) == factory.from_rows( ( 'foo', ), ( ) )
+    with pytest.raises( exceptions.ValuesCountInvalidity ):
+        factory.from_rows( ( 'foo', 'bar' ), ( ( 1, ), ) )
+    with pytest.raises( exceptions.NamesInvalidity, match = "'bar'" ):
+        factory.from_rows( ( 'foo', 'bar' ), ( { 'foo': 1 }, ) )
+    with pytest.raises( exceptions.NamesInvalidity, match = "'baz'" ):
+        factory.from_rows(
+            ( 'foo', 'bar' ), ( { 'foo': 1, 'bar': 2, 'baz': 3 }, ) )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_136_namespace_from_trusted( module_qname, class_name ):
+    ''' Namespaces are produced from trusted attributes. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    ns = factory._from_trusted_( { 'foo': 1 }, [ ( 'foo', 2 ) ], bar = 3 )
+    assert type( ns ) is type( factory( foo = 2, bar = 3 ) )
+    assert factory( foo = 2, bar = 3 ) == ns
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns.foo = 4
+    ns_ = factory._from_trusted_( { 1: 'one' } )
+    assert factory( { 1: 'one' } ) == ns_
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_140_namespace_from_nested( module_qname, class_name ):
+    ''' Nested mappings become memoized namespaces on first access. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    inner = { 'port': 5432, 'options': { 'ssl': True } }
+    ns = factory.from_nested( { 'database': inner, 'name': 'app' } )
+    assert isinstance( ns, factory )
+    assert 'app' == ns.name
+    database = ns.database
+    assert isinstance( database, factory )
+    assert database is ns.database
+    assert 5432 == database.port
+    assert database.options is ns.database.options
+    assert database.options.ssl
+    expected = factory(
+        database = factory(
+            port = 5432, options = factory( ssl = True ) ),
+        name = 'app' )
+    assert expected == ns
+    assert repr( expected ) == repr( ns )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_141_namespace_from_nested_immutability( module_qname, class_name ):
+    ''' Lazily-wrapping namespaces are immutable at every level. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    ns = factory.from_nested( { 'outer': { 'inner': 1 } } )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns.outer = 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns.outer.inner = 2
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns.other = 2
+    assert 1 == ns.outer.inner
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_142_namespace_from_nested_unslottable( module_qname, class_name ):
+    ''' Levels with unslottable names are wrapped on construction. '''
+    import pickle
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    ns = factory.from_nested( { 'not-identifier': { 'inner': { 'x': 1 } } } )
+    outer = ns.__dict__[ 'not-identifier' ]
+    assert isinstance( outer, factory )
+    assert outer.inner is outer.inner
+    assert 1 == outer.inner.x
+    restored = pickle.loads( pickle.dumps( ns ) ) # noqa: S301
+    assert ns == restored
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_143_namespace_from_nested_snapshot( module_qname, class_name ):
+    ''' Nested mappings are copied on construction and compare equal. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    inner = { 'port': 5432, 'options': { 'ssl': True } }
+    ns = factory.from_nested( { 'database': inner } )
+    inner[ 'port' ] = 1
+    inner[ 'options' ][ 'ssl' ] = False
+    inner[ 'extra' ] = 2
+    expected = { 'port': 5432, 'options': { 'ssl': True } }
+    assert factory( database = expected ) == ns
+    assert ns == factory( database = expected )
+    assert ( ns != factory( database = expected ) ) is False
+    assert ns != factory( database = { 'port': 5432 } )
+    assert 5432 == ns.database.port
+    assert ns.database.options.ssl
+    assert not hasattr( ns.database, 'extra' )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_150_namespace_as_dictionary( module_qname, class_name ):
+    ''' Namespace provides dictionary which shares its attributes. '''
+    import copy
+    import pickle
+    dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    ns = factory( foo = 1, bar = [ 2 ] )
+    dct = ns.as_dictionary( )
+    assert isinstance( dct, dictionaries.Dictionary )
+    assert { 'foo': 1, 'bar': [ 2 ] } == dct
+    assert dictionaries.Dictionary( foo = 1, bar = [ 2 ] ) == dct
+    assert "Dictionary( {'foo': 1, 'bar': [2]} )" in repr( dct )
+    assert dct[ 'bar' ] is ns.bar
+    assert 'foo' in dct
+    assert 'baz' not in dct
+    assert dct.get( 'baz' ) is None
+    assert 2 == len( dct )
+    with pytest.raises( KeyError ):
+        dct[ 'baz' ]
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct[ 'foo' ] = 3
+    assert dct.as_namespace( ) is ns
+    restored = pickle.loads( pickle.dumps( dct ) ) # noqa: S301
+    assert dct == restored
+    assert dct == copy.copy( dct )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_151_namespace_as_dictionary_unslottable( module_qname, class_name ):
+    ''' Namespace with unslottable names shares its instance dictionary. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    ns = factory( { 'not-identifier': 1 } )
+    dct = ns.as_dictionary( )
+    assert { 'not-identifier': 1 } == dct
+    assert dct._data_ is ns.__dict__
+
+
 @pytest.mark.parametrize(
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
@@ -327,6 +327,447 @@ def test_603_finalize_module_with_both_dynadoc_params(
         test_module.new_attr = 42
 
 
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_610_finalize_module_skipping_docstrings( module_qname, class_name ):
+    ''' finalize_module assembles fragments without introspection. '''
+    module = cache_import_module( module_qname )
+    Module = getattr( module, class_name )
+    from types import ModuleType
+    test_module = ModuleType( f"{PACKAGE_NAME}.test_finalize_skip" )
+    test_module.__package__ = PACKAGE_NAME
+    test_module.__doc__ = 'Test module.'
+    test_module.value = 42
+    test_module.__annotations__ = { 'value': int }
+    module.finalize_module(
+        test_module, 'description',
+        docstrings = module.DocstringsModes.Skip,
+        dynadoc_table = { 'description': 'Has description.' } )
+    assert isinstance( test_module, Module )
+    assert 'Test module.\n\nHas description.' == test_module.__doc__
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_611_finalize_module_deferring_docstrings( module_qname, class_name ):
+    ''' finalize_module renders module docstrings upon first access. '''
+    module = cache_import_module( module_qname )
+    Module = getattr( module, class_name )
+    import sys
+    from types import ModuleType
+    test_module = ModuleType( f"{PACKAGE_NAME}.test_finalize_lazy" )
+    test_module.__package__ = PACKAGE_NAME
+    test_module.__doc__ = 'Test module.'
+    test_module.value = 42
+    test_module.__annotations__ = { 'value': int }
+
+    def compute( count: int ) -> int:
+        ''' Computes value. '''
+        return count
+
+    compute.__module__ = test_module.__name__
+    test_module.compute = compute
+    test_submodule = ModuleType( f"{PACKAGE_NAME}.test_finalize_lazy.sub" )
+    test_submodule.__package__ = f"{PACKAGE_NAME}.test_finalize_lazy"
+    test_submodule.__doc__ = 'Test submodule.'
+    test_module.sub = test_submodule
+    sys.modules[ test_submodule.__name__ ] = test_submodule
+    try:
+        module.finalize_module(
+            test_module,
+            docstrings = module.DocstringsModes.Lazy,
+            recursive = True )
+    finally: del sys.modules[ test_submodule.__name__ ]
+    assert isinstance( test_module, Module )
+    assert isinstance( test_submodule, Module )
+    deferral = vars( test_module )[ '__doc__' ]
+    assert isinstance( deferral, base.DocstringDeferral )
+    assert isinstance(
+        vars( test_submodule )[ '__doc__' ], base.DocstringDeferral )
+    docstring = test_module.__doc__
+    assert docstring.startswith( 'Test module.' )
+    assert 'value' in docstring
+    assert docstring is test_module.__doc__
+    assert deferral is vars( test_module )[ '__doc__' ]
+    assert 'Test submodule.' == test_submodule.__doc__
+    assert compute.__doc__.startswith( 'Computes value.' )
+    assert 'count' in compute.__doc__
+    with pytest.raises( exceptions.AttributeImmutability ):
+        test_module.__doc__ = 'Changed.'
+    assert isinstance( Module.__doc__, str )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_612_finalize_module_deferral_requires_module_class(
+    module_qname, class_name
+):
+    ''' finalize_module documents eagerly for incapable replacement class. '''
+    module = cache_import_module( module_qname )
+    Module = getattr( module, class_name )
+    from types import ModuleType
+
+    class Replacement( Module ):
+        ''' Replacement module class. '''
+
+    test_module = ModuleType( f"{PACKAGE_NAME}.test_finalize_lazy_other" )
+    test_module.__package__ = PACKAGE_NAME
+    test_module.__doc__ = 'Test module.'
+    module.finalize_module(
+        test_module,
+        docstrings = module.DocstringsModes.Lazy,
+        replacement_class = Replacement )
+    assert isinstance( test_module, Replacement )
+    assert isinstance( vars( test_module )[ '__doc__' ], str )
+    assert 'Test module.' == test_module.__doc__
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_613_finalize_module_indexes_submodules( module_qname, class_name ):
+    ''' finalize_module discovers submodules from sys.modules. '''
+    module = cache_import_module( module_qname )
+    Module = getattr( module, class_name )
+    import sys
+    from types import ModuleType
+    root = ModuleType( f"{PACKAGE_NAME}.test_finalize_index" )
+    root.__package__ = PACKAGE_NAME
+    sub = ModuleType( f"{root.__name__}.sub" )
+    subsub = ModuleType( f"{sub.__name__}.sub" )
+    other = ModuleType( f"{root.__name__}_other" )
+    submodules = ( sub, subsub, other )
+    for submodule in submodules: sys.modules[ submodule.__name__ ] = submodule
+    timings: dict[ str, float ] = { }
+    try:
+        module.finalize_module(
+            root,
+            docstrings = module.DocstringsModes.Skip,
+            recursive = True,
+            timings = timings )
+    finally:
+        for submodule in submodules: del sys.modules[ submodule.__name__ ]
+    assert isinstance( root, Module )
+    assert isinstance( sub, Module )
+    assert isinstance( subsub, Module )
+    assert not isinstance( other, Module )
+    assert [ subsub.__name__, sub.__name__, root.__name__ ] == list( timings )
+    assert all( timing >= 0 for timing in timings.values( ) )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        subsub.new_attr = 42
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_614_finalize_module_skips_finalized_submodules(
+    module_qname, class_name
+):
+    ''' finalize_module does not refinalize finalized submodules. '''
+    module = cache_import_module( module_qname )
+    Module = getattr( module, class_name )
+    import sys
+    from types import ModuleType
+    root = ModuleType( f"{PACKAGE_NAME}.test_finalize_incremental" )
+    root.__package__ = PACKAGE_NAME
+    sub = ModuleType( f"{root.__name__}.sub" )
+    sub.__doc__ = 'Finalized submodule.'
+    module.finalize_module( sub )
+    docstring = sub.__doc__
+    sys.modules[ sub.__name__ ] = sub
+    timings: dict[ str, float ] = { }
+    try:
+        module.finalize_module( root, recursive = True, timings = timings )
+    finally: del sys.modules[ sub.__name__ ]
+    assert isinstance( root, Module )
+    assert isinstance( sub, Module )
+    assert [ root.__name__ ] == list( timings )
+    assert docstring is sub.__doc__
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_615_finalize_module_skips_private_introspection(
+    module_qname, class_name
+):
+    ''' finalize_module reclassifies private submodules without docs. '''
+    module = cache_import_module( module_qname )
+    Module = getattr( module, class_name )
+    import sys
+    from types import ModuleType
+    from typing import Annotated
+    root = ModuleType( f"{PACKAGE_NAME}.test_finalize_private" )
+    root.__package__ = PACKAGE_NAME
+    public = ModuleType( f"{root.__name__}.public" )
+    private = ModuleType( f"{root.__name__}.__" )
+    internal = ModuleType( f"{private.__name__}.internal" )
+    submodules = ( public, private, internal )
+    for submodule in submodules:
+
+        def scale( factor: Annotated[ int, base.ddoc.Doc( 'Factor.' ) ] ):
+            ''' Scales. '''
+
+        scale.__module__ = submodule.__name__
+        submodule.scale = scale
+        sys.modules[ submodule.__name__ ] = submodule
+    try:
+        module.finalize_module(
+            root,
+            docstrings = module.DocstringsModes.Eager,
+            recursive = True )
+    finally:
+        for submodule in submodules: del sys.modules[ submodule.__name__ ]
+    assert all( isinstance( submodule, Module ) for submodule in submodules )
+    assert 'Factor.' in public.scale.__doc__
+    assert 'Factor.' not in private.scale.__doc__
+    assert 'Factor.' not in internal.scale.__doc__
+
+
+def test_620_docstring_deferral_on_class( ):
+    ''' Docstring deferral renders class introspection once. '''
+    configuration = base.produce_class_dynadoc_configuration(
+        base.DocstringsModes.Eager )
+
+    class Example:
+        value: int = 42
+
+    deferral = base.DocstringDeferral( 'Example class.', configuration )
+    Example.__doc__ = deferral
+    docstring = Example.__doc__
+    assert docstring.startswith( 'Example class.' )
+    assert 'value' in docstring
+    assert docstring is Example( ).__doc__
+    assert docstring is deferral.rendition
+
+
+def test_621_class_docstrings_deferral( ):
+    ''' Metaclass defers class docstrings rendering in lazy mode. '''
+    configuration = base.produce_class_dynadoc_configuration(
+        base.DocstringsModes.Lazy )
+
+    @base.ccstd.class_factory(
+        attributes_namer = base.calculate_attrname,
+        dynadoc_configuration = configuration )
+    class Metaclass( type ): pass
+
+    assert Metaclass is base.defer_class_docstrings( Metaclass )
+    base.defer_class_docstrings(
+        Metaclass, mode = base.DocstringsModes.Lazy )
+
+    class Example( metaclass = Metaclass ):
+        ''' Example class. '''
+
+        value: int = 42
+
+        def compute( self, count: int ) -> int:
+            ''' Computes value. '''
+            return count
+
+    assert isinstance( vars( Example )[ '__doc__' ], base.DocstringDeferral )
+    assert 'count' in Example.compute.__doc__
+    assert Example.__doc__.startswith( 'Example class.' )
+    assert 'value' in Example.__doc__
+    with pytest.raises( AttributeError ):
+        Example.value = 24
+
+
+def test_622_docstrings_mode_discovery( monkeypatch ):
+    ''' Docstrings mode is discovered from environment. '''
+    name = base.docstrings_mode_variable
+    monkeypatch.setenv( name, 'Lazy' )
+    assert base.DocstringsModes.Lazy is base.discover_docstrings_mode( )
+    monkeypatch.setenv( name, 'skip' )
+    assert base.DocstringsModes.Skip is base.discover_docstrings_mode( )
+    monkeypatch.setenv( name, 'bogus' )
+    assert base.DocstringsModes.Eager is base.discover_docstrings_mode( )
+    monkeypatch.delenv( name )
+    assert base.DocstringsModes.Eager is base.discover_docstrings_mode( )
+
+
+def test_623_class_dynadoc_configuration( ):
+    ''' Only eager mode introspects classes during creation. '''
+    eager = base.produce_class_dynadoc_configuration(
+        base.DocstringsModes.Eager )
+    assert eager[ 'introspection' ].enable
+    for mode in ( base.DocstringsModes.Lazy, base.DocstringsModes.Skip ):
+        configuration = base.produce_class_dynadoc_configuration( mode )
+        assert not configuration[ 'introspection' ].enable
+
+
+def test_624_lazy_docstrings_match_eager( ):
+    ''' Docstrings rendered upon access match those rendered eagerly. '''
+    import json
+    import os
+    import subprocess
+    import sys
+    probe = (
+        f"import json, {PACKAGE_NAME}.__ as base; "
+        f"print( json.dumps( base.survey_docstrings( {PACKAGE_NAME!r} ) ) )" )
+    surveys = [ ]
+    for mode in ( 'eager', 'lazy' ):
+        environment = dict(
+            os.environ, **{ base.docstrings_mode_variable: mode } )
+        result = subprocess.run( # noqa: S603
+            ( sys.executable, '-c', probe ), capture_output = True,
+            check = True, env = environment, text = True )
+        surveys.append( json.loads( result.stdout ) )
+    assert surveys[ 0 ] == surveys[ 1 ]
+
+
+def test_630_docstrings_survey( ):
+    ''' Survey collects docstrings of package objects by qualified name. '''
+    docstrings = base.survey_docstrings( PACKAGE_NAME )
+    package = cache_import_module( PACKAGE_NAME )
+    dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    assert package.__doc__ == docstrings[ PACKAGE_NAME ]
+    qname = f"{PACKAGE_NAME}.dictionaries.Dictionary"
+    assert dictionaries.Dictionary.__doc__ == docstrings[ qname ]
+    assert (
+        dictionaries.Dictionary.copy.__doc__ == docstrings[ f"{qname}.copy" ] )
+    qname = f"{PACKAGE_NAME}.modules.finalize_module"
+    assert package.finalize_module.__doc__ == docstrings[ qname ]
+    assert f"{PACKAGE_NAME}.finalize_module" not in docstrings
+
+
+def test_631_docstrings_cache_source( ):
+    ''' Generated module source reproduces survey and fingerprint. '''
+    source = base.produce_docstrings_cache_source( PACKAGE_NAME )
+    namespace = { }
+    exec( source, namespace ) # noqa: S102
+    assert base.calculate_docstrings_fingerprint( ) == (
+        namespace[ 'fingerprint' ] )
+    assert base.survey_docstrings( PACKAGE_NAME ) == (
+        namespace[ 'docstrings' ] )
+
+
+def test_633_docstrings_fingerprint_sources( tmp_path ):
+    ''' Fingerprint varies with sources, except precomputed docstrings. '''
+    import shutil
+    from pathlib import Path
+    location = tmp_path / PACKAGE_NAME
+    shutil.copytree(
+        Path( base.__file__ ).parent.parent, location,
+        ignore = shutil.ignore_patterns( '__pycache__' ) )
+    digest = base.calculate_sources_digest( str( location ) )
+    assert f"sources-{base.calculate_sources_digest( )}" in (
+        base.calculate_docstrings_fingerprint( ) )
+    assert digest == base.calculate_sources_digest( )
+    cache = location / '__' / f"{base.docstrings_cache_name}.py"
+    cache.write_text( "fingerprint = ''\n", encoding = 'utf-8' )
+    assert digest == base.calculate_sources_digest( str( location ) )
+    module = location / 'namespaces.py'
+    module.write_text(
+        module.read_text( encoding = 'utf-8' ) + '\n', encoding = 'utf-8' )
+    assert digest != base.calculate_sources_digest( str( location ) )
+
+
+def test_632_class_docstrings_restoration( ):
+    ''' Metaclass restores precomputed docstrings without introspection. '''
+    qname = f"{__name__}.test_632_class_docstrings_restoration.<locals>"
+    docstrings = {
+        f"{qname}.Example": 'Precomputed class.',
+        f"{qname}.Example.compute": 'Precomputed method.',
+        f"{qname}.Example.value": 'Precomputed property.',
+    }
+    configuration = base.produce_class_dynadoc_configuration(
+        base.DocstringsModes.Eager )
+
+    @base.ccstd.class_factory(
+        attributes_namer = base.calculate_attrname,
+        dynadoc_configuration = configuration )
+    class Metaclass( type ): pass
+
+    assert Metaclass is base.restore_class_docstrings( Metaclass, { } )
+    base.restore_class_docstrings( Metaclass, docstrings )
+
+    class Example( metaclass = Metaclass ):
+        ''' Example class. '''
+
+        attribute: int = 42
+
+        def compute( self, factor: int ) -> int:
+            ''' Computes something. '''
+            return factor
+
+        @property
+        def value( self ) -> int: return 42
+
+    class Other( metaclass = Metaclass ):
+        ''' Other class. '''
+
+        attribute: int = 42
+
+    assert 'Precomputed class.' == Example.__doc__
+    assert 'Precomputed method.' == Example.compute.__doc__
+    assert 'Precomputed property.' == vars( Example )[ 'value' ].__doc__
+    assert Other.__doc__.startswith( 'Other class.' )
+    assert 'attribute' in Other.__doc__
+
+
+def test_633_module_docstrings_restoration( ):
+    ''' Precomputed docstrings are restored onto module and members. '''
+    from types import ModuleType
+    mname = f"{PACKAGE_NAME}.test_restoration"
+    test_module = ModuleType( mname )
+
+    def compute( ): pass
+
+    class Example:
+        def method( self ): pass
+
+    for objct in ( compute, Example ):
+        objct.__module__ = mname
+        objct.__qualname__ = objct.__name__
+    test_module.compute = compute
+    test_module.Example = Example
+    docstrings = {
+        mname: 'Precomputed module.',
+        f"{mname}.compute": 'Precomputed function.',
+        f"{mname}.Example": 'Precomputed class.',
+        f"{mname}.Example.method": 'Precomputed method.',
+    }
+    assert not base.restore_module_docstrings( test_module, { } )
+    assert base.restore_module_docstrings( test_module, docstrings )
+    assert 'Precomputed module.' == test_module.__doc__
+    assert 'Precomputed function.' == compute.__doc__
+    assert 'Precomputed class.' == Example.__doc__
+    assert 'Precomputed method.' == Example.method.__doc__
+
+
+def test_640_module_attributes_survey_cache( ):
+    ''' Module attributes surveys are cached by namespace shape. '''
+    from types import ModuleType
+    module = cache_import_module( f"{PACKAGE_NAME}.modules" )
+    classes = cache_import_module( f"{PACKAGE_NAME}.classes" )
+    test_module = ModuleType( f"{PACKAGE_NAME}.test_survey_cache" )
+    test_module.__package__ = PACKAGE_NAME
+    test_module.value = 1
+    test_module._hidden = 2
+    module.finalize_module( test_module )
+    survey = classes.survey_visibles_caches( module.Module )
+    names = dir( test_module )
+    assert 'value' in names
+    assert '_hidden' not in names
+    assert names == dir( test_module )
+    survey_ = classes.survey_visibles_caches( module.Module )
+    assert survey_.hits >= survey.hits + 1
+    assert survey_.misses >= survey.misses + 1
+    vars( test_module )[ 'extra' ] = 3
+    assert 'extra' in dir( test_module )
+    vars( test_module )[ '__dir__' ] = lambda: [ 'value', '_hidden' ]
+    assert [ 'value' ] == dir( test_module )
+
+
 @pytest.mark.parametrize(
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
@@ -377,6 +377,160 @@ def test_205_validator_dictionary_complex_validation(
     assert d4 == { 'zz': 2 }
 
 
+def test_206_validator_dictionary_schema( ):
+    ''' Validator dictionary validates entries against schema. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    schema = module.DictionarySchema(
+        keys_types = str, values_types = int,
+        values_minimum = 0, values_maximum = 10 )
+    dct = module.ValidatorDictionary( schema, a = 0, b = 10 )
+    assert { 'a': 0, 'b': 10 } == dct
+    for entries in (
+        { 'a': 11 }, { 'a': -1 }, { 'a': 'x' }, { 1: 1 }, { 'a': 1.5 }
+    ):
+        with pytest.raises( exceptions.EntryInvalidity ):
+            module.ValidatorDictionary( schema, entries )
+    assert dct.with_data( c = 5 ) == { 'c': 5 }
+    with pytest.raises( exceptions.EntryInvalidity, match = "'d'" ):
+        dct.with_data( ( ( 'c', 5 ), ( 'd', 50 ), ( 'e', 50 ) ) )
+
+
+def test_207_dictionary_schema_criteria( ):
+    ''' Dictionary schema combines criteria and predicate. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    schema = module.DictionarySchema(
+        keys_allowed = [ 'mode', 'level', 'tags' ],
+        values_allowed = ( 'on', 'off', 1, 2 ),
+        entries_types = { 'level': int },
+        predicate = lambda k, v: k != 'tags' )
+    assert isinstance( schema.keys_allowed, frozenset )
+    assert schema( 'mode', 'on' )
+    assert schema( 'level', 2 )
+    assert not schema( 'level', 'on' )
+    assert not schema( 'mode', 'auto' )
+    assert not schema( 'other', 'on' )
+    assert not schema( 'mode', [ 'on' ] )
+    assert not schema( 'tags', 'on' )
+    assert schema.verifier is schema.verifier
+    assert [ 1, 3 ] == list( schema.locator(
+        [ ( 'mode', 'on' ), ( 'level', 'on' ), ( 'level', 1 ),
+          ( 'tags', 1 ) ] ) )
+    assert module.DictionarySchema( )( object( ), object( ) )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        schema.predicate = None
+
+
+def test_208_validator_dictionary_invalids_aggregation( ):
+    ''' Validator dictionary reports every invalid entry at once. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    schema = module.DictionarySchema( values_types = int )
+    entries = [ ( f"k{i}", i if i % 2 else str( i ) ) for i in range( 14 ) ]
+    with pytest.raises( exceptions.EntriesInvalidity ) as info:
+        module.ValidatorDictionary.from_entries( schema, entries )
+    assert entries[ 0 : : 2 ] == list( info.value.entries )
+    assert 'Could not add 7 invalid entries' in str( info.value )
+    assert 'and 2 more' in str( info.value )
+    with pytest.raises( exceptions.EntryInvalidity, match = "'k0'" ):
+        module.ValidatorDictionary.from_entries(
+            schema, entries,
+            treatment = module.InvalidEntriesTreatments.Error )
+    dct = module.ValidatorDictionary.from_entries( schema, { 'a': 1 } )
+    assert isinstance( dct, module.ValidatorDictionary )
+    assert { 'a': 1 } == dct
+
+
+def test_209_validator_dictionary_invalids_exclusion( ):
+    ''' Validator dictionary constructs from valid entries only. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    invalids: list[ tuple[ str, object ] ] = [ ]
+    dct = module.ValidatorDictionary.from_entries(
+        lambda k, v: isinstance( v, int ),
+        ( ( 'a', 1 ), ( 'b', 'x' ) ), { 'c': 3, 'd': None },
+        treatment = module.InvalidEntriesTreatments.Exclude,
+        invalids = invalids )
+    assert { 'a': 1, 'c': 3 } == dct
+    assert [ ( 'b', 'x' ), ( 'd', None ) ] == invalids
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct[ 'b' ] = 2
+    with pytest.raises( exceptions.EntryInvalidity ):
+        dct.with_data( b = 'x' )
+    # Duplicate keys are reported as by initialization.
+    internals = cache_import_module( f"{PACKAGE_NAME}.__.exceptions" )
+    with pytest.raises( internals.EntryImmutability, match = "'a'" ):
+        module.ValidatorDictionary.from_entries(
+            lambda k, v: isinstance( v, int ),
+            ( ( 'a', 1 ), ( 'a', 2 ) ),
+            treatment = module.InvalidEntriesTreatments.Exclude )
+
+
+def test_210_dictionary_from_trusted( ):
+    ''' Dictionaries are produced from trusted entries. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    dct = module.Dictionary._from_trusted_(
+        { 'a': 1 }, [ ( 'a', 2 ) ], b = 3 )
+    assert module.Dictionary( a = 2, b = 3 ) == dct
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct[ 'c' ] = 4
+    vdct = module.ValidatorDictionary._from_trusted_(
+        lambda k, v: isinstance( v, int ), a = 1 )
+    assert { 'a': 1 } == vdct
+    with pytest.raises( exceptions.EntryInvalidity ):
+        vdct.with_data( a = 'x' )
+
+
+def test_211_deep_merge( ):
+    ''' Layers of nested dictionaries are merged, reusing subtrees. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    D = module.Dictionary
+    base = D( db = D( host = 'x', port = 1 ), tags = ( 1, ), log = D( v = 0 ) )
+    site = D( db = D( port = 2 ), tags = ( 2, ) )
+    merged = module.deep_merge( base, site )
+    assert { 'host': 'x', 'port': 2 } == merged[ 'db' ]
+    assert ( 2, ) == merged[ 'tags' ]
+    assert base[ 'log' ] is merged[ 'log' ]
+    assert isinstance( merged[ 'db' ], D )
+    with pytest.raises( exceptions.EntryImmutability ):
+        merged[ 'db' ][ 'port' ] = 3
+    policies = module.MergeConflictsPolicies
+    combined = module.deep_merge( base, site, policy = policies.Combine )
+    assert ( 1, 2 ) == combined[ 'tags' ]
+    with pytest.raises( exceptions.EntryMergeFailure, match = "'port'" ):
+        module.deep_merge( base, site, policy = policies.Error )
+    same = D( db = D( port = 1 ) )
+    assert base[ 'db' ] is module.deep_merge(
+        base, same, policy = policies.Error )[ 'db' ]
+    assert { 'a': D( b = 1 ) } == module.deep_merge(
+        { 'a': 1 }, { 'a': D( b = 1 ) } )
+    assert D( ) == module.deep_merge( )
+
+
+def test_212_deep_merge_depth_and_memo( ):
+    ''' Deep trees are merged iteratively; memo reuses merged subtrees. '''
+    module = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    D = module.Dictionary
+    lower, upper = D( v = 1 ), D( v = 2, w = 3 )
+    for _ in range( 5000 ):
+        lower, upper = D( k = lower ), D( k = upper )
+    merged = module.deep_merge( lower, upper )
+    for _ in range( 5000 ): merged = merged[ 'k' ]
+    assert { 'v': 2, 'w': 3 } == merged
+    memo = { }
+    base = D( a = D( x = 1 ), b = D( y = 1 ) )
+    site = D( a = D( x = 2 ), b = D( y = 2 ) )
+    merged = module.deep_merge( base, site, memo = memo )
+    assert merged is module.deep_merge( base, site, memo = memo )
+    site_ = site.with_data( a = D( x = 3 ), b = site[ 'b' ] )
+    remerged = module.deep_merge( base, site_, memo = memo )
+    assert 3 == remerged[ 'a' ][ 'x' ]
+    assert merged[ 'b' ] is remerged[ 'b' ]
+    vdct = module.ValidatorDictionary(
+        lambda k, v: k != 'z', a = D( x = 1 ) )
+    assert isinstance(
+        module.deep_merge( vdct, { 'b': 2 } ), module.ValidatorDictionary )
+    with pytest.raises( exceptions.EntryInvalidity ):
+        module.deep_merge( vdct, { 'z': 2 } )
+
+
 @pytest.mark.parametrize(
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
@@ -513,6 +667,30 @@ def test_260_subclasses_abc_dictionary( module_qname, class_name ):
     assert issubclass( factory, AbstractDictionary )
 
 
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_270_as_namespace( module_qname, class_name ):
+    ''' Dictionary provides namespace which shares its entries. '''
+    namespaces = cache_import_module( f"{PACKAGE_NAME}.namespaces" )
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    posargs, _ = select_arguments( class_name )
+    dct = factory( *posargs, foo = 1, bar = 2 )
+    ns = dct.as_namespace( )
+    assert isinstance( ns, namespaces.Namespace )
+    assert namespaces.Namespace( foo = 1, bar = 2 ) == ns
+    assert 'frigid.namespaces.Namespace( foo = 1, bar = 2 )' == repr( ns )
+    assert ns.__dict__ is dct._data_
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns.foo = 3
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns.baz = 3
+    assert 1 == dct[ 'foo' ]
+    assert dct == ns.as_dictionary( )
+
+
 @pytest.mark.parametrize(
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
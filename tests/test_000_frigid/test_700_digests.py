@@ -0,0 +1,146 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of content digests. '''
+
+
+import dataclasses
+import enum
+import pickle
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.digests"
+
+classes = cache_import_module( f"{PACKAGE_NAME}.classes" )
+dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+namespaces = cache_import_module( f"{PACKAGE_NAME}.namespaces" )
+
+
+class Color( enum.Enum ):
+    Red = 'red'
+
+
+class Point( classes.DataclassObject ):
+    x: int
+    y: int = 0
+    label: str = dataclasses.field( default = '', compare = False )
+
+
+class PointSpatial( Point ):
+    z: int = 0
+
+
+class PointMutable( classes.DataclassObjectMutable ):
+    x: int
+
+
+@dataclasses.dataclass( frozen = True )
+class PointFrozen:
+    x: int
+
+
+class NamespaceMemoizing( namespaces.Namespace ):
+    __slots__ = ( )
+    _digests_memoized_ = True
+
+
+def test_100_digest_scalars( ):
+    ''' Scalars are digested by type and value. '''
+    module = cache_import_module( MODULE_QNAME )
+    values = (
+        None, True, False, 0, 1, -1, 2 ** 100, 1.0, 1j, '', '1', b'1',
+        Color.Red )
+    digests = [ module.digest( value ) for value in values ]
+    assert len( set( digests ) ) == len( values )
+    assert all( 32 == len( digest ) for digest in digests )
+    assert module.digest( 'x' ) == module.digest( 'x' )
+
+
+def test_110_digest_containers( ):
+    ''' Containers are digested by contents, regardless of entry order. '''
+    module = cache_import_module( MODULE_QNAME )
+    Dictionary = dictionaries.Dictionary
+    Namespace = namespaces.Namespace
+    tree = Dictionary(
+        a = ( 1, Dictionary( b = 'x' ) ),
+        c = Namespace( d = frozenset( { 1, 2 } ) ) )
+    tree_ = Dictionary(
+        c = Namespace( d = frozenset( { 2, 1 } ) ),
+        a = ( 1, Dictionary( b = 'x' ) ) )
+    assert module.digest( tree ) == module.digest( tree_ )
+    assert module.digest( tree ) != module.digest( tree.with_data( a = 1 ) )
+    assert module.digest( ( 1, 2 ) ) != module.digest( ( 2, 1 ) )
+    assert module.digest( ( 1, ( 2, ) ) ) != module.digest( ( 1, 2 ) )
+    assert module.digest( Dictionary( a = 1 ) ) != module.digest(
+        Namespace( a = 1 ) )
+    assert module.digest( Point( x = 1, label = 'a' ) ) == module.digest(
+        Point( x = 1, label = 'b' ) )
+    assert module.digest( Point( x = 1 ) ) != module.digest( Point( x = 2 ) )
+    assert module.digest( PointFrozen( x = 1 ) ) != module.digest(
+        Point( x = 1 ) )
+
+
+def test_120_digest_memoization( ):
+    ''' Digests are memoized on dictionaries, namespaces, and dataclasses. '''
+    module = cache_import_module( MODULE_QNAME )
+    base = cache_import_module( f"{PACKAGE_NAME}.__" )
+    Dictionary = dictionaries.Dictionary
+    Namespace = NamespaceMemoizing
+    nodes = (
+        Dictionary( a = 1 ), Namespace( a = 1 ), Namespace( **{ 'a b': 1 } ),
+        Point( x = 1 ), PointSpatial( x = 1, z = 2 ) )
+    for node in nodes:
+        digest = module.digest( node )
+        assert digest == getattr( node, base.digest_name )
+        assert digest == module.digest( node )
+        restored = pickle.loads( pickle.dumps( node ) ) # noqa: S301
+        assert restored == node
+        assert digest == module.digest( restored )
+    assert base.digest_name not in Namespace( a = 1 ).__dict__
+    plain = namespaces.Namespace( a = 1 )
+    assert module.digest( plain ) == module.digest( Namespace( a = 1 ) )
+    assert not hasattr( plain, base.digest_name )
+    deep = Dictionary( v = 1 )
+    for _ in range( 5000 ): deep = Dictionary( k = deep )
+    assert 32 == len( module.digest( deep ) )
+
+
+def test_130_digest_rejects_mutables( ):
+    ''' Mutable and unsupported values cannot be digested. '''
+    module = cache_import_module( MODULE_QNAME )
+    for value in (
+        [ 1 ], { 1 }, { 'a': 1 }, PointMutable( x = 1 ),
+        dictionaries.Dictionary( a = [ 1 ] ), object( ),
+    ):
+        with pytest.raises( exceptions.ValueDigestFailure ):
+            module.digest( value )
+
+
+def test_900_docstring_sanity( ):
+    ''' Function has valid docstring. '''
+    module = cache_import_module( MODULE_QNAME )
+    assert hasattr( module.digest, '__doc__' )
+    assert isinstance( module.digest.__doc__, str )
+    assert module.digest.__doc__